@@ -2,19 +2,25 @@
 Main application entry point for Delinquency Prediction system.
 Routes between EDA and Model Planning views.
 """
+import functools
+import sqlite3
+
 import pandas as pd
 import streamlit as st
 from pathlib import Path
 
-from views import EDA, ModelPlan
+from resolvers import excel, incremental, partitions, result_store, sql_source
+from views import EDA, ModelPlan, Compare
 
 
 @st.cache_data
-def load_data(src) -> pd.DataFrame:
+def load_data(src, sheets: tuple = None) -> pd.DataFrame:
     """Load data from a file path or uploaded file.
 
-    Supports Excel (xlsx/xls/xlsm) and CSV. Raises a ValueError with a
-    helpful message if loading fails so the caller can surface it in the UI.
+    Supports Excel (xlsx/xls/xlsm) and CSV. Excel files go through the
+    streaming reader; `sheets` selects the worksheets to combine (default:
+    first sheet). Raises a ValueError with a helpful message if loading
+    fails so the caller can surface it in the UI.
     """
     try:
         # src can be a Path/str or a file-like object from st.file_uploader
@@ -25,8 +31,8 @@ def load_data(src) -> pd.DataFrame:
 
         name_lower = name.lower()
 
-        if name_lower.endswith((".xlsx", ".xls", ".xlsm")):
-            df = pd.read_excel(src)
+        if name_lower.endswith(excel.EXCEL_EXTENSIONS):
+            df = excel.read_excel(src, list(sheets) if sheets else None)
         elif name_lower.endswith(".csv"):
             df = pd.read_csv(src)
         else:
@@ -43,6 +49,50 @@ def load_data(src) -> pd.DataFrame:
     return df
 
 
+@st.cache_data
+def list_workbook_sheets(src) -> list:
+    """Sheet names of an uploaded workbook (empty for CSV files)."""
+    if not src.name.lower().endswith(excel.EXCEL_EXTENSIONS):
+        return []
+    try:
+        return excel.list_sheets(src)
+    except Exception:  # noqa: BLE001 - load_data reports unreadable files
+        return []
+
+
+def upload_fingerprint(src, sheets: tuple = None) -> str:
+    """Fingerprint of an uploaded file, including the selected sheets."""
+    fingerprint = result_store.fingerprint_bytes(src.getvalue())
+    if sheets:
+        fingerprint = result_store.fingerprint_bytes(f"{fingerprint}:{list(sheets)}".encode())
+    return fingerprint
+
+
+@st.cache_data(show_spinner="Querying database...")
+def load_sql_data(database: str, table: str, sample_size: int, fingerprint: str) -> tuple:
+    """Push EDA aggregates down to the database and pull back a sample (cached per table fingerprint)."""
+    return sql_source.load_sql_source(database, table, sample_size=sample_size)
+
+
+@st.cache_data(show_spinner="Querying database...")
+def push_down_sql_target(database: str, table: str, fingerprint: str, target_col: str) -> None:
+    """Push full-table aggregates for a user-selected target down to the database (cached per target)."""
+    sql_source.push_down_target(sql_source.get_pool(database), table, target_col, fingerprint)
+
+
+@st.cache_data(show_spinner="Scanning partitions...")
+def load_partitioned_data(root: str, filters: tuple, fingerprint: str) -> tuple:
+    """Scan the selected partitions of a dataset directory (cached per file selection fingerprint)."""
+    return partitions.load_partitioned_dataset(root, dict(filters))
+
+
+@st.cache_data(show_spinner="Applying monthly delta...")
+def apply_monthly_delta(_df: pd.DataFrame, fingerprint: str, _delta: pd.DataFrame,
+                        delta_fingerprint: str) -> tuple:
+    """Apply a delta file incrementally (cached on the dataset and delta fingerprints)."""
+    return incremental.incremental_refresh(_df, fingerprint, _delta, delta_fingerprint)
+
+
 def main() -> None:
     """Main application entry point."""
     st.set_page_config(page_title="Delinquency Prediction", layout="wide")
@@ -51,41 +101,175 @@ def main() -> None:
     st.sidebar.title("📊 Navigation")
     page = st.sidebar.radio(
         "Select a view:",
-        ["Exploratory Data Analysis", "Model Planning"],
-        help="Choose between EDA or Model Planning"
+        ["Exploratory Data Analysis", "Dataset Comparison", "Model Planning"],
+        help="Choose between EDA, dataset comparison or Model Planning"
     )
 
     st.sidebar.divider()
     
     # Data upload section
     st.sidebar.header("📂 Data Upload")
-    uploaded_file = st.sidebar.file_uploader(
-        "Upload dataset (Excel or CSV)",
-        type=["xlsx", "xls", "xlsm", "csv"],
-        help="Upload a file to analyze",
-    )
+    source = st.sidebar.radio("Data source", ["File upload", "SQL database", "Partitioned directory"])
+
+    uploaded_file = sql_table = partition_files = None
+    delta_files = []
+    sheets = None
+    if source == "File upload":
+        uploaded_file = st.sidebar.file_uploader(
+            "Upload dataset (Excel or CSV)",
+            type=["xlsx", "xls", "xlsm", "csv"],
+            help="Upload a file to analyze",
+        )
+        if uploaded_file is not None:
+            sheet_names = list_workbook_sheets(uploaded_file)
+            if len(sheet_names) > 1:
+                selected = st.sidebar.multiselect(
+                    "Sheets",
+                    sheet_names,
+                    default=sheet_names[:1],
+                    help=f"Selected sheets are combined into one dataset with a {excel.SHEET_COL} column",
+                )
+                sheets = tuple(selected) or None
+
+        delta_files = st.sidebar.file_uploader(
+            "Monthly deltas (optional)",
+            type=["xlsx", "xls", "xlsm", "csv"],
+            accept_multiple_files=True,
+            help=(
+                "New and updated customers matched on Customer_ID, applied in upload order. "
+                f"Rows with {incremental.DELTA_ACTION_COL} = delete are removed."
+            ),
+        )
+    elif source == "Partitioned directory":
+        partition_root = st.sidebar.text_input(
+            "Dataset directory", help="Hive-style layout, e.g. month=2024-01/Location=Chicago/part-0.csv"
+        )
+        if partition_root:
+            try:
+                partition_files = partitions.discover_partitions(partition_root)
+            except ValueError as exc:
+                st.sidebar.error(str(exc))
+            else:
+                partition_filters = {}
+                for key, values in partitions.get_partition_values(partition_files).items():
+                    partition_filters[key] = st.sidebar.multiselect(
+                        key, values, key=f"partition_filter_{key}", help="Leave empty to include all"
+                    )
+    else:
+        database = st.sidebar.text_input("SQLite database path", help="Aggregates run inside the database")
+        if database:
+            try:
+                tables = sql_source.list_tables(sql_source.get_pool(database))
+            except (ValueError, sqlite3.Error) as exc:
+                st.sidebar.error(str(exc))
+                tables = []
+            sql_table = st.sidebar.selectbox("Table", tables) if tables else None
+        sample_size = st.sidebar.number_input(
+            "Sample rows for plots", min_value=1_000, max_value=1_000_000,
+            value=sql_source.DEFAULT_SAMPLE_SIZE, step=1_000,
+        )
 
     # Route to appropriate view
     if page == "Exploratory Data Analysis":
+        if source == "SQL database":
+            if sql_table is None:
+                st.info("👆 Please enter a SQLite database and choose a table in the sidebar")
+                return
+            try:
+                pool = sql_source.get_pool(database)
+                fingerprint = sql_source.fingerprint_table(pool, sql_table)
+                df, fingerprint, summary = load_sql_data(database, sql_table, int(sample_size), fingerprint)
+            except (ValueError, sqlite3.Error) as exc:
+                st.error(str(exc))
+                return
+            st.sidebar.success(
+                f"Summaries computed on all {summary['total_rows']:,} rows; "
+                f"plots use a sample of {summary['sample_rows']:,}"
+            )
+            EDA.render_eda_app(
+                df, fingerprint, summary["total_rows"],
+                push_down_target=functools.partial(push_down_sql_target, database, sql_table, fingerprint),
+            )
+            return
+
+        if source == "Partitioned directory":
+            if partition_files is None:
+                st.info("👆 Please enter a partitioned dataset directory in the sidebar")
+                return
+            selected = partitions.prune_partitions(partition_files, partition_filters)
+            if selected.empty:
+                st.info("No partitions match the selected filters.")
+                return
+            filters = tuple((k, tuple(v)) for k, v in partition_filters.items() if v)
+            try:
+                df, fingerprint, summary = load_partitioned_data(
+                    partition_root, filters, partitions.fingerprint_partitions(selected)
+                )
+            except ValueError as exc:
+                st.error(str(exc))
+                return
+            st.sidebar.success(
+                f"Read {summary['files_read']:,} of {summary['files_total']:,} files "
+                f"({summary['bytes_read'] / 1024 ** 2:.1f} MB)"
+            )
+            EDA.render_eda_app(df, fingerprint)
+            return
+
         if uploaded_file is None:
             st.info("👆 Please upload a dataset using the sidebar to begin the analysis")
             return
 
-        try:
-            df = load_data(uploaded_file)
-        except FileNotFoundError:
-            st.error(
-                "Could not find data file. "
-                "Make sure you are running this app from the project root, or upload "
-                "a dataset using the sidebar."
+        # Fingerprint the raw upload so results persist across restarts; the
+        # file is only parsed when some result is not already stored
+        fingerprint = upload_fingerprint(uploaded_file, sheets)
+        data = functools.partial(load_data, uploaded_file, sheets)
+
+        if delta_files:
+            # Each delta starts from the state stored under the previous combined fingerprint
+            totals = {"inserted": 0, "updated": 0, "deleted": 0}
+            try:
+                data = load_data(uploaded_file, sheets)
+                for delta_file in delta_files:
+                    data, fingerprint, summary = apply_monthly_delta(
+                        data, fingerprint, load_data(delta_file),
+                        result_store.fingerprint_bytes(delta_file.getvalue()),
+                    )
+                    totals = {key: count + summary[key] for key, count in totals.items()}
+            except ValueError as exc:
+                st.error(str(exc))
+                return
+            st.sidebar.success(
+                f"{len(delta_files)} delta(s) applied: {totals['inserted']:,} new, "
+                f"{totals['updated']:,} updated, {totals['deleted']:,} deleted"
             )
+
+        # Render EDA view (load errors are reported by the view)
+        EDA.render_eda_app(data, fingerprint)
+
+    elif page == "Dataset Comparison":
+        compare_files = st.sidebar.file_uploader(
+            "Upload datasets to compare",
+            type=["xlsx", "xls", "xlsm", "csv"],
+            accept_multiple_files=True,
+            help="Upload two or more files (e.g. this month and last month)",
+        )
+        if len(compare_files) < 2:
+            st.info("👆 Please upload at least two datasets using the sidebar to compare them")
             return
-        except ValueError as exc:
-            st.error(str(exc))
-            return
 
-        # Render EDA view
-        EDA.render_eda_app(df)
+        # Same-named files (e.g. from different folders) get their upload position as a suffix
+        names = [file.name for file in compare_files]
+        datasets, fingerprints = {}, {}
+        for position, file in enumerate(compare_files, start=1):
+            label = file.name if names.count(file.name) == 1 else f"{file.name} (#{position})"
+            try:
+                datasets[label] = load_data(file)
+            except ValueError as exc:
+                st.error(str(exc))
+                return
+            fingerprints[label] = result_store.fingerprint_bytes(file.getvalue())
+
+        Compare.render_comparison_app(datasets, fingerprints)
 
     else:  # Model Planning
         # Model Planning doesn't require data upload
@@ -153,3 +153,52 @@ def get_column_types_summary(df: pd.DataFrame) -> pd.DataFrame:
     """Get summary of data types in the dataframe."""
     col_types = df.dtypes.value_counts().rename_axis("Data Type").reset_index(name="Count")
     return col_types
+
+
+def get_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """Zero-row copy of the dataframe: column names and dtypes without the data."""
+    return df.head(0)
+
+
+def get_correlation_matrix(df: pd.DataFrame) -> pd.DataFrame:
+    """Get the full Pearson correlation matrix of numeric columns."""
+    return df[get_numeric_columns(df)].corr()
+
+
+def get_distribution_summary(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Get descriptive statistics for every numeric column.
+    
+    Args:
+        df: Input dataframe
+        
+    Returns:
+        DataFrame with count, mean, std, min, quartiles, max, median and skew per column
+    """
+    num_cols = get_numeric_columns(df)
+    if not num_cols:
+        return pd.DataFrame()
+    
+    summary = df[num_cols].describe().T
+    summary["median"] = df[num_cols].median()
+    summary["skew"] = df[num_cols].skew()
+    return summary
+
+
+def get_class_summary(df: pd.DataFrame, target_col: str) -> dict:
+    """
+    Get descriptive statistics of each numeric column split by target class.
+    
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        
+    Returns:
+        Dictionary mapping column name to a describe() table with one column per class
+    """
+    num_cols = [c for c in get_numeric_columns(df) if c != target_col]
+    if not num_cols:
+        return {}
+    
+    grouped = df.groupby(target_col)[num_cols].describe()
+    return {col: grouped[col].T for col in num_cols}
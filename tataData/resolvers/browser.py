@@ -0,0 +1,161 @@
+"""
+Browser resolver - Handles server-side paging, sorting and filtering of raw data
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+
+DEFAULT_PAGE_SIZE = 50
+MAX_FILTER_CATEGORIES = 200
+
+
+# ===== INDEX FUNCTIONS =====
+
+def to_arrow_table(df: pd.DataFrame) -> pa.Table:
+    """Convert a DataFrame to an Arrow table once, so pages can be taken as zero-copy slices."""
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+
+def build_sort_index(table: pa.Table, col: str, ascending: bool = True) -> np.ndarray:
+    """
+    Compute the row order for sorting by one column (nulls last).
+
+    The index is meant to be computed once per column and reused for every
+    page request.
+
+    Args:
+        table: Arrow table of the dataset
+        col: Column to sort by
+        ascending: Sort direction
+
+    Returns:
+        Array of row positions in sorted order
+    """
+    order = "ascending" if ascending else "descending"
+    indices = pc.sort_indices(table, sort_keys=[(col, order)], null_placement="at_end")
+    return indices.to_numpy()
+
+
+def _as_strings(values) -> pa.Array:
+    """
+    Arrow string array of filter values, formatted by Arrow's cast.
+
+    Options and column values both go through pc.cast, so e.g. booleans read
+    "true" on both sides (Python's str() would give "True").
+    """
+    values = values if isinstance(values, (pa.Array, pa.ChunkedArray)) else pa.array(list(values))
+    return pc.cast(values, pa.string())
+
+
+def get_column_filter_options(table: pa.Table, col: str) -> dict:
+    """
+    Describe how a column can be filtered.
+
+    Returns:
+        {"kind": "range", "min", "max"} for numeric columns,
+        {"kind": "values", "values"} for low-cardinality columns, or
+        {"kind": "text"} otherwise
+    """
+    column = table.column(col)
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type):
+        bounds = pc.min_max(column)
+        return {"kind": "range", "min": bounds["min"].as_py(), "max": bounds["max"].as_py()}
+
+    unique = pc.unique(pc.drop_null(column))
+    if len(unique) <= MAX_FILTER_CATEGORIES:
+        return {"kind": "values", "values": sorted(_as_strings(unique).to_pylist())}
+    return {"kind": "text"}
+
+
+def build_filter_mask(table: pa.Table, filters: dict) -> np.ndarray:
+    """
+    Evaluate column filters into a boolean row mask.
+
+    Args:
+        table: Arrow table of the dataset
+        filters: Mapping of column to a filter spec:
+            ("range", low, high), ("values", [values...]) or ("text", substring)
+
+    Returns:
+        Boolean array (True = row kept), or None if there are no filters
+    """
+    mask = None
+    for col, spec in (filters or {}).items():
+        column = table.column(col)
+        kind = spec[0]
+        if kind == "range":
+            _, low, high = spec
+            cond = pc.and_(pc.greater_equal(column, low), pc.less_equal(column, high))
+        elif kind == "values":
+            cond = pc.is_in(_as_strings(column), value_set=_as_strings(spec[1]))
+        elif kind == "text":
+            cond = pc.match_substring(pc.cast(column, pa.string()), spec[1], ignore_case=True)
+        else:
+            raise ValueError(f"Unknown filter kind '{kind}' for column '{col}'.")
+
+        cond = pc.fill_null(cond, False)
+        mask = cond if mask is None else pc.and_(mask, cond)
+
+    if mask is None:
+        return None
+    return np.asarray(mask.to_numpy(zero_copy_only=False), dtype=bool)
+
+
+def build_row_order(n_rows: int, sort_index: np.ndarray = None, mask: np.ndarray = None) -> np.ndarray:
+    """Combine a precomputed sort index and a filter mask into the visible row order."""
+    order = sort_index if sort_index is not None else np.arange(n_rows)
+    if mask is not None:
+        order = order[mask[order]]
+    return order
+
+
+# ===== PAGE FUNCTIONS =====
+
+def get_page(table: pa.Table, order: np.ndarray = None, page: int = 1,
+             page_size: int = DEFAULT_PAGE_SIZE, columns: list = None) -> dict:
+    """
+    Materialise a single page of rows.
+
+    Only the rows on the requested page are taken from the Arrow table and
+    converted to pandas, so the cost per request is independent of dataset size.
+
+    Args:
+        table: Arrow table of the dataset
+        order: Visible row order from build_row_order() (None = natural order)
+        page: 1-based page number (clamped to the valid range)
+        page_size: Rows per page
+        columns: Optional subset of columns to return
+
+    Returns:
+        Dictionary with the page DataFrame, page number, page count,
+        total visible rows and the 1-based row range shown
+    """
+    total = table.num_rows if order is None else int(order.size)
+    n_pages = max(1, -(-total // page_size))
+    page = min(max(1, int(page)), n_pages)
+    start = (page - 1) * page_size
+    stop = min(start + page_size, total)
+
+    if columns is not None:
+        table = table.select(columns)
+
+    if order is None:
+        rows = table.slice(start, stop - start)
+        positions = np.arange(start, stop)
+    else:
+        positions = order[start:stop]
+        rows = table.take(pa.array(positions, type=pa.int64()))
+
+    page_df = rows.to_pandas()
+    page_df.index = positions
+
+    return {
+        "data": page_df,
+        "page": page,
+        "n_pages": n_pages,
+        "total_rows": total,
+        "first_row": start + 1 if total else 0,
+        "last_row": stop,
+    }
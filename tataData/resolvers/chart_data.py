@@ -0,0 +1,169 @@
+"""
+Chart data resolver - Handles compact chart aggregates (bin counts, KDE grids, box statistics) for browser-rendered charts
+"""
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_GRID_SIZE = 200
+MAX_HISTOGRAM_BINS = 50
+KDE_CUT = 3  # bandwidths beyond the data range, as in seaborn
+WHISKER_IQR = 1.5
+
+
+# ===== DENSITY FUNCTIONS =====
+
+def _finite(values) -> np.ndarray:
+    """Non-null values of a column as float64."""
+    values = np.asarray(values, dtype=np.float64)
+    return values[~np.isnan(values)]
+
+
+def scott_bandwidth(values: np.ndarray) -> float:
+    """Gaussian KDE bandwidth by Scott's rule (the scipy/seaborn default)."""
+    if values.size < 2:
+        return 1.0
+    bandwidth = values.std(ddof=1) * values.size ** (-1 / 5)
+    return float(bandwidth) if bandwidth > 0 else max(abs(float(values[0])) * 0.01, 1e-3)
+
+
+def kde_grid(values, grid_size: int = DEFAULT_GRID_SIZE, bandwidth: float = None,
+             lower: float = None, upper: float = None) -> pd.DataFrame:
+    """
+    Evaluate a Gaussian KDE on an even grid.
+
+    Values are binned onto the grid and convolved with a sampled Gaussian
+    kernel, so the cost is O(n + grid) rather than O(n x grid), and only
+    the grid travels to the browser.
+
+    Args:
+        values: Sample values (NaN ignored)
+        grid_size: Number of grid points
+        bandwidth: Kernel standard deviation (Scott's rule if None)
+        lower, upper: Grid range (defaults to the data range plus KDE_CUT bandwidths)
+
+    Returns:
+        DataFrame with x and density columns
+    """
+    values = _finite(values)
+    if values.size == 0:
+        return pd.DataFrame({"x": [], "density": []})
+
+    bandwidth = bandwidth or scott_bandwidth(values)
+    lower = values.min() - KDE_CUT * bandwidth if lower is None else lower
+    upper = values.max() + KDE_CUT * bandwidth if upper is None else upper
+    grid = np.linspace(lower, upper, grid_size)
+    step = grid[1] - grid[0] if grid_size > 1 else 1.0
+
+    counts, _ = np.histogram(values, bins=grid_size, range=(lower - step / 2, upper + step / 2))
+    reach = int(np.ceil(4 * bandwidth / step))
+    offsets = np.arange(-reach, reach + 1) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+
+    smoothed = np.convolve(counts, kernel, mode="full")[reach:reach + grid_size]
+    density = smoothed / (values.size * bandwidth * np.sqrt(2 * np.pi))
+    return pd.DataFrame({"x": grid, "density": density})
+
+
+# ===== CHART DATA FUNCTIONS =====
+
+def get_histogram_data(df: pd.DataFrame, col: str, max_bins: int = MAX_HISTOGRAM_BINS,
+                       grid_size: int = DEFAULT_GRID_SIZE) -> dict:
+    """
+    Histogram bin counts, a count-scaled KDE curve, mean and median of one column.
+
+    Returns:
+        Dictionary with "bins" (bin_start, bin_end, count), "kde" (x, count), "mean" and "median"
+    """
+    values = _finite(df[col])
+    if values.size == 0:
+        return {"bins": pd.DataFrame(columns=["bin_start", "bin_end", "count"]),
+                "kde": pd.DataFrame(columns=["x", "count"]), "mean": np.nan, "median": np.nan}
+
+    edges = np.histogram_bin_edges(values, bins="auto")
+    if edges.size - 1 > max_bins:
+        edges = np.histogram_bin_edges(values, bins=max_bins)
+    counts, edges = np.histogram(values, bins=edges)
+
+    kde = kde_grid(values, grid_size, lower=edges[0], upper=edges[-1])
+    kde["count"] = kde.pop("density") * values.size * (edges[1] - edges[0])
+
+    return {
+        "bins": pd.DataFrame({"bin_start": edges[:-1], "bin_end": edges[1:], "count": counts}),
+        "kde": kde,
+        "mean": float(values.mean()),
+        "median": float(np.median(values)),
+    }
+
+
+def get_box_data(df: pd.DataFrame, col: str, target_col: str, grid_size: int = DEFAULT_GRID_SIZE) -> dict:
+    """
+    Box-plot statistics and violin density outlines of a column for each target class.
+
+    Whiskers follow Tukey's rule (furthest values within 1.5 x IQR of the
+    quartiles). Densities share one grid and are scaled so the widest
+    violin has half-width 0.4 around its class position.
+
+    Returns:
+        Dictionary with "box" (one row per class) and "violin" (class, position, y, left, right)
+    """
+    data = df[[target_col, col]].dropna()
+    classes = sorted(data[target_col].unique())
+    if not classes:
+        return {"box": pd.DataFrame(), "violin": pd.DataFrame()}
+
+    values_all = data[col].to_numpy(dtype=np.float64)
+    bandwidth = scott_bandwidth(values_all)
+    lower = values_all.min() - KDE_CUT * bandwidth
+    upper = values_all.max() + KDE_CUT * bandwidth
+
+    box_rows, violins = [], []
+    for position, cls in enumerate(classes):
+        values = data.loc[data[target_col] == cls, col].to_numpy(dtype=np.float64)
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        iqr = q3 - q1
+        inside = values[(values >= q1 - WHISKER_IQR * iqr) & (values <= q3 + WHISKER_IQR * iqr)]
+        box_rows.append({
+            "class": str(cls), "position": position, "n": values.size, "mean": values.mean(),
+            "q1": q1, "median": median, "q3": q3,
+            "whisker_low": inside.min(), "whisker_high": inside.max(),
+        })
+
+        density = kde_grid(values, grid_size, lower=lower, upper=upper)
+        density["class"] = str(cls)
+        density["position"] = position
+        violins.append(density)
+
+    violin = pd.concat(violins, ignore_index=True)
+    half_width = violin["density"] / max(violin["density"].max(), 1e-300) * 0.4
+    violin = violin.rename(columns={"x": "y"}).assign(left=violin["position"] - half_width,
+                                                       right=violin["position"] + half_width)
+    return {"box": pd.DataFrame(box_rows), "violin": violin}
+
+
+def get_missing_chart_data(missing: pd.DataFrame) -> pd.DataFrame:
+    """Missing data summary (analyzer.analyze_missing_data()) as chart rows."""
+    data = missing.rename_axis("Column").reset_index()
+    return data[["Column", "Missing Count", "Missing %"]]
+
+
+def get_target_chart_data(target_counts: pd.Series) -> pd.DataFrame:
+    """Target counts as chart rows with labels and percentages."""
+    total = target_counts.sum()
+    return pd.DataFrame({
+        "Class": target_counts.index.astype(str),
+        "Count": target_counts.to_numpy(),
+        "Percentage": target_counts.to_numpy() / total * 100 if total else 0.0,
+    })
+
+
+def get_correlation_bar_data(corr: pd.Series) -> pd.DataFrame:
+    """Correlations with the target as chart rows, keeping their sort order."""
+    return pd.DataFrame({"Feature": corr.index.astype(str), "Correlation": corr.to_numpy(),
+                         "Order": np.arange(len(corr))})
+
+
+def get_matrix_long(matrix: pd.DataFrame, value_name: str = "Correlation") -> pd.DataFrame:
+    """Square matrix as long-form (Row, Column, value) chart rows."""
+    wide = matrix.rename_axis(index="Row", columns=None).reset_index()
+    return wide.melt(id_vars="Row", var_name="Column", value_name=value_name)
@@ -0,0 +1,210 @@
+"""
+Comparison resolver - Handles side-by-side aggregate statistics for multiple datasets
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from resolvers import analyzer
+
+
+DEFAULT_BINS = 40
+
+
+# ===== AGGREGATE FUNCTIONS =====
+
+def get_numeric_ranges(df: pd.DataFrame) -> dict:
+    """Get (min, max) of every numeric column."""
+    num_cols = analyzer.get_numeric_columns(df)
+    if not num_cols:
+        return {}
+    bounds = df[num_cols].agg(["min", "max"])
+    return {col: (bounds.at["min", col], bounds.at["max", col]) for col in num_cols}
+
+
+def get_shared_bin_edges(ranges: list, n_bins: int = DEFAULT_BINS) -> dict:
+    """
+    Build histogram edges that cover every dataset, so counts can be overlaid.
+
+    Args:
+        ranges: List of get_numeric_ranges() results, one per dataset
+        n_bins: Number of equal-width bins
+
+    Returns:
+        Dictionary mapping column name to an array of n_bins + 1 edges
+    """
+    lows, highs = {}, {}
+    for dataset_ranges in ranges:
+        for col, (low, high) in dataset_ranges.items():
+            if pd.isna(low) or pd.isna(high):
+                continue
+            lows[col] = min(lows.get(col, low), low)
+            highs[col] = max(highs.get(col, high), high)
+
+    edges = {}
+    for col in lows:
+        low, high = float(lows[col]), float(highs[col])
+        if low == high:
+            low, high = low - 0.5, high + 0.5
+        edges[col] = np.linspace(low, high, n_bins + 1)
+    return edges
+
+
+def compute_dataset_aggregates(df: pd.DataFrame, target_col: str, edges: dict) -> dict:
+    """
+    Compute the analyzer statistics for one dataset as compact aggregates.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        edges: Shared histogram edges from get_shared_bin_edges()
+
+    Returns:
+        Dictionary with overview, missing data, target distribution, correlations,
+        histogram counts and per-class means
+    """
+    has_target = target_col in df.columns
+    histograms = {}
+    for col, col_edges in edges.items():
+        if col not in df.columns:
+            continue
+        values = df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+        values = values[~np.isnan(values)]
+        histograms[col] = np.histogram(values, bins=col_edges)[0]
+
+    aggregates = {
+        "overview": analyzer.get_dataset_overview(df),
+        "missing": analyzer.analyze_missing_data(df),
+        "histograms": histograms,
+        "distribution": analyzer.get_distribution_summary(df),
+        "correlation_matrix": analyzer.get_correlation_matrix(df),
+    }
+
+    if has_target:
+        target_df, target_counts = analyzer.get_target_distribution(df, target_col)
+        target = pd.to_numeric(df[target_col], errors="coerce")
+        aggregates.update({
+            "target_distribution": target_df,
+            "target_rate": float(target.mean()),
+            "correlation": analyzer.get_correlation_with_target(df, target_col),
+        })
+    return aggregates
+
+
+def compare_datasets(datasets: dict, target_col: str = None, n_bins: int = DEFAULT_BINS,
+                     max_workers: int = None) -> dict:
+    """
+    Compute aggregates for several datasets concurrently.
+
+    Each dataset is processed by its own worker thread; the frames are never
+    concatenated or copied into worker processes. A cheap first pass collects
+    numeric ranges so all histograms share the same bins.
+
+    Args:
+        datasets: Mapping of dataset name to DataFrame
+        target_col: Target column (auto-detected from the first dataset if None)
+        n_bins: Number of histogram bins
+        max_workers: Worker threads (defaults to one per dataset)
+
+    Returns:
+        Dictionary with target column, shared edges and per-dataset aggregates
+    """
+    if not datasets:
+        raise ValueError("At least one dataset is required for comparison.")
+
+    names = list(datasets)
+    if target_col is None:
+        target_col = analyzer.get_target_column(datasets[names[0]])
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(names)) as executor:
+        ranges = list(executor.map(get_numeric_ranges, datasets.values()))
+        edges = get_shared_bin_edges(ranges, n_bins)
+        results = executor.map(
+            lambda df: compute_dataset_aggregates(df, target_col, edges), datasets.values()
+        )
+        aggregates = dict(zip(names, results))
+
+    return {"target_col": target_col, "edges": edges, "datasets": aggregates}
+
+
+# ===== COMPARISON FUNCTIONS =====
+
+def get_overview_comparison(comparison: dict) -> pd.DataFrame:
+    """Get one row of headline metrics per dataset."""
+    rows = []
+    for name, agg in comparison["datasets"].items():
+        overview = agg["overview"]
+        missing = agg["missing"]
+        rows.append({
+            "Dataset": name,
+            "Records": overview["total_records"],
+            "Columns": overview["total_columns"],
+            "Target Rate %": agg.get("target_rate", np.nan) * 100,
+            "Columns with Missing": len(missing),
+            "Missing Cells": int(missing["Missing Count"].sum()) if len(missing) else 0,
+        })
+    return pd.DataFrame(rows).set_index("Dataset")
+
+
+def get_correlation_deltas(comparison: dict, baseline: str = None) -> pd.DataFrame:
+    """
+    Compare feature correlations with the target across datasets.
+
+    Args:
+        comparison: Output of compare_datasets()
+        baseline: Dataset to diff against (defaults to the first one)
+
+    Returns:
+        DataFrame with one correlation column per dataset and a delta column per
+        non-baseline dataset, sorted by the largest absolute delta
+    """
+    names = list(comparison["datasets"])
+    if baseline is None:
+        baseline = names[0]
+
+    corr = pd.DataFrame({
+        name: agg.get("correlation", pd.Series(dtype=float))
+        for name, agg in comparison["datasets"].items()
+    })
+    if corr.empty:
+        return corr
+
+    deltas = []
+    for name in names:
+        if name == baseline:
+            continue
+        delta_col = f"Δ {name} vs {baseline}"
+        corr[delta_col] = corr[name] - corr[baseline]
+        deltas.append(delta_col)
+
+    if deltas:
+        corr = corr.loc[corr[deltas].abs().max(axis=1).sort_values(ascending=False).index]
+    return corr
+
+
+def get_correlation_matrix_delta(comparison: dict, name: str, baseline: str) -> pd.DataFrame:
+    """Difference between two datasets' correlation matrices (name minus baseline)."""
+    current = comparison["datasets"][name]["correlation_matrix"]
+    reference = comparison["datasets"][baseline]["correlation_matrix"]
+    return current.sub(reference).dropna(how="all").dropna(axis=1, how="all")
+
+
+def get_histogram_densities(comparison: dict, col: str) -> pd.DataFrame:
+    """
+    Get normalised histogram densities of one column for every dataset.
+
+    Returns:
+        DataFrame indexed by bin center with one density column per dataset
+    """
+    edges = comparison["edges"][col]
+    centers = (edges[:-1] + edges[1:]) / 2
+    widths = np.diff(edges)
+
+    densities = {}
+    for name, agg in comparison["datasets"].items():
+        counts = agg["histograms"].get(col)
+        if counts is None or counts.sum() == 0:
+            continue
+        densities[name] = counts / (counts.sum() * widths)
+    return pd.DataFrame(densities, index=pd.Index(centers, name=col))
@@ -0,0 +1,178 @@
+"""
+Cube resolver - Handles the pre-aggregated cube for slicing delinquency rates by categorical dimensions
+"""
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_DIMENSIONS = ["Location", "Employment_Status", "Credit_Card_Type", "Age_Band"]
+DEFAULT_MEASURES = ["Credit_Score", "Income"]
+MISSING_LABEL = "(missing)"
+
+AGE_BAND_COL = "Age_Band"
+AGE_BAND_EDGES = [0, 25, 35, 45, 55, 65, np.inf]
+AGE_BAND_LABELS = ["<25", "25-34", "35-44", "45-54", "55-64", "65+"]
+
+
+# ===== BUILD FUNCTIONS =====
+
+def get_age_band(df: pd.DataFrame, age_col: str = "Age") -> pd.Series:
+    """Bucket ages into the bands used by the cube."""
+    return pd.cut(df[age_col], bins=AGE_BAND_EDGES, labels=AGE_BAND_LABELS, right=False)
+
+
+def _dimension_codes(df: pd.DataFrame, dim: str) -> tuple:
+    """Integer-encode one dimension, mapping missing values to a trailing label."""
+    series = get_age_band(df) if dim == AGE_BAND_COL and dim not in df.columns else df[dim]
+
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype(np.int64)
+        labels = [str(c) for c in series.cat.categories]
+    else:
+        codes, uniques = pd.factorize(series, sort=True)
+        labels = [str(u) for u in uniques]
+
+    if (codes < 0).any():
+        codes = np.where(codes < 0, len(labels), codes)
+        labels.append(MISSING_LABEL)
+    return codes, labels
+
+
+def build_cube(df: pd.DataFrame, target_col: str, dimensions: list = None, measures: list = None) -> dict:
+    """
+    Build a dense aggregate cube in one pass over the data.
+
+    Every cell (one combination of dimension values) stores the record count,
+    the target count and sum, and the count, sum and sum of squares of each
+    measure. Any roll-up, slice or dice is then a sum over array axes.
+
+    Args:
+        df: Input dataframe
+        target_col: Target (delinquency) column
+        dimensions: Categorical dimensions ("Age_Band" is derived from Age)
+        measures: Numeric columns to aggregate
+
+    Returns:
+        Cube dictionary
+    """
+    if dimensions is None:
+        dimensions = [d for d in DEFAULT_DIMENSIONS
+                      if d in df.columns or (d == AGE_BAND_COL and "Age" in df.columns)]
+    if measures is None:
+        measures = [m for m in DEFAULT_MEASURES if m in df.columns]
+    if not dimensions:
+        raise ValueError("The cube needs at least one categorical dimension.")
+
+    codes, labels = [], {}
+    for dim in dimensions:
+        dim_codes, dim_labels = _dimension_codes(df, dim)
+        codes.append(dim_codes)
+        labels[dim] = dim_labels
+
+    shape = tuple(len(labels[d]) for d in dimensions)
+    size = int(np.prod(shape))
+    cell = np.ravel_multi_index(codes, shape)
+
+    def cell_sum(weights=None):
+        return np.bincount(cell, weights=weights, minlength=size).reshape(shape)
+
+    target = pd.to_numeric(df[target_col], errors="coerce").to_numpy(dtype=np.float64)
+    target_present = ~np.isnan(target)
+
+    cube = {
+        "dimensions": list(dimensions),
+        "labels": labels,
+        "target_col": target_col,
+        "count": cell_sum().astype(np.int64),
+        "target_count": cell_sum(target_present.astype(np.float64)),
+        "target_sum": cell_sum(np.where(target_present, target, 0.0)),
+        "measures": {},
+    }
+
+    for measure in measures:
+        values = df[measure].to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        filled = np.where(present, values, 0.0)
+        cube["measures"][measure] = {
+            "n": cell_sum(present.astype(np.float64)),
+            "sum": cell_sum(filled),
+            "sumsq": cell_sum(filled * filled),
+        }
+    return cube
+
+
+# ===== QUERY FUNCTIONS =====
+
+def _reduce(array: np.ndarray, cube: dict, group_by: list, selections: dict) -> np.ndarray:
+    """Slice an aggregate array by selections, then sum away non-grouped axes."""
+    for axis, dim in enumerate(cube["dimensions"]):
+        if dim in selections:
+            array = np.take(array, selections[dim], axis=axis)
+
+    keep = [cube["dimensions"].index(d) for d in group_by]
+    drop = tuple(i for i in range(array.ndim) if i not in keep)
+    array = array.sum(axis=drop)
+
+    # Reorder remaining axes to follow group_by
+    remaining = sorted(keep)
+    return np.transpose(array, [remaining.index(i) for i in keep]) if keep else array
+
+
+def query_cube(cube: dict, group_by: list = None, filters: dict = None) -> pd.DataFrame:
+    """
+    Answer a roll-up query from the cube without touching the raw data.
+
+    Args:
+        cube: Output of build_cube()
+        group_by: Dimensions to keep (empty = grand total)
+        filters: Mapping of dimension to the labels to keep (dice)
+
+    Returns:
+        DataFrame with customers, delinquent count, delinquency rate and the
+        mean/std of each measure per group, sorted by delinquency rate
+    """
+    group_by = list(group_by or [])
+    unknown = [d for d in group_by + list(filters or {}) if d not in cube["dimensions"]]
+    if unknown:
+        raise ValueError(f"Unknown cube dimensions: {unknown}")
+
+    selections = {}
+    for dim, values in (filters or {}).items():
+        if values:
+            index = {label: i for i, label in enumerate(cube["labels"][dim])}
+            selections[dim] = [index[str(v)] for v in values if str(v) in index]
+
+    def reduce(array):
+        return _reduce(array, cube, group_by, selections).ravel()
+
+    count = reduce(cube["count"])
+    target_count = reduce(cube["target_count"])
+    target_sum = reduce(cube["target_sum"])
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        result = {
+            "Customers": count,
+            "Delinquent": target_sum,
+            "Delinquency Rate %": target_sum / target_count * 100,
+        }
+        for measure, stats in cube["measures"].items():
+            n, total, sumsq = reduce(stats["n"]), reduce(stats["sum"]), reduce(stats["sumsq"])
+            mean = total / n
+            var = np.maximum(sumsq - n * mean * mean, 0) / (n - 1)
+            result[f"Mean {measure}"] = mean
+            result[f"Std {measure}"] = np.sqrt(var)
+
+    if group_by:
+        group_labels = [
+            [cube["labels"][d][i] for i in selections[d]] if d in selections else cube["labels"][d]
+            for d in group_by
+        ]
+        index = pd.MultiIndex.from_product(group_labels, names=group_by)
+        if len(group_by) == 1:
+            index = index.get_level_values(0)
+    else:
+        index = pd.Index(["All"], name="Group")
+
+    out = pd.DataFrame(result, index=index)
+    out = out[out["Customers"] > 0]
+    return out.sort_values("Delinquency Rate %", ascending=False)
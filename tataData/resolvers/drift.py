@@ -0,0 +1,447 @@
+"""
+Drift resolver - Handles reference profiling and drift detection for new data extracts
+"""
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from resolvers import mlpipeline
+
+
+PROFILE_VERSION = 1
+DEFAULT_BINS = 100
+PSI_BINS = 10
+DEFAULT_CHUNKSIZE = 500_000
+
+# (warning, alert) levels per drift statistic
+DEFAULT_THRESHOLDS = {
+    "PSI": (0.10, 0.25),
+    "KS": (0.10, 0.20),
+    "JS": (0.10, 0.20),
+}
+
+
+# ===== STREAMING HELPERS =====
+
+def iter_chunks(source, chunksize: int = DEFAULT_CHUNKSIZE):
+    """
+    Yield DataFrame chunks from a file path, a DataFrame or an iterable of frames.
+
+    CSV paths are read with a fixed chunksize and Parquet paths in record
+    batches of the same size, so monthly extracts never have to be fully
+    materialised in memory.
+    """
+    if isinstance(source, pd.DataFrame):
+        for start in range(0, len(source), chunksize):
+            yield source.iloc[start:start + chunksize]
+    elif isinstance(source, (str, Path)):
+        name = str(source).lower()
+        if name.endswith(".csv"):
+            yield from pd.read_csv(source, chunksize=chunksize)
+        elif name.endswith(".parquet"):
+            for batch in pq.ParquetFile(source).iter_batches(batch_size=chunksize):
+                yield batch.to_pandas()
+        else:
+            raise ValueError(f"Unsupported extract format for streaming: '{source}'")
+    else:
+        yield from source
+
+
+def quantile_edges(values: np.ndarray, n_bins: int = DEFAULT_BINS) -> np.ndarray:
+    """
+    Compute interior bin edges at evenly spaced quantiles of the non-null values.
+
+    The outer bins are open-ended, so values outside the reference range still
+    land in the first or last bin when new data is profiled.
+    """
+    values = values[~np.isnan(values)]
+    if values.size == 0:
+        return np.array([], dtype=np.float64)
+    qs = np.linspace(0, 1, n_bins + 1)[1:-1]
+    return np.unique(np.quantile(values, qs))
+
+
+def bin_counts(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Count non-null values per bin defined by interior edges (len(edges) + 1 bins)."""
+    values = values[~np.isnan(values)]
+    return np.bincount(np.searchsorted(edges, values, side="right"), minlength=edges.size + 1)
+
+
+# ===== PROFILE FUNCTIONS =====
+
+def _empty_profile(spec: dict) -> dict:
+    """Create zeroed accumulators for a profile specification."""
+    return {
+        "version": PROFILE_VERSION,
+        "n_rows": 0,
+        "target_col": spec["target_col"],
+        "target_sum": 0.0,
+        "target_count": 0,
+        "numeric": {
+            col: {
+                "edges": np.asarray(edges, dtype=np.float64),
+                "counts": np.zeros(len(edges) + 1, dtype=np.int64),
+                "missing": 0,
+                "min": np.inf,
+                "max": -np.inf,
+            }
+            for col, edges in spec["numeric"].items()
+        },
+        "categorical": {
+            col: {"counts": {}, "missing": 0}
+            for col in spec["categorical"]
+        },
+    }
+
+
+def _spec_from_chunk(chunk: pd.DataFrame, target_col: str, n_bins: int,
+                     id_cols: list) -> dict:
+    """Derive feature types and numeric bin edges from a sample chunk."""
+    numeric = {}
+    categorical = []
+    for col in chunk.columns:
+        if col == target_col or col in id_cols:
+            continue
+        if pd.api.types.is_numeric_dtype(chunk[col]):
+            numeric[col] = quantile_edges(numeric_values(chunk[col]), n_bins)
+        else:
+            categorical.append(col)
+    return {"target_col": target_col, "numeric": numeric, "categorical": categorical}
+
+
+def numeric_values(series: pd.Series) -> np.ndarray:
+    """
+    float64 values of a column, with unparseable entries as NaN.
+
+    CSV dtypes are inferred per chunk, so a column that was numeric in the
+    first chunk can arrive as text later (e.g. an "N/A" marker); such
+    entries count as missing instead of failing the pass.
+    """
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+
+def _accumulate(profile: dict, chunk: pd.DataFrame) -> None:
+    """Add one chunk to a profile's accumulators in place."""
+    profile["n_rows"] += len(chunk)
+
+    target_col = profile["target_col"]
+    if target_col and target_col in chunk.columns:
+        target = pd.to_numeric(chunk[target_col], errors="coerce")
+        profile["target_sum"] += float(target.sum())
+        profile["target_count"] += int(target.notna().sum())
+
+    for col, stats in profile["numeric"].items():
+        if col not in chunk.columns:
+            stats["missing"] += len(chunk)
+            continue
+        values = numeric_values(chunk[col])
+        present = values[~np.isnan(values)]
+        stats["missing"] += values.size - present.size
+        if present.size:
+            stats["counts"] += np.bincount(
+                np.searchsorted(stats["edges"], present, side="right"),
+                minlength=stats["counts"].size,
+            )
+            stats["min"] = min(stats["min"], float(present.min()))
+            stats["max"] = max(stats["max"], float(present.max()))
+
+    for col, stats in profile["categorical"].items():
+        if col not in chunk.columns:
+            stats["missing"] += len(chunk)
+            continue
+        series = chunk[col]
+        stats["missing"] += int(series.isna().sum())
+        for value, count in series.value_counts(dropna=True).items():
+            key = str(value)
+            stats["counts"][key] = stats["counts"].get(key, 0) + int(count)
+
+
+def build_reference_profile(source, target_col: str = None, n_bins: int = DEFAULT_BINS,
+                            id_cols: list = None, chunksize: int = DEFAULT_CHUNKSIZE) -> dict:
+    """
+    Build a compact reference profile in one streaming pass.
+
+    Numeric features are summarised as fine quantile histograms (which double as
+    quantile sketches), categorical features as frequency tables. Bin edges are
+    taken from the first chunk, so use a chunksize large enough to be representative.
+
+    Args:
+        source: CSV/Parquet path, DataFrame or iterable of DataFrame chunks
+        target_col: Target column name (its rate is tracked, not binned)
+        n_bins: Number of quantile bins per numeric feature
+        id_cols: Identifier columns to exclude (defaults to mlpipeline.ID_COLUMNS)
+        chunksize: Rows per chunk when reading from a path
+
+    Returns:
+        Profile dictionary
+    """
+    if id_cols is None:
+        id_cols = mlpipeline.ID_COLUMNS
+
+    chunks = iter_chunks(source, chunksize)
+    try:
+        first = next(chunks)
+    except StopIteration:
+        raise ValueError("Cannot build a reference profile from an empty source.") from None
+
+    profile = _empty_profile(_spec_from_chunk(first, target_col, n_bins, id_cols))
+    _accumulate(profile, first)
+    for chunk in chunks:
+        _accumulate(profile, chunk)
+    return profile
+
+
+def profile_extract(source, reference: dict, chunksize: int = DEFAULT_CHUNKSIZE) -> dict:
+    """
+    Profile a new extract on the reference's bins in a single streaming pass.
+
+    Args:
+        source: CSV/Parquet path, DataFrame or iterable of DataFrame chunks
+        reference: Profile returned by build_reference_profile()
+        chunksize: Rows per chunk when reading from a path
+
+    Returns:
+        Profile dictionary directly comparable with the reference
+    """
+    spec = {
+        "target_col": reference["target_col"],
+        "numeric": {col: stats["edges"] for col, stats in reference["numeric"].items()},
+        "categorical": list(reference["categorical"]),
+    }
+    profile = _empty_profile(spec)
+    for chunk in iter_chunks(source, chunksize):
+        _accumulate(profile, chunk)
+    return profile
+
+
+def approximate_quantiles(profile: dict, col: str, qs=(0.05, 0.25, 0.5, 0.75, 0.95)) -> pd.Series:
+    """
+    Estimate quantiles of a numeric feature from its profile histogram.
+
+    Values are interpolated linearly within bins; the open outer bins are
+    bounded by the observed minimum and maximum.
+    """
+    stats = profile["numeric"][col]
+    counts = stats["counts"]
+    total = counts.sum()
+    if total == 0:
+        return pd.Series(np.nan, index=list(qs), name=col)
+
+    bounds = np.r_[stats["min"], stats["edges"], stats["max"]]
+    bounds = np.clip(bounds, stats["min"], stats["max"])
+    cdf = np.r_[0, np.cumsum(counts)] / total
+    return pd.Series(np.interp(qs, cdf, bounds), index=list(qs), name=col)
+
+
+def profile_to_dict(profile: dict) -> dict:
+    """Convert a profile to a JSON-serialisable dictionary."""
+    out = dict(profile)
+    out["numeric"] = {
+        col: {
+            "edges": stats["edges"].tolist(),
+            "counts": stats["counts"].tolist(),
+            "missing": int(stats["missing"]),
+            "min": float(stats["min"]) if np.isfinite(stats["min"]) else None,
+            "max": float(stats["max"]) if np.isfinite(stats["max"]) else None,
+        }
+        for col, stats in profile["numeric"].items()
+    }
+    return out
+
+
+def profile_from_dict(data: dict) -> dict:
+    """Restore a profile produced by profile_to_dict()."""
+    if data.get("version") != PROFILE_VERSION:
+        raise ValueError(
+            f"Unsupported profile version {data.get('version')} (expected {PROFILE_VERSION})."
+        )
+    profile = dict(data)
+    profile["numeric"] = {
+        col: {
+            "edges": np.asarray(stats["edges"], dtype=np.float64),
+            "counts": np.asarray(stats["counts"], dtype=np.int64),
+            "missing": stats["missing"],
+            "min": np.inf if stats["min"] is None else stats["min"],
+            "max": -np.inf if stats["max"] is None else stats["max"],
+        }
+        for col, stats in data["numeric"].items()
+    }
+    return profile
+
+
+def save_profile(profile: dict, path) -> None:
+    """Write a profile to a JSON file."""
+    Path(path).write_text(json.dumps(profile_to_dict(profile)))
+
+
+def load_profile(path) -> dict:
+    """Read a profile written by save_profile()."""
+    return profile_from_dict(json.loads(Path(path).read_text()))
+
+
+# ===== DRIFT STATISTICS =====
+
+def _proportions(counts: np.ndarray, eps: float = 1e-6) -> np.ndarray:
+    """Normalise counts to proportions, flooring empty bins at eps."""
+    total = counts.sum()
+    if total == 0:
+        return np.full(counts.shape, 1.0 / max(counts.size, 1))
+    return np.maximum(counts / total, eps)
+
+
+def population_stability_index(ref_counts: np.ndarray, cur_counts: np.ndarray) -> float:
+    """PSI between two binned distributions."""
+    ref_p = _proportions(ref_counts)
+    cur_p = _proportions(cur_counts)
+    return float(np.sum((cur_p - ref_p) * np.log(cur_p / ref_p)))
+
+
+def ks_statistic(ref_counts: np.ndarray, cur_counts: np.ndarray) -> float:
+    """Two-sample Kolmogorov-Smirnov statistic evaluated on shared bin edges."""
+    if ref_counts.sum() == 0 or cur_counts.sum() == 0:
+        return float("nan")
+    ref_cdf = np.cumsum(ref_counts) / ref_counts.sum()
+    cur_cdf = np.cumsum(cur_counts) / cur_counts.sum()
+    return float(np.max(np.abs(ref_cdf - cur_cdf)))
+
+
+def jensen_shannon_distance(ref_counts: np.ndarray, cur_counts: np.ndarray) -> float:
+    """Jensen-Shannon distance (base 2, bounded in [0, 1]) between binned distributions."""
+    if ref_counts.sum() == 0 or cur_counts.sum() == 0:
+        return float("nan")
+    p = ref_counts / ref_counts.sum()
+    q = cur_counts / cur_counts.sum()
+    m = (p + q) / 2
+    with np.errstate(divide="ignore", invalid="ignore"):
+        kl_pm = np.where(p > 0, p * np.log2(p / m), 0.0).sum()
+        kl_qm = np.where(q > 0, q * np.log2(q / m), 0.0).sum()
+    return float(np.sqrt(max((kl_pm + kl_qm) / 2, 0.0)))
+
+
+def _coarse_counts(counts: np.ndarray, n_groups: int = PSI_BINS) -> np.ndarray:
+    """Merge fine quantile bins into roughly equal-mass groups for PSI."""
+    if counts.size <= n_groups:
+        return counts
+    return np.array([group.sum() for group in np.array_split(counts, n_groups)])
+
+
+def _categorical_counts(ref_stats: dict, cur_stats: dict) -> tuple:
+    """Align category frequency tables, keeping categories unseen in either side."""
+    categories = sorted(set(ref_stats["counts"]) | set(cur_stats["counts"]))
+    ref = np.array([ref_stats["counts"].get(c, 0) for c in categories], dtype=np.int64)
+    cur = np.array([cur_stats["counts"].get(c, 0) for c in categories], dtype=np.int64)
+    return ref, cur
+
+
+def _drift_status(row: dict, thresholds: dict) -> str:
+    """Classify a feature as stable, warning or alert from its drift statistics."""
+    status = "stable"
+    for stat, (warning, alert) in thresholds.items():
+        value = row.get(stat)
+        if value is None or np.isnan(value):
+            continue
+        if value >= alert:
+            return "alert"
+        if value >= warning:
+            status = "warning"
+    return status
+
+
+def compare_profiles(reference: dict, current: dict, thresholds: dict = None) -> pd.DataFrame:
+    """
+    Compute PSI, KS and Jensen-Shannon drift for every profiled feature.
+
+    Args:
+        reference: Reference profile
+        current: Profile of the new extract (built with profile_extract)
+        thresholds: Optional {stat: (warning, alert)} overrides
+
+    Returns:
+        DataFrame with one row per feature, sorted by PSI descending
+    """
+    if thresholds is None:
+        thresholds = DEFAULT_THRESHOLDS
+
+    rows = []
+    for col, ref_stats in reference["numeric"].items():
+        cur_stats = current["numeric"][col]
+        ref_counts, cur_counts = ref_stats["counts"], cur_stats["counts"]
+        rows.append({
+            "Feature": col,
+            "Type": "numeric",
+            "PSI": population_stability_index(_coarse_counts(ref_counts), _coarse_counts(cur_counts)),
+            "KS": ks_statistic(ref_counts, cur_counts),
+            "JS": jensen_shannon_distance(ref_counts, cur_counts),
+            "Missing % (reference)": ref_stats["missing"] / max(reference["n_rows"], 1) * 100,
+            "Missing % (current)": cur_stats["missing"] / max(current["n_rows"], 1) * 100,
+        })
+
+    for col, ref_stats in reference["categorical"].items():
+        cur_stats = current["categorical"][col]
+        ref_counts, cur_counts = _categorical_counts(ref_stats, cur_stats)
+        rows.append({
+            "Feature": col,
+            "Type": "categorical",
+            "PSI": population_stability_index(ref_counts, cur_counts),
+            "KS": np.nan,
+            "JS": jensen_shannon_distance(ref_counts, cur_counts),
+            "Missing % (reference)": ref_stats["missing"] / max(reference["n_rows"], 1) * 100,
+            "Missing % (current)": cur_stats["missing"] / max(current["n_rows"], 1) * 100,
+        })
+
+    for row in rows:
+        row["Status"] = _drift_status(row, thresholds)
+
+    if not rows:
+        return pd.DataFrame()
+    return pd.DataFrame(rows).sort_values("PSI", ascending=False).reset_index(drop=True)
+
+
+def get_target_rate_change(reference: dict, current: dict) -> dict:
+    """Compare the target (delinquency) rate between two profiles."""
+    ref_rate = reference["target_sum"] / reference["target_count"] if reference["target_count"] else np.nan
+    cur_rate = current["target_sum"] / current["target_count"] if current["target_count"] else np.nan
+    return {
+        "target_col": reference["target_col"],
+        "reference_rate": ref_rate,
+        "current_rate": cur_rate,
+        "absolute_change": cur_rate - ref_rate,
+    }
+
+
+def detect_drift(reference: dict, source, thresholds: dict = None,
+                 chunksize: int = DEFAULT_CHUNKSIZE) -> dict:
+    """
+    Profile a new extract and report drift against the reference.
+
+    Args:
+        reference: Reference profile
+        source: New extract (CSV/Parquet path, DataFrame or chunk iterable)
+        thresholds: Optional {stat: (warning, alert)} overrides
+        chunksize: Rows per chunk when reading from a path
+
+    Returns:
+        Dictionary with the current profile, per-feature report, alert messages
+        and target rate change
+    """
+    current = profile_extract(source, reference, chunksize)
+    report = compare_profiles(reference, current, thresholds)
+
+    alerts = []
+    if not report.empty:
+        for _, row in report[report["Status"] != "stable"].iterrows():
+            alerts.append(
+                f"{row['Status'].upper()}: {row['Feature']} drifted "
+                f"(PSI={row['PSI']:.3f}, JS={row['JS']:.3f}"
+                + (f", KS={row['KS']:.3f})" if not np.isnan(row["KS"]) else ")")
+            )
+
+    return {
+        "current": current,
+        "report": report,
+        "alerts": alerts,
+        "target": get_target_rate_change(reference, current),
+    }
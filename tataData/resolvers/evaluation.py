@@ -0,0 +1,314 @@
+"""
+Evaluation resolver - Computes classification metrics from label and score arrays
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+
+BOOTSTRAP_BLOCK_SIZE = 25  # replicates per spawned seed; fixed so results do not depend on n_jobs
+
+
+# ===== CURVE FUNCTIONS =====
+
+def _as_binary_arrays(y_true, y_score) -> tuple:
+    """Validate inputs and return (y_true as bool, y_score as float64)."""
+    y_true = np.asarray(y_true).ravel()
+    y_score = np.asarray(y_score, dtype=np.float64).ravel()
+
+    if y_true.shape != y_score.shape:
+        raise ValueError(
+            f"y_true and y_score must have the same length "
+            f"({y_true.shape[0]} != {y_score.shape[0]})."
+        )
+    if y_true.size == 0:
+        raise ValueError("Cannot evaluate metrics on empty arrays.")
+
+    return y_true.astype(bool), y_score
+
+
+def binary_clf_counts(y_true, y_score) -> tuple:
+    """
+    Count true and false positives at every distinct score threshold.
+
+    Sorts the scores once and accumulates positives/negatives with cumulative
+    sums, so every threshold is evaluated in O(n log n) total.
+
+    Args:
+        y_true: Binary labels (1 = delinquent)
+        y_score: Predicted probabilities or scores
+
+    Returns:
+        Tuple of (fps, tps, thresholds, n_pos, n_neg). Element i holds the
+        counts when predicting positive for every score >= thresholds[i];
+        thresholds are in decreasing order.
+    """
+    y_true, y_score = _as_binary_arrays(y_true, y_score)
+
+    order = np.argsort(y_score, kind="mergesort")[::-1]
+    y_score = y_score[order]
+    y_true = y_true[order]
+
+    # Last index of each run of equal scores
+    distinct = np.flatnonzero(np.diff(y_score))
+    threshold_idx = np.r_[distinct, y_true.size - 1]
+
+    tps = np.cumsum(y_true, dtype=np.int64)[threshold_idx]
+    fps = (threshold_idx + 1) - tps
+    n_pos = int(tps[-1])
+    n_neg = int(fps[-1])
+
+    return fps, tps, y_score[threshold_idx], n_pos, n_neg
+
+
+def roc_curve(y_true, y_score) -> pd.DataFrame:
+    """
+    Compute the ROC curve from a single sort of the scores.
+
+    Args:
+        y_true: Binary labels
+        y_score: Predicted probabilities or scores
+
+    Returns:
+        DataFrame with threshold, fpr and tpr columns, starting at (0, 0)
+    """
+    fps, tps, thresholds, n_pos, n_neg = binary_clf_counts(y_true, y_score)
+
+    fps = np.r_[0, fps]
+    tps = np.r_[0, tps]
+    thresholds = np.r_[np.inf, thresholds]
+
+    fpr = fps / n_neg if n_neg else np.full(fps.shape, np.nan)
+    tpr = tps / n_pos if n_pos else np.full(tps.shape, np.nan)
+
+    return pd.DataFrame({"threshold": thresholds, "fpr": fpr, "tpr": tpr})
+
+
+def precision_recall_curve(y_true, y_score) -> pd.DataFrame:
+    """
+    Compute the precision-recall curve from a single sort of the scores.
+
+    Args:
+        y_true: Binary labels
+        y_score: Predicted probabilities or scores
+
+    Returns:
+        DataFrame with threshold, precision and recall columns, ordered by
+        decreasing threshold
+    """
+    fps, tps, thresholds, n_pos, _ = binary_clf_counts(y_true, y_score)
+
+    precision = tps / (tps + fps)
+    recall = tps / n_pos if n_pos else np.full(tps.shape, np.nan)
+
+    return pd.DataFrame({"threshold": thresholds, "precision": precision, "recall": recall})
+
+
+def _auc_from_counts(fps, tps, n_pos, n_neg) -> float:
+    """Trapezoidal ROC-AUC from cumulative counts."""
+    if n_pos == 0 or n_neg == 0:
+        return float("nan")
+    fpr = np.r_[0, fps] / n_neg
+    tpr = np.r_[0, tps] / n_pos
+    return float(np.sum(np.diff(fpr) * (tpr[1:] + tpr[:-1])) / 2)
+
+
+def _average_precision_from_counts(fps, tps, n_pos) -> float:
+    """Step-wise average precision from cumulative counts."""
+    if n_pos == 0:
+        return float("nan")
+    precision = tps / (tps + fps)
+    recall_gain = np.diff(np.r_[0, tps]) / n_pos
+    return float(np.sum(recall_gain * precision))
+
+
+def roc_auc_score(y_true, y_score) -> float:
+    """Area under the ROC curve (NaN if only one class is present)."""
+    fps, tps, _, n_pos, n_neg = binary_clf_counts(y_true, y_score)
+    return _auc_from_counts(fps, tps, n_pos, n_neg)
+
+
+def average_precision_score(y_true, y_score) -> float:
+    """Area under the precision-recall curve (step-wise average precision)."""
+    fps, tps, _, n_pos, _ = binary_clf_counts(y_true, y_score)
+    return _average_precision_from_counts(fps, tps, n_pos)
+
+
+# ===== THRESHOLD FUNCTIONS =====
+
+def threshold_sweep(y_true, y_score) -> pd.DataFrame:
+    """
+    Evaluate Accuracy, Precision, Recall and F1 at every candidate threshold.
+
+    All thresholds come from the same sort used for the ROC/PR curves, so the
+    whole sweep costs O(n log n) instead of one pass per threshold and metric.
+
+    Args:
+        y_true: Binary labels
+        y_score: Predicted probabilities or scores
+
+    Returns:
+        DataFrame with one row per distinct threshold (decreasing), holding the
+        confusion counts and metrics when predicting positive for score >= threshold
+    """
+    fps, tps, thresholds, n_pos, n_neg = binary_clf_counts(y_true, y_score)
+    fns = n_pos - tps
+    tns = n_neg - fps
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        precision = tps / (tps + fps)
+        recall = tps / n_pos if n_pos else np.full(tps.shape, np.nan)
+        f1 = 2 * tps / (2 * tps + fps + fns)
+
+    return pd.DataFrame({
+        "threshold": thresholds,
+        "tp": tps,
+        "fp": fps,
+        "fn": fns,
+        "tn": tns,
+        "accuracy": (tps + tns) / (n_pos + n_neg),
+        "precision": precision,
+        "recall": recall,
+        "f1": f1,
+        "flagged_pct": (tps + fps) / (n_pos + n_neg) * 100,
+    })
+
+
+def select_threshold(sweep: pd.DataFrame, metric: str = "f1", min_precision: float = None,
+                     min_recall: float = None) -> pd.Series:
+    """
+    Pick the threshold that maximizes a metric under business constraints.
+
+    Args:
+        sweep: Output of threshold_sweep()
+        metric: Column to maximize (e.g. "f1", "recall", "precision")
+        min_precision: Minimum acceptable precision (optional)
+        min_recall: Minimum acceptable recall (optional)
+
+    Returns:
+        The sweep row for the chosen threshold
+    """
+    candidates = sweep
+    if min_precision is not None:
+        candidates = candidates[candidates["precision"] >= min_precision]
+    if min_recall is not None:
+        candidates = candidates[candidates["recall"] >= min_recall]
+
+    if candidates.empty:
+        raise ValueError("No threshold satisfies the requested precision/recall constraints.")
+
+    return candidates.loc[candidates[metric].idxmax()]
+
+
+def classification_metrics(y_true, y_score, threshold: float = 0.5) -> dict:
+    """
+    Compute the metrics from get_evaluation_metrics_guide() for one threshold.
+
+    Args:
+        y_true: Binary labels
+        y_score: Predicted probabilities or scores
+        threshold: Classify as delinquent if score >= threshold
+
+    Returns:
+        Dictionary with Accuracy, Precision, Recall, F1 Score and ROC-AUC
+    """
+    fps, tps, thresholds, n_pos, n_neg = binary_clf_counts(y_true, y_score)
+
+    # Thresholds are decreasing: count entries with score >= threshold
+    idx = np.searchsorted(-thresholds, -threshold, side="right") - 1
+    tp = int(tps[idx]) if idx >= 0 else 0
+    fp = int(fps[idx]) if idx >= 0 else 0
+    fn = n_pos - tp
+    tn = n_neg - fp
+
+    return {
+        "Accuracy": (tp + tn) / (n_pos + n_neg),
+        "Precision": tp / (tp + fp) if tp + fp else float("nan"),
+        "Recall": tp / n_pos if n_pos else float("nan"),
+        "F1 Score": 2 * tp / (2 * tp + fp + fn) if tp + fp + fn else float("nan"),
+        "ROC-AUC": _auc_from_counts(fps, tps, n_pos, n_neg),
+    }
+
+
+# ===== CONFIDENCE INTERVAL FUNCTIONS =====
+
+def _metric_from_sample(y_true, y_score, metric: str, threshold: float) -> float:
+    """Evaluate a named metric on one bootstrap sample."""
+    if metric == "ROC-AUC":
+        return roc_auc_score(y_true, y_score)
+    if metric == "Average Precision":
+        return average_precision_score(y_true, y_score)
+    return classification_metrics(y_true, y_score, threshold)[metric]
+
+
+def _bootstrap_worker(y_true, y_score, metric: str, threshold: float,
+                      n_boot: int, seed_seq) -> np.ndarray:
+    """Run a block of bootstrap replicates with an independent RNG stream."""
+    rng = np.random.default_rng(seed_seq)
+    n = y_true.shape[0]
+    results = np.empty(n_boot)
+    for i in range(n_boot):
+        idx = rng.integers(0, n, size=n)
+        results[i] = _metric_from_sample(y_true[idx], y_score[idx], metric, threshold)
+    return results
+
+
+def bootstrap_confidence_interval(y_true, y_score, metric: str = "ROC-AUC", n_boot: int = 200,
+                                  confidence: float = 0.95, threshold: float = 0.5,
+                                  n_jobs: int = None, random_state: int = 42) -> dict:
+    """
+    Estimate a percentile bootstrap confidence interval for a metric.
+
+    Replicates are split into fixed-size blocks of BOOTSTRAP_BLOCK_SIZE,
+    each with its own spawned seed, and the blocks are spread over parallel
+    worker processes. Neither the blocks nor their seeds depend on n_jobs,
+    so results are reproducible for a given random_state on any machine.
+
+    Args:
+        y_true: Binary labels
+        y_score: Predicted probabilities or scores
+        metric: "ROC-AUC", "Average Precision", or a key of classification_metrics()
+        n_boot: Number of bootstrap replicates
+        confidence: Confidence level of the interval
+        threshold: Decision threshold for threshold-based metrics
+        n_jobs: Number of worker processes (defaults to CPU count; 1 runs in-process)
+        random_state: Seed for reproducibility
+
+    Returns:
+        Dictionary with point estimate, lower and upper bounds
+    """
+    y_true, y_score = _as_binary_arrays(y_true, y_score)
+
+    block_sizes = [min(BOOTSTRAP_BLOCK_SIZE, n_boot - start)
+                   for start in range(0, n_boot, BOOTSTRAP_BLOCK_SIZE)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(block_sizes))
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = max(1, min(n_jobs, len(block_sizes)))
+
+    if n_jobs == 1:
+        blocks = [_bootstrap_worker(y_true, y_score, metric, threshold, size, seed)
+                  for size, seed in zip(block_sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            futures = [
+                executor.submit(_bootstrap_worker, y_true, y_score, metric, threshold, size, seed)
+                for size, seed in zip(block_sizes, seeds)
+            ]
+            blocks = [f.result() for f in futures]
+    replicates = np.concatenate(blocks)
+
+    alpha = (1 - confidence) / 2
+    lower, upper = np.nanquantile(replicates, [alpha, 1 - alpha])
+
+    return {
+        "metric": metric,
+        "estimate": _metric_from_sample(y_true, y_score, metric, threshold),
+        "lower": float(lower),
+        "upper": float(upper),
+        "confidence": confidence,
+        "n_boot": n_boot,
+    }
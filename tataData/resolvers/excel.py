@@ -0,0 +1,165 @@
+"""
+Excel resolver - Handles fast workbook ingestion: sheet selection, streaming row parsing and parallel sheets
+"""
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import load_workbook
+
+
+STREAMING_EXTENSIONS = (".xlsx", ".xlsm")
+EXCEL_EXTENSIONS = (".xlsx", ".xls", ".xlsm")
+SHEET_COL = "Source_Sheet"
+ALL_SHEETS = "all"
+
+
+# ===== HELPER FUNCTIONS =====
+
+def _source_name(src) -> str:
+    """File name of a path or uploaded file."""
+    if hasattr(src, "name") and not isinstance(src, (str, Path)):
+        return src.name
+    return str(src)
+
+
+def _read_bytes(src) -> bytes:
+    """Raw bytes of a path or uploaded file (bytes can be shipped to worker processes)."""
+    if isinstance(src, bytes):
+        return src
+    if hasattr(src, "getvalue"):
+        return src.getvalue()
+    if hasattr(src, "read"):
+        src.seek(0)
+        return src.read()
+    return Path(src).read_bytes()
+
+
+def _header_names(header: tuple) -> list:
+    """Column names from the header row, naming blank headers like pandas does."""
+    return [f"Unnamed: {i}" if value is None else str(value) for i, value in enumerate(header)]
+
+
+# ===== SHEET FUNCTIONS =====
+
+def list_sheets(src) -> list:
+    """
+    List the sheet names of a workbook without parsing any cells.
+
+    Args:
+        src: File path, uploaded file or raw bytes
+
+    Returns:
+        List of sheet names in workbook order
+    """
+    data = _read_bytes(src)
+    if isinstance(src, bytes) or _source_name(src).lower().endswith(STREAMING_EXTENSIONS):
+        workbook = load_workbook(io.BytesIO(data), read_only=True)
+        try:
+            return list(workbook.sheetnames)
+        finally:
+            workbook.close()
+    return pd.ExcelFile(io.BytesIO(data)).sheet_names
+
+
+def read_sheet(data: bytes, sheet: str = None, columns: list = None) -> pd.DataFrame:
+    """
+    Stream one worksheet into a DataFrame.
+
+    The workbook is opened read-only, so rows are parsed one at a time from
+    the XML instead of building the full cell model, and only the cell
+    range spanning the requested columns is materialised.
+
+    Args:
+        data: Workbook bytes (.xlsx/.xlsm)
+        sheet: Sheet name (defaults to the first sheet)
+        columns: Columns to keep (defaults to all)
+
+    Returns:
+        DataFrame with one row per non-empty worksheet row below the header
+    """
+    workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        if not workbook.worksheets:
+            raise ValueError("Workbook contains no sheets.")
+        worksheet = workbook[sheet] if sheet is not None else workbook.worksheets[0]
+        header = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+        names = _header_names(header)
+
+        if columns is None:
+            keep = list(range(len(names)))
+        else:
+            missing = [c for c in columns if c not in names]
+            if missing:
+                raise ValueError(f"Sheet '{worksheet.title}' has no columns {missing}.")
+            keep = [names.index(c) for c in columns]
+
+        if not keep:
+            return pd.DataFrame()
+        first, last = min(keep), max(keep)
+        offsets = [i - first for i in keep]
+
+        rows = []
+        for row in worksheet.iter_rows(min_row=2, min_col=first + 1, max_col=last + 1, values_only=True):
+            rows.append(tuple(row[i] if i < len(row) else None for i in offsets))
+    finally:
+        workbook.close()
+
+    # Formatted but empty cells at the bottom of a sheet come back as blank rows
+    while rows and all(value is None for value in rows[-1]):
+        rows.pop()
+    return pd.DataFrame.from_records(rows, columns=[names[i] for i in keep])
+
+
+def _read_sheet_task(data: bytes, sheet: str, columns: list) -> pd.DataFrame:
+    """Worker entry point for parallel sheet parsing."""
+    return read_sheet(data, sheet, columns)
+
+
+# ===== LOAD FUNCTIONS =====
+
+def read_excel(src, sheets=None, columns: list = None, max_workers: int = None,
+               sheet_col: str = SHEET_COL) -> pd.DataFrame:
+    """
+    Load one or more sheets of a workbook into one DataFrame.
+
+    .xlsx/.xlsm files use the streaming reader; several sheets are parsed in
+    parallel worker processes (openpyxl parsing is CPU-bound Python). Legacy
+    .xls files fall back to pandas.read_excel.
+
+    Args:
+        src: File path, uploaded file or raw bytes
+        sheets: Sheet name, list of names, ALL_SHEETS, or None for the first sheet
+        columns: Columns to keep (defaults to all)
+        max_workers: Worker processes for multi-sheet loads (defaults to CPU count)
+        sheet_col: Column recording each row's sheet when several are loaded (None to omit)
+
+    Returns:
+        Combined DataFrame
+    """
+    data = _read_bytes(src)
+    streaming = isinstance(src, bytes) or _source_name(src).lower().endswith(STREAMING_EXTENSIONS)
+
+    if sheets == ALL_SHEETS:
+        sheets = list_sheets(data if streaming else src)
+    elif isinstance(sheets, str):
+        sheets = [sheets]
+    sheets = list(sheets) if sheets else [None]
+
+    if not streaming:
+        frames = [pd.read_excel(io.BytesIO(data), sheet_name=s or 0, usecols=columns) for s in sheets]
+    elif len(sheets) == 1:
+        frames = [read_sheet(data, sheets[0], columns)]
+    else:
+        workers = min(len(sheets), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            frames = list(executor.map(_read_sheet_task, [data] * len(sheets), sheets,
+                                       [columns] * len(sheets)))
+
+    if len(frames) == 1:
+        return frames[0]
+    if sheet_col:
+        frames = [f.assign(**{sheet_col: s}) for f, s in zip(frames, sheets)]
+    return pd.concat(frames, ignore_index=True)
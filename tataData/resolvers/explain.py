@@ -0,0 +1,231 @@
+"""
+Explain resolver - Handles the logistic scoring model and batch per-customer reason codes
+"""
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+
+from resolvers import feature_store, mlpipeline
+
+
+DEFAULT_TOP_K = 4
+DEFAULT_CHUNK_ROWS = 250_000
+NO_REASON = -1
+
+
+# ===== MODEL FUNCTIONS =====
+
+def fit_explainable_model(df: pd.DataFrame, target_col: str, C: float = 1.0,
+                          class_weight: str = "balanced", max_iter: int = 1000,
+                          fingerprint: str = None, cache_dir=None) -> dict:
+    """
+    Fit the chosen logistic regression on standardised features.
+
+    Standardising first makes each coefficient the change in log-odds per
+    standard deviation, so coefficient x standardised value is comparable
+    across features and sums (plus the intercept) to the customer's log-odds.
+    Features come from the feature store, so they are built at most once per
+    dataset and pipeline version.
+
+    Args:
+        df: Training dataframe
+        target_col: Target column name
+        C: Inverse regularisation strength
+        class_weight: Passed to LogisticRegression
+        max_iter: Solver iteration limit
+        fingerprint: Dataset fingerprint (computed from df if omitted)
+        cache_dir: Feature store directory
+
+    Returns:
+        Model dictionary with the preprocessor, feature names, scaling and coefficients
+    """
+    feature_set = feature_store.get_or_build_feature_set(df, target_col, fingerprint, cache_dir)
+    manifest = feature_set["manifest"]
+    names, preprocessor = manifest["feature_names"], manifest["preprocessor"]
+    X = feature_store.get_matrix(feature_set, names)
+    y = np.asarray(feature_set["target"])
+    mean = X.mean(axis=0, dtype=np.float64).astype(np.float32)
+    scale = X.std(axis=0, dtype=np.float64).astype(np.float32)
+    scale[scale == 0] = 1.0
+
+    model = LogisticRegression(C=C, class_weight=class_weight, max_iter=max_iter)
+    model.fit((X - mean) / scale, y)
+
+    return {
+        "preprocessor": preprocessor,
+        "feature_names": names,
+        "mean": mean,
+        "scale": scale,
+        "coef": model.coef_.ravel().astype(np.float32),
+        "intercept": float(model.intercept_[0]),
+        "reason_labels": get_reason_labels(names),
+        "feature_set": manifest["key"],
+    }
+
+
+def get_reason_labels(feature_names: list) -> np.ndarray:
+    """
+    Build the reason text for every feature and direction.
+
+    Returns:
+        Object array of shape (features, 2): column 0 is used when the
+        customer is below average on the feature, column 1 when above
+    """
+    labels = np.empty((len(feature_names), 2), dtype=object)
+    for i, name in enumerate(feature_names):
+        if "=" in name:
+            col, category = name.split("=", 1)
+            labels[i] = (f"{col} is not {category}", f"{col} is {category}")
+        elif name.startswith("Month_"):
+            labels[i] = (f"Better payment status in {name}", f"Worse payment status in {name}")
+        else:
+            labels[i] = (f"Low {name}", f"High {name}")
+    return labels
+
+
+# ===== EXPLANATION FUNCTIONS =====
+
+def _top_k(contributions: np.ndarray, k: int) -> np.ndarray:
+    """Column indices of the k largest contributions per row, largest first."""
+    if k >= contributions.shape[1]:
+        top = np.argsort(-contributions, axis=1)
+        return top[:, :k]
+    top = np.argpartition(-contributions, k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.take_along_axis(contributions, top, axis=1), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def explain_batch(X: np.ndarray, model: dict, top_k: int = DEFAULT_TOP_K,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS, adverse_only: bool = True) -> dict:
+    """
+    Score a feature matrix and find each row's top contributing features.
+
+    Rows are processed in chunks: each chunk is standardised, multiplied by the
+    coefficients into a contribution matrix, and argpartition picks the top-k
+    columns for every row at once. The row sums of the contribution matrix
+    give the log-odds, so scoring comes for free.
+
+    Args:
+        X: Feature matrix from mlpipeline.transform_features()
+        model: Output of fit_explainable_model()
+        top_k: Reason codes per customer
+        chunk_rows: Rows per chunk (bounds peak memory)
+        adverse_only: Blank out reasons that lower the risk (NO_REASON)
+
+    Returns:
+        Dictionary with probabilities, codes (feature indices), directions
+        (True = above average) and contributions, each with one row per customer
+    """
+    n = X.shape[0]
+    k = min(top_k, X.shape[1])
+    probabilities = np.empty(n, dtype=np.float64)
+    codes = np.empty((n, k), dtype=np.int32)
+    directions = np.empty((n, k), dtype=bool)
+    contributions = np.empty((n, k), dtype=np.float32)
+
+    for start in range(0, n, chunk_rows):
+        stop = min(start + chunk_rows, n)
+        z = (np.asarray(X[start:stop], dtype=np.float32) - model["mean"]) / model["scale"]
+        contrib = z * model["coef"]
+
+        log_odds = contrib.sum(axis=1, dtype=np.float64) + model["intercept"]
+        probabilities[start:stop] = 1 / (1 + np.exp(-log_odds))
+
+        top = _top_k(contrib, k)
+        codes[start:stop] = top
+        directions[start:stop] = np.take_along_axis(z, top, axis=1) > 0
+        contributions[start:stop] = np.take_along_axis(contrib, top, axis=1)
+
+    if adverse_only:
+        codes[contributions <= 0] = NO_REASON
+    return {
+        "probabilities": probabilities,
+        "codes": codes,
+        "directions": directions,
+        "contributions": contributions,
+    }
+
+
+def explain_dataframe(df: pd.DataFrame, model: dict, top_k: int = DEFAULT_TOP_K, **kwargs) -> dict:
+    """Transform a dataframe with the model's preprocessor and explain every row."""
+    X, _ = mlpipeline.transform_features(df, model["preprocessor"])
+    return explain_batch(X, model, top_k, **kwargs)
+
+
+def explain_feature_set(feature_set: dict, model: dict, top_k: int = DEFAULT_TOP_K,
+                        chunk_rows: int = DEFAULT_CHUNK_ROWS, **kwargs) -> dict:
+    """
+    Explain every row of a stored feature set (feature_store.open_feature_set()).
+
+    Rows are read from the memory-mapped columns one chunk at a time, so the
+    training data is scored without re-running the preprocessing.
+    """
+    n = len(feature_set["target"])
+    parts = [
+        explain_batch(feature_store.get_matrix(feature_set, model["feature_names"],
+                                               slice(start, min(start + chunk_rows, n))),
+                      model, top_k, chunk_rows, **kwargs)
+        for start in range(0, max(n, 1), chunk_rows)
+    ]
+    return {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+
+# ===== REPORTING FUNCTIONS =====
+
+def get_reason_code_frame(explanation: dict, model: dict, rows=None, ids=None) -> pd.DataFrame:
+    """
+    Render reason codes as text for a (small) selection of customers.
+
+    Args:
+        explanation: Output of explain_batch()
+        model: Output of fit_explainable_model()
+        rows: Row positions to render (defaults to all)
+        ids: Optional customer IDs aligned with the selected rows
+
+    Returns:
+        DataFrame with the delinquency probability and Reason_1..Reason_k columns
+    """
+    rows = np.arange(len(explanation["probabilities"])) if rows is None else np.asarray(rows)
+    codes = explanation["codes"][rows]
+    directions = explanation["directions"][rows].astype(np.intp)
+
+    text = model["reason_labels"][np.maximum(codes, 0), directions]
+    text[codes == NO_REASON] = None
+
+    frame = pd.DataFrame(text, columns=[f"Reason_{i + 1}" for i in range(codes.shape[1])])
+    frame.insert(0, "Delinquency_Probability", explanation["probabilities"][rows])
+    if ids is not None:
+        frame.insert(0, mlpipeline.ID_COLUMNS[0], np.asarray(ids))
+    return frame
+
+
+def summarize_reason_codes(explanation: dict, model: dict, threshold: float = None) -> pd.DataFrame:
+    """
+    Count how often each reason appears across the portfolio.
+
+    Args:
+        explanation: Output of explain_batch()
+        model: Output of fit_explainable_model()
+        threshold: Only count customers with probability >= threshold
+
+    Returns:
+        DataFrame with the count of each reason as the primary and as any top-k reason
+    """
+    codes, directions = explanation["codes"], explanation["directions"]
+    if threshold is not None:
+        keep = explanation["probabilities"] >= threshold
+        codes, directions = codes[keep], directions[keep]
+
+    n_labels = model["reason_labels"].size
+    cells = codes * 2 + directions
+    valid = codes != NO_REASON
+    primary = np.bincount(cells[:, 0][valid[:, 0]], minlength=n_labels) if codes.size else np.zeros(n_labels)
+    any_rank = np.bincount(cells[valid], minlength=n_labels)
+
+    summary = pd.DataFrame({
+        "Reason": model["reason_labels"].ravel(),
+        "Primary Reason": primary,
+        "Any Top Reason": any_rank,
+    })
+    summary = summary[summary["Any Top Reason"] > 0]
+    return summary.sort_values(["Primary Reason", "Any Top Reason"], ascending=False).reset_index(drop=True)
@@ -0,0 +1,247 @@
+"""
+Feature store resolver - Persists processed feature matrices as memory-mapped column files
+"""
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from resolvers import mlpipeline, result_store
+
+
+DEFAULT_FEATURE_DIR = result_store.DEFAULT_CACHE_DIR / "features"
+MANIFEST_FILENAME = "manifest.json"
+STORE_FORMAT = 1
+TEMP_GRACE_SECONDS = 24 * 3600  # build directories younger than this may belong to a running builder
+
+
+# ===== VERSION FUNCTIONS =====
+
+def get_pipeline_version() -> str:
+    """
+    Version of the feature pipeline, derived from the preprocessing source.
+
+    Changing build_feature_matrix() or the fit_preprocessor() and
+    transform_features() helpers it calls produces a new version, so
+    feature sets built by older code are never reused.
+    """
+    return result_store.function_version(mlpipeline.build_feature_matrix)
+
+
+def get_feature_set_key(fingerprint: str, target_col: str, version: str = None) -> str:
+    """Directory name of a feature set: dataset fingerprint, target and pipeline version."""
+    version = version or get_pipeline_version()
+    target = hashlib.blake2b(target_col.encode(), digest_size=4).hexdigest()
+    return f"{fingerprint}-{target}-{version}"
+
+
+def _to_json(preprocessor: dict) -> dict:
+    """Make a fitted preprocessor JSON-serialisable (tuples become lists)."""
+    return json.loads(json.dumps(preprocessor, default=str))
+
+
+# ===== BUILD FUNCTIONS =====
+
+def build_feature_set(df: pd.DataFrame, target_col: str, fingerprint: str = None, cache_dir=None) -> dict:
+    """
+    Build the processed feature matrix once and store it column by column.
+
+    Each feature, the target and the customer IDs are written as separate
+    .npy files next to a JSON manifest. Everything is written into a private
+    temporary directory that is renamed into place at the end, so readers
+    never see a half-written set and concurrent builders cannot corrupt it.
+    If the set already exists it is returned without rebuilding.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        fingerprint: Dataset fingerprint (computed from df if omitted)
+        cache_dir: Root directory of the store (defaults to DEFAULT_FEATURE_DIR)
+
+    Returns:
+        Manifest dictionary of the feature set
+    """
+    fingerprint = fingerprint or result_store.fingerprint_dataframe(df)
+    version = get_pipeline_version()
+    root = Path(cache_dir or DEFAULT_FEATURE_DIR)
+    key = get_feature_set_key(fingerprint, target_col, version)
+    final_dir = root / key
+
+    manifest = read_manifest(final_dir)
+    if manifest is not None:
+        return manifest
+
+    X, y, names, preprocessor, rows = mlpipeline.build_feature_matrix(df, target_col)
+    tmp_dir = root / f".{key}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp"
+    tmp_dir.mkdir(parents=True)
+    try:
+        files = {}
+        for i, name in enumerate(names):
+            files[name] = f"f{i:04d}.npy"
+            np.save(tmp_dir / files[name], np.ascontiguousarray(X[:, i]))
+        np.save(tmp_dir / "target.npy", y)
+
+        id_col = next((c for c in mlpipeline.ID_COLUMNS if c in df.columns), None)
+        if id_col is not None:
+            np.save(tmp_dir / "ids.npy", df[id_col].iloc[rows].astype(str).to_numpy().astype(str))
+
+        manifest = {
+            "format": STORE_FORMAT,
+            "key": key,
+            "fingerprint": fingerprint,
+            "target_col": target_col,
+            "pipeline_version": version,
+            "created": time.time(),
+            "n_rows": int(X.shape[0]),
+            "n_unlabelled": int(len(df) - rows.size),  # rows dropped for a missing or non-numeric target
+            "dtype": str(X.dtype),
+            "feature_names": names,
+            "files": files,
+            "id_col": id_col,
+            "preprocessor": _to_json(preprocessor),
+        }
+        # The manifest is written last: a directory without one is incomplete
+        (tmp_dir / MANIFEST_FILENAME).write_text(json.dumps(manifest))
+
+        try:
+            os.rename(tmp_dir, final_dir)
+        except OSError:
+            # Another process published the same set first; use theirs
+            if read_manifest(final_dir) is None:
+                raise
+    finally:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return read_manifest(final_dir)
+
+
+def read_manifest(path) -> dict:
+    """Read a feature set's manifest, or None if the set does not exist (or is from an older format)."""
+    manifest_path = Path(path) / MANIFEST_FILENAME
+    if not manifest_path.exists():
+        return None
+    manifest = json.loads(manifest_path.read_text())
+    if manifest.get("format") != STORE_FORMAT:
+        return None
+    manifest["path"] = str(Path(path))
+    return manifest
+
+
+# ===== READ FUNCTIONS =====
+
+def open_feature_set(manifest: dict, columns: list = None) -> dict:
+    """
+    Open a feature set zero-copy.
+
+    Every column is a read-only memory map, so opening costs no I/O until
+    values are touched and processes reading the same set share pages.
+
+    Args:
+        manifest: Output of build_feature_set() / read_manifest()
+        columns: Feature names to open (defaults to all)
+
+    Returns:
+        Dictionary with a name -> memmap mapping of features, the target, the IDs and the manifest
+    """
+    path = Path(manifest["path"])
+    names = columns or manifest["feature_names"]
+    unknown = [c for c in names if c not in manifest["files"]]
+    if unknown:
+        raise ValueError(f"Feature set has no columns {unknown}.")
+
+    ids_path = path / "ids.npy"
+    return {
+        "features": {name: np.load(path / manifest["files"][name], mmap_mode="r") for name in names},
+        "target": np.load(path / "target.npy", mmap_mode="r"),
+        "ids": np.load(ids_path, mmap_mode="r") if ids_path.exists() else None,
+        "manifest": manifest,
+    }
+
+
+def get_matrix(feature_set: dict, columns: list = None, rows=None) -> np.ndarray:
+    """
+    Assemble a 2-D float32 matrix (for model fitting) from the opened columns.
+
+    Only the requested columns and rows are read; the result is a copy.
+    """
+    names = columns or list(feature_set["features"])
+    if rows is None:
+        parts = [feature_set["features"][n] for n in names]
+    else:
+        parts = [feature_set["features"][n][rows] for n in names]
+    if not parts:
+        return np.empty((len(feature_set["target"]), 0), dtype=np.float32)
+    return np.column_stack(parts).astype(np.float32, copy=False)
+
+
+def get_or_build_feature_set(df: pd.DataFrame, target_col: str, fingerprint: str = None,
+                             cache_dir=None, columns: list = None) -> dict:
+    """Open the feature set for a dataset version, building it only on first use."""
+    return open_feature_set(build_feature_set(df, target_col, fingerprint, cache_dir), columns)
+
+
+def transform_with_feature_set(df: pd.DataFrame, manifest: dict) -> tuple:
+    """Transform new rows (e.g. for scoring) with the preprocessor stored in a feature set."""
+    return mlpipeline.transform_features(df, manifest["preprocessor"])
+
+
+# ===== MAINTENANCE FUNCTIONS =====
+
+def list_feature_sets(cache_dir=None) -> pd.DataFrame:
+    """Tabulate stored feature sets with their version, size and whether they match the current pipeline."""
+    root = Path(cache_dir or DEFAULT_FEATURE_DIR)
+    current = get_pipeline_version()
+    rows = []
+    for path in sorted(root.glob("*")) if root.exists() else []:
+        manifest = read_manifest(path)
+        if manifest is None:
+            continue
+        rows.append({
+            "Key": manifest["key"],
+            "Fingerprint": manifest["fingerprint"],
+            "Target": manifest["target_col"],
+            "Pipeline Version": manifest["pipeline_version"],
+            "Current": manifest["pipeline_version"] == current,
+            "Rows": manifest["n_rows"],
+            "Features": len(manifest["feature_names"]),
+            "Size (MB)": sum(f.stat().st_size for f in path.iterdir()) / 1024 ** 2,
+            "Created": pd.Timestamp(manifest["created"], unit="s"),
+        })
+    return pd.DataFrame(rows)
+
+
+def remove_stale_feature_sets(cache_dir=None, grace_seconds: float = TEMP_GRACE_SECONDS) -> int:
+    """
+    Delete feature sets built by an older pipeline version and abandoned build directories.
+
+    Temporary build directories are only removed once they are older than
+    grace_seconds, so a build still running in another process is left alone.
+    """
+    root = Path(cache_dir or DEFAULT_FEATURE_DIR)
+    if not root.exists():
+        return 0
+    current = get_pipeline_version()
+    cutoff = time.time() - grace_seconds
+    removed = 0
+    for path in root.iterdir():
+        if path.name.endswith(".tmp"):
+            try:
+                abandoned = path.stat().st_mtime < cutoff
+            except FileNotFoundError:  # published or cleaned up meanwhile
+                continue
+            if abandoned:
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+            continue
+        manifest = read_manifest(path)
+        if manifest is None or manifest["pipeline_version"] != current:
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+    return removed
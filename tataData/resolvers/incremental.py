@@ -0,0 +1,428 @@
+"""
+Incremental resolver - Handles mergeable aggregate state and delta refreshes of EDA results
+"""
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from resolvers import analyzer, drift, result_store
+
+
+STATE_VERSION = "3"
+DELTA_ACTION_COL = "Record_Action"
+DELETE_ACTIONS = {"delete", "deleted", "remove", "d"}
+
+
+# ===== STATE FUNCTIONS =====
+
+def init_state(sample: pd.DataFrame, target_col: str, id_col: str = "Customer_ID",
+               n_bins: int = drift.DEFAULT_BINS) -> dict:
+    """
+    Create an empty aggregate state whose layout is derived from a sample.
+
+    The sample fixes the column list, the numeric columns, a per-column shift
+    (the sample mean, which keeps co-moment sums numerically stable) and the
+    histogram edges used as quantile sketches.
+
+    Args:
+        sample: DataFrame with the dataset's schema (usually the base extract)
+        target_col: Target column name
+        id_col: Customer identifier used to match delta rows
+        n_bins: Number of histogram bins per numeric column
+
+    Returns:
+        State dictionary with zeroed accumulators
+    """
+    columns = [c for c in sample.columns if c != DELTA_ACTION_COL]
+    num_cols = [c for c in analyzer.get_numeric_columns(sample) if c != DELTA_ACTION_COL]
+    p = len(num_cols)
+
+    values = sample[num_cols].to_numpy(dtype=np.float64, na_value=np.nan) if p else np.empty((0, 0))
+    with np.errstate(invalid="ignore"):
+        shift = np.nan_to_num(np.nanmean(values, axis=0)) if len(sample) else np.zeros(p)
+
+    edges = [drift.quantile_edges(values[:, j], n_bins) for j in range(p)]
+
+    return {
+        "version": STATE_VERSION,
+        "columns": columns,
+        "numeric_cols": num_cols,
+        "target_col": target_col,
+        "id_col": id_col,
+        "n_rows": 0,
+        "missing": np.zeros(len(columns), dtype=np.int64),
+        "target_counts": {},
+        "shift": shift,
+        "pair_n": np.zeros((p, p)),
+        "pair_sum": np.zeros((p, p)),
+        "pair_sumsq": np.zeros((p, p)),
+        "cross": np.zeros((p, p)),
+        "hist_edges": edges,
+        "hist_counts": [np.zeros(e.size + 1, dtype=np.int64) for e in edges],
+        "id_positions": None,  # id -> row position in the matching frame; in memory only (see index_ids())
+    }
+
+
+def _update(state: dict, rows: pd.DataFrame, sign: int) -> None:
+    """Add (sign=1) or subtract (sign=-1) the contribution of rows in place."""
+    if rows.empty:
+        return
+
+    state["n_rows"] += sign * len(rows)
+
+    missing = np.array(
+        [rows[c].isna().sum() if c in rows.columns else len(rows) for c in state["columns"]],
+        dtype=np.int64,
+    )
+    state["missing"] += sign * missing
+
+    target_col = state["target_col"]
+    if target_col in rows.columns:
+        for value, count in rows[target_col].value_counts(dropna=True).items():
+            state["target_counts"][value] = state["target_counts"].get(value, 0) + sign * int(count)
+
+    num_cols = state["numeric_cols"]
+    if not num_cols:
+        return
+
+    values = rows.reindex(columns=num_cols).to_numpy(dtype=np.float64, na_value=np.nan)
+    present = ~np.isnan(values)
+    mask = present.astype(np.float64)
+    centered = np.where(present, values - state["shift"], 0.0)
+
+    # Pairwise-complete co-moments: entry [i, j] only counts rows where both i and j are present
+    state["pair_n"] += sign * (mask.T @ mask)
+    state["pair_sum"] += sign * (centered.T @ mask)
+    state["pair_sumsq"] += sign * ((centered * centered).T @ mask)
+    state["cross"] += sign * (centered.T @ centered)
+
+    for j, edges in enumerate(state["hist_edges"]):
+        state["hist_counts"][j] += sign * drift.bin_counts(values[:, j], edges)
+
+
+def add_rows(state: dict, rows: pd.DataFrame) -> dict:
+    """Add rows to the state (in place) and return it."""
+    _update(state, rows, 1)
+    return state
+
+
+def remove_rows(state: dict, rows: pd.DataFrame) -> dict:
+    """Remove previously added rows from the state (in place) and return it."""
+    _update(state, rows, -1)
+    return state
+
+
+def build_state(df: pd.DataFrame, target_col: str = None, id_col: str = "Customer_ID",
+                n_bins: int = drift.DEFAULT_BINS) -> dict:
+    """
+    Build the aggregate state for a full dataset.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column (auto-detected if None)
+        id_col: Customer identifier column
+        n_bins: Number of histogram bins per numeric column
+
+    Returns:
+        State dictionary
+    """
+    if target_col is None:
+        target_col = analyzer.get_target_column(df)
+    return add_rows(init_state(df, target_col, id_col, n_bins), df)
+
+
+def index_ids(state: dict, df: pd.DataFrame) -> dict:
+    """
+    Build the state's id -> row position map for the frame it describes.
+
+    The map has one entry per row, so it is rebuilt from the frame when
+    needed and never persisted (see persisted_state()). apply_delta() keeps
+    it up to date, so further deltas applied to the same in-memory state
+    are matched in time proportional to the delta.
+
+    Raises:
+        ValueError: If the id column is missing or holds duplicate IDs
+    """
+    id_col = state["id_col"]
+    if id_col not in df.columns:
+        raise ValueError(f"Dataset must contain the '{id_col}' column to apply a delta.")
+    ids = df[id_col]
+    duplicated = ids[ids.duplicated()]
+    if not duplicated.empty:
+        examples = ", ".join(map(str, duplicated.unique()[:5]))
+        raise ValueError(
+            f"Dataset has {len(duplicated):,} duplicate {id_col} values (e.g. {examples}). "
+            f"Delta rows are matched on {id_col}, so IDs must be unique."
+        )
+    state["id_positions"] = dict(zip(ids.tolist(), range(len(ids))))
+    return state["id_positions"]
+
+
+def merge_states(left: dict, right: dict) -> dict:
+    """
+    Combine two states built with the same layout (e.g. from init_state on a shared sample).
+
+    Returns:
+        New state holding the aggregates of both inputs
+    """
+    if left["columns"] != right["columns"] or left["numeric_cols"] != right["numeric_cols"]:
+        raise ValueError("Cannot merge states with different column layouts.")
+    if not np.array_equal(left["shift"], right["shift"]):
+        raise ValueError("Cannot merge states with different shifts; build them from a shared init_state().")
+
+    merged = dict(left)
+    merged["n_rows"] = left["n_rows"] + right["n_rows"]
+    merged["missing"] = left["missing"] + right["missing"]
+    merged["target_counts"] = dict(left["target_counts"])
+    for value, count in right["target_counts"].items():
+        merged["target_counts"][value] = merged["target_counts"].get(value, 0) + count
+    for key in ("pair_n", "pair_sum", "pair_sumsq", "cross"):
+        merged[key] = left[key] + right[key]
+    merged["hist_counts"] = [a + b for a, b in zip(left["hist_counts"], right["hist_counts"])]
+    merged["id_positions"] = None  # row positions are only known for the combined frame
+    return merged
+
+
+def persisted_state(state: dict) -> dict:
+    """Copy of a state without its id map, keeping the stored state O(columns^2) rather than O(rows)."""
+    return {**state, "id_positions": None}
+
+
+# ===== DELTA FUNCTIONS =====
+
+def split_delta(delta: pd.DataFrame, id_col: str = "Customer_ID") -> tuple:
+    """
+    Split a delta file into upserted rows and deleted customer IDs.
+
+    Rows whose Record_Action column says "delete" are deletions; every other
+    row (or every row, if the column is absent) is an insert or update.
+
+    Returns:
+        Tuple of (upserts DataFrame without the action column, array of deleted IDs)
+    """
+    if id_col not in delta.columns:
+        raise ValueError(f"Delta file must contain the '{id_col}' column.")
+
+    if DELTA_ACTION_COL in delta.columns:
+        is_delete = delta[DELTA_ACTION_COL].astype(str).str.strip().str.lower().isin(DELETE_ACTIONS)
+        deleted_ids = delta.loc[is_delete, id_col].to_numpy()
+        upserts = delta.loc[~is_delete].drop(columns=DELTA_ACTION_COL)
+    else:
+        deleted_ids = np.array([], dtype=object)
+        upserts = delta
+
+    # The last occurrence of an ID wins, as in a changelog
+    upserts = upserts.drop_duplicates(subset=id_col, keep="last")
+    return upserts, deleted_ids
+
+
+def apply_delta(state: dict, df: pd.DataFrame, delta: pd.DataFrame) -> tuple:
+    """
+    Apply a monthly delta to the data and its aggregate state.
+
+    Delta rows are matched through the state's id -> row position map (built
+    from df by index_ids() if the state has none) and the statistics are
+    updated by subtracting the old versions of touched rows and adding the
+    new ones, so aggregation is proportional to the delta size. Touched rows
+    leave the frame by swap-remove (the last untouched rows move into their
+    slots, so only those map entries change) and upserted rows are appended
+    at the end, keeping the map valid for the next delta.
+
+    Args:
+        state: State matching df (modified in place, including its id map)
+        df: Current dataset, in the row order the state's id map describes
+        delta: Delta rows matched on the state's id column
+
+    Returns:
+        Tuple of (updated DataFrame, updated state, summary dict)
+
+    Raises:
+        ValueError: If df lacks the id column or has duplicate IDs
+    """
+    id_col = state["id_col"]
+    upserts, deleted_ids = split_delta(delta, id_col)
+    positions = state.get("id_positions")
+    if positions is None or len(positions) != len(df):
+        positions = index_ids(state, df)
+
+    upsert_ids = upserts[id_col].tolist()
+    upsert_pos = np.array([positions.get(i, -1) for i in upsert_ids], dtype=np.int64)
+    upserted = set(upsert_ids)
+    delete_ids = [i for i in dict.fromkeys(deleted_ids.tolist()) if i not in upserted]
+    delete_pos = np.array([positions.get(i, -1) for i in delete_ids], dtype=np.int64)
+    deleted_found = delete_pos[delete_pos >= 0]
+    replaced = upsert_pos[upsert_pos >= 0]
+    touched = np.unique(np.r_[replaced, deleted_found])
+
+    remove_rows(state, df.iloc[touched])
+    add_rows(state, upserts)
+
+    # Swap-remove: untouched rows past the new end fill the touched slots below it
+    n_keep = len(df) - touched.size
+    holes = touched[touched < n_keep]
+    tail = np.arange(n_keep, len(df))
+    movers = np.setdiff1d(tail, touched, assume_unique=True)
+    order = np.arange(n_keep)
+    order[holes] = movers
+
+    id_values = df[id_col].to_numpy()
+    for i in id_values[touched].tolist():
+        del positions[i]
+    for hole, mover in zip(holes.tolist(), id_values[movers].tolist()):
+        positions[mover] = hole
+    for k, i in enumerate(upsert_ids):
+        positions[i] = n_keep + k
+
+    upserts = upserts.reindex(columns=df.columns)
+    try:
+        upserts = upserts.astype(df.dtypes.to_dict())
+    except (ValueError, TypeError):
+        pass  # keep inferred dtypes when the delta cannot be cast (e.g. new missing values)
+    new_df = pd.concat([df.take(order), upserts], ignore_index=True)
+
+    summary = {
+        "inserted": int((upsert_pos < 0).sum()),
+        "updated": int(replaced.size),
+        "deleted": int(deleted_found.size),
+        "unknown_deletes": int((delete_pos < 0).sum()),
+        "total_records": state["n_rows"],
+    }
+    return new_df, state, summary
+
+
+# ===== RESULT FUNCTIONS =====
+
+def state_missing_data(state: dict) -> pd.DataFrame:
+    """Missing data statistics in the format of analyzer.analyze_missing_data()."""
+    missing = pd.Series(state["missing"], index=state["columns"]).rename("Missing Count").to_frame()
+    missing["Missing %"] = (missing["Missing Count"] / max(state["n_rows"], 1)) * 100
+    missing = missing[missing["Missing Count"] > 0].sort_values("Missing %", ascending=False)
+    return missing
+
+
+def state_target_distribution(state: dict) -> tuple:
+    """Target distribution in the format of analyzer.get_target_distribution()."""
+    counts = {value: count for value, count in state["target_counts"].items() if count > 0}
+    target_missing = state["missing"][state["columns"].index(state["target_col"])]
+
+    target_counts = pd.Series(counts, name="count", dtype=np.int64)
+    target_counts.index.name = state["target_col"]
+    target_counts = target_counts.sort_index()
+    if target_missing > 0:
+        target_counts.loc[np.nan] = target_missing
+
+    target_pct = (target_counts / target_counts.sum() * 100).round(2)
+    target_df = pd.DataFrame({
+        "Value": target_counts.index,
+        "Count": target_counts.values,
+        "Percentage": target_pct.values
+    })
+    return target_df, target_counts
+
+
+def state_correlation_matrix(state: dict) -> pd.DataFrame:
+    """Pairwise-complete Pearson correlation matrix, as DataFrame.corr() would give."""
+    n = state["pair_n"]
+    s = state["pair_sum"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = state["cross"] - s * s.T / n
+        var = state["pair_sumsq"] - s * s / n
+        corr = cov / np.sqrt(var * var.T)
+    corr = np.clip(corr, -1, 1)
+    np.fill_diagonal(corr, np.where(np.diag(n) > 1, 1.0, np.nan))
+    return pd.DataFrame(corr, index=state["numeric_cols"], columns=state["numeric_cols"])
+
+
+def state_correlation_with_target(state: dict) -> pd.Series:
+    """Feature correlations in the format of analyzer.get_correlation_with_target()."""
+    target_col = state["target_col"]
+    if target_col not in state["numeric_cols"]:
+        return pd.Series(dtype=float)
+    corr = state_correlation_matrix(state)[target_col]
+    return corr.drop(target_col).sort_values(ascending=False)
+
+
+def state_quantiles(state: dict, col: str, qs=(0.05, 0.25, 0.5, 0.75, 0.95)) -> pd.Series:
+    """Approximate quantiles of a numeric column from the state's histogram sketch."""
+    j = state["numeric_cols"].index(col)
+    counts = state["hist_counts"][j]
+    edges = state["hist_edges"][j]
+    total = counts.sum()
+    if total == 0 or edges.size == 0:
+        return pd.Series(np.nan, index=list(qs), name=col)
+
+    # Outer bins are open-ended; bound them by extending one bin width
+    width = (edges[-1] - edges[0]) / max(edges.size - 1, 1)
+    bounds = np.r_[edges[0] - width, edges, edges[-1] + width]
+    cdf = np.r_[0, np.cumsum(counts)] / total
+    return pd.Series(np.interp(qs, cdf, bounds), index=list(qs), name=col)
+
+
+# ===== REFRESH FUNCTIONS =====
+
+def combine_fingerprints(base: str, delta: str) -> str:
+    """Fingerprint of a dataset produced by applying a delta to a base dataset."""
+    return hashlib.blake2b(f"{base}+{delta}".encode(), digest_size=16).hexdigest()
+
+
+def publish_results(state: dict, fingerprint: str, cache_dir=None) -> None:
+    """
+    Write state-derived results to the result store under analyzer function versions.
+
+    The EDA view then reads these entries instead of recomputing them from the frame.
+    """
+    target_params = {"target_col": state["target_col"]}
+    entries = [
+        (analyzer.analyze_missing_data, {}, state_missing_data(state)),
+        (analyzer.get_target_distribution, target_params, state_target_distribution(state)),
+        (analyzer.get_correlation_with_target, target_params, state_correlation_with_target(state)),
+        (analyzer.get_correlation_matrix, {}, state_correlation_matrix(state)),
+    ]
+    for func, params, value in entries:
+        result_store.put_result(
+            fingerprint, func.__qualname__, result_store.function_version(func),
+            value, params, cache_dir,
+        )
+
+
+def incremental_refresh(df: pd.DataFrame, fingerprint: str, delta: pd.DataFrame,
+                        delta_fingerprint: str, target_col: str = None, cache_dir=None) -> tuple:
+    """
+    Refresh a dataset with a monthly delta, reusing the stored aggregate state.
+
+    The state for fingerprint is read from the result store (built once if
+    missing), the delta is applied, and the new state plus its EDA results
+    are stored under the combined fingerprint. Chained deltas pass the
+    returned frame and fingerprint to the next call, so each refresh starts
+    from the stored state of the previous one.
+
+    Args:
+        df: Dataset described by fingerprint (a base upload, or the frame
+            returned by an earlier refresh)
+        fingerprint: Content hash of the base dataset, or the combined
+            fingerprint returned by an earlier refresh
+        delta: Delta rows
+        delta_fingerprint: Content hash of the delta file
+        target_col: Target column (auto-detected if None)
+        cache_dir: Result store directory
+
+    Returns:
+        Tuple of (updated DataFrame, new fingerprint, summary dict)
+    """
+    if target_col is None:
+        target_col = analyzer.get_target_column(df)
+
+    params = {"target_col": target_col}
+    state = result_store.cached_result(
+        fingerprint, "incremental_state", STATE_VERSION,
+        lambda: build_state(df, target_col), params, cache_dir,
+    )
+
+    new_df, state, summary = apply_delta(state, df, delta)
+    new_fingerprint = combine_fingerprints(fingerprint, delta_fingerprint)
+
+    result_store.put_result(new_fingerprint, "incremental_state", STATE_VERSION,
+                            persisted_state(state), params, cache_dir)
+    publish_results(state, new_fingerprint, cache_dir)
+    return new_df, new_fingerprint, summary
@@ -0,0 +1,156 @@
+"""
+Lookup resolver - Handles the hashed Customer_ID index and point/bulk customer lookups
+"""
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+ID_COL = "Customer_ID"
+PAYMENT_HISTORY_PREFIX = "Month_"
+SCORE_COLS = ["Credit_Score"]
+
+
+# ===== INDEX FUNCTIONS =====
+
+def build_customer_index(df: pd.DataFrame, id_col: str = ID_COL) -> dict:
+    """
+    Build a hash index from customer ID to row position.
+
+    If an ID appears more than once, its last occurrence wins. The hash table
+    is built eagerly so the first lookup does not pay for it.
+
+    Args:
+        df: Input dataframe
+        id_col: Customer identifier column
+
+    Returns:
+        Dictionary with the pandas Index over IDs, the row positions it maps to
+        and the number of duplicate IDs dropped
+    """
+    if id_col not in df.columns:
+        raise ValueError(f"Dataset has no '{id_col}' column to index.")
+
+    ids = df[id_col].astype(str)
+    keep = ~ids.duplicated(keep="last").to_numpy()
+    index = pd.Index(ids.to_numpy()[keep])
+    index.get_indexer(index[:1])  # force the hash table to be built now
+
+    return {
+        "id_col": id_col,
+        "index": index,
+        "positions": np.flatnonzero(keep),
+        "duplicates": int((~keep).sum()),
+    }
+
+
+def _month_number(col: str) -> int:
+    """Month number from a Month_N column name (0 if not numeric)."""
+    suffix = col[len(PAYMENT_HISTORY_PREFIX):]
+    return int(suffix) if suffix.isdigit() else 0
+
+
+def get_payment_history_columns(df: pd.DataFrame) -> list:
+    """Get the monthly payment status columns (Month_1..Month_N) in month order."""
+    cols = [c for c in df.columns if str(c).startswith(PAYMENT_HISTORY_PREFIX)]
+    return sorted(cols, key=_month_number)
+
+
+def get_positions(customer_index: dict, ids) -> np.ndarray:
+    """Map customer IDs to row positions (-1 for unknown IDs)."""
+    ids = pd.Index([str(i) for i in ids])
+    found = customer_index["index"].get_indexer(ids)
+    return np.where(found >= 0, customer_index["positions"][found], -1)
+
+
+# ===== LOOKUP FUNCTIONS =====
+
+def lookup_customer(df: pd.DataFrame, customer_index: dict, customer_id, scores=None) -> dict:
+    """
+    Look up a single customer by ID.
+
+    Args:
+        df: Indexed dataframe
+        customer_index: Output of build_customer_index()
+        customer_id: ID to look up
+        scores: Optional array of model probabilities aligned with df's rows
+
+    Returns:
+        Dictionary with features, payment history, payment status counts and
+        scores, or None if the ID is unknown
+    """
+    position = get_positions(customer_index, [customer_id])[0]
+    if position < 0:
+        return None
+
+    row = df.iloc[position]
+    history_cols = get_payment_history_columns(df)
+    feature_cols = [c for c in df.columns if c not in history_cols and c != customer_index["id_col"]]
+    history = row[history_cols]
+
+    customer_scores = {c: row[c] for c in SCORE_COLS if c in df.columns}
+    if scores is not None:
+        customer_scores["Delinquency_Probability"] = float(np.asarray(scores)[position])
+
+    return {
+        "customer_id": str(customer_id),
+        "row": int(position),
+        "features": row[feature_cols],
+        "payment_history": history,
+        "payment_summary": history.value_counts(),
+        "scores": customer_scores,
+    }
+
+
+def bulk_lookup(df: pd.DataFrame, customer_index: dict, ids, scores=None) -> tuple:
+    """
+    Look up many customers with a single vectorised index probe.
+
+    Args:
+        df: Indexed dataframe
+        customer_index: Output of build_customer_index()
+        ids: Iterable of customer IDs
+        scores: Optional array of model probabilities aligned with df's rows
+
+    Returns:
+        Tuple of (DataFrame of found customers in request order, list of unknown IDs)
+    """
+    ids = [str(i).strip() for i in ids]
+    positions = get_positions(customer_index, ids)
+    found = positions >= 0
+
+    result = df.iloc[positions[found]]
+    if scores is not None:
+        result = result.assign(Delinquency_Probability=np.asarray(scores)[positions[found]])
+
+    missing = [i for i, ok in zip(ids, found) if not ok]
+    return result, missing
+
+
+def read_id_list(src, id_col: str = ID_COL) -> list:
+    """
+    Read a list of customer IDs from a file path or uploaded file.
+
+    CSV/Excel files must contain the ID column; any other file is read as
+    plain text with one ID per line.
+    """
+    if hasattr(src, "name") and not isinstance(src, (str, Path)):
+        name = src.name
+    else:
+        name = str(src)
+    name_lower = name.lower()
+
+    if name_lower.endswith((".csv", ".xlsx", ".xls", ".xlsm")):
+        reader = pd.read_csv if name_lower.endswith(".csv") else pd.read_excel
+        frame = reader(src, dtype={id_col: str})
+        if id_col not in frame.columns:
+            raise ValueError(f"ID file '{name}' has no '{id_col}' column.")
+        ids = frame[id_col].dropna()
+    else:
+        content = src.read() if hasattr(src, "read") else Path(src).read_bytes()
+        if isinstance(content, bytes):
+            content = content.decode("utf-8-sig")
+        ids = pd.Series(content.split())
+
+    return [i for i in ids.astype(str).str.strip().tolist() if i]
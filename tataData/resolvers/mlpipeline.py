@@ -33,6 +33,128 @@ def get_imputation_recommendations() -> dict:
     }
 
 
+ID_COLUMNS = ["Customer_ID"]
+PAYMENT_STATUS_SCORES = {"On-time": 0, "Late": 1, "Missed": 2}
+INTERACTION_TERMS = [
+    ("Credit_Utilization", "Missed_Payments"),
+    ("Debt_to_Income_Ratio", "Credit_Score"),
+    ("Income", "Age"),
+]
+
+
+def fit_preprocessor(df: pd.DataFrame, target_col: str) -> dict:
+    """
+    Learn the preprocessing parameters from training data.
+
+    Follows the imputation plan above: Income medians per Employment_Status,
+    straight medians for the other numeric columns. Payment history columns
+    (Month_*) are scored ordinally and other text columns are one-hot encoded.
+
+    Args:
+        df: Training dataframe
+        target_col: Target column name
+
+    Returns:
+        Dictionary with the fitted medians, group medians and categories
+    """
+    feature_cols = [c for c in df.columns if c != target_col and c not in ID_COLUMNS]
+    payment_cols = [c for c in feature_cols if str(c).startswith("Month_")]
+    numeric_cols = [c for c in feature_cols
+                    if c not in payment_cols and pd.api.types.is_numeric_dtype(df[c])]
+    categorical_cols = [c for c in feature_cols if c not in payment_cols and c not in numeric_cols]
+
+    group_medians = {}
+    if "Income" in numeric_cols and "Employment_Status" in df.columns:
+        by_status = df.groupby("Employment_Status")["Income"].median()
+        group_medians["Income"] = ("Employment_Status", by_status.to_dict())
+
+    return {
+        "target_col": target_col,
+        "numeric_cols": numeric_cols,
+        "payment_cols": payment_cols,
+        "categorical_cols": categorical_cols,
+        "medians": df[numeric_cols].median().to_dict(),
+        "group_medians": group_medians,
+        "categories": {c: sorted(df[c].dropna().astype(str).unique()) for c in categorical_cols},
+        "interactions": [(a, b) for a, b in INTERACTION_TERMS if a in numeric_cols and b in numeric_cols],
+    }
+
+
+def transform_features(df: pd.DataFrame, preprocessor: dict) -> tuple:
+    """
+    Apply a fitted preprocessor to produce a float32 feature matrix.
+
+    Args:
+        df: Dataframe to transform
+        preprocessor: Output of fit_preprocessor()
+
+    Returns:
+        Tuple of (feature matrix as float32 ndarray, list of feature names)
+    """
+    n = len(df)
+    columns, names = [], []
+
+    for col in preprocessor["numeric_cols"]:
+        values = df[col].astype(np.float64)
+        if col in preprocessor["group_medians"]:
+            group_col, medians = preprocessor["group_medians"][col]
+            values = values.fillna(df[group_col].map(medians))
+        values = values.fillna(preprocessor["medians"][col]).fillna(0)
+        columns.append(values.to_numpy(dtype=np.float32))
+        names.append(col)
+
+    for a, b in preprocessor["interactions"]:
+        columns.append(columns[names.index(a)] * columns[names.index(b)])
+        names.append(f"{a} x {b}")
+
+    for col in preprocessor["payment_cols"]:
+        scores = df[col].map(PAYMENT_STATUS_SCORES).fillna(0)
+        columns.append(scores.to_numpy(dtype=np.float32))
+        names.append(col)
+
+    for col in preprocessor["categorical_cols"]:
+        values = df[col].astype(str).to_numpy()
+        for category in preprocessor["categories"][col]:
+            columns.append((values == category).astype(np.float32))
+            names.append(f"{col}={category}")
+
+    X = np.column_stack(columns) if columns else np.empty((n, 0), dtype=np.float32)
+    return X.astype(np.float32, copy=False), names
+
+
+def build_feature_matrix(df: pd.DataFrame, target_col: str) -> tuple:
+    """
+    Fit the preprocessor and transform the labelled rows of a dataset.
+
+    Rows whose target is missing or not numeric are dropped rather than
+    given a label, so they never enter training or evaluation as
+    non-delinquent.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+
+    Returns:
+        Tuple of (X float32 matrix, y int8 labels, feature names, preprocessor,
+        positions of the kept rows in df)
+
+    Raises:
+        ValueError: If no row has a numeric target
+    """
+    labels = pd.to_numeric(df[target_col], errors="coerce")
+    labelled = labels.notna().to_numpy()
+    if not labelled.any():
+        raise ValueError(f"Target column '{target_col}' has no numeric labels.")
+    rows = np.flatnonzero(labelled)
+    if rows.size < len(df):
+        df = df.iloc[rows]
+
+    preprocessor = fit_preprocessor(df, target_col)
+    X, names = transform_features(df, preprocessor)
+    y = labels.to_numpy()[rows].astype(np.int8)
+    return X, y, names, preprocessor, rows
+
+
 # ===== MODEL SELECTION FUNCTIONS =====
 
 def get_model_recommendations(df: pd.DataFrame, target_col: str) -> dict:
@@ -0,0 +1,294 @@
+"""
+Outliers resolver - Handles vectorized outlier checks, business rule checks and per-row flag bitmasks
+"""
+import numpy as np
+import pandas as pd
+
+from resolvers import analyzer, drift, mlpipeline
+
+
+IQR_MULTIPLIER = 1.5
+ROBUST_Z_THRESHOLD = 3.5
+MAD_TO_SIGMA = 1.4826  # scales MAD to a normal standard deviation
+BITS_PER_WORD = 64
+
+# (name, column, lower bound, upper bound); None = unbounded
+DEFAULT_RULES = [
+    ("Credit_Utilization outside [0, 1]", "Credit_Utilization", 0.0, 1.0),
+    ("Negative Loan_Balance", "Loan_Balance", 0.0, None),
+    ("Age outside [18, 100]", "Age", 18, 100),
+    ("Negative Income", "Income", 0.0, None),
+    ("Credit_Score outside [300, 850]", "Credit_Score", 300, 850),
+    ("Negative Debt_to_Income_Ratio", "Debt_to_Income_Ratio", 0.0, None),
+    ("Negative Missed_Payments", "Missed_Payments", 0, None),
+    ("Negative Account_Tenure", "Account_Tenure", 0, None),
+]
+
+
+# ===== STATISTICS FUNCTIONS =====
+
+def get_outlier_columns(df: pd.DataFrame, target_col: str = None, exclude: list = None) -> list:
+    """Numeric columns eligible for statistical outlier checks (target and IDs excluded)."""
+    exclude = set(exclude or []) | set(mlpipeline.ID_COLUMNS) | {target_col}
+    return [c for c in analyzer.get_numeric_columns(df) if c not in exclude]
+
+
+def compute_outlier_stats(df: pd.DataFrame, columns: list = None, iqr_k: float = IQR_MULTIPLIER) -> pd.DataFrame:
+    """
+    Compute quartiles, IQR fences, median and MAD for numeric columns.
+
+    Args:
+        df: Input dataframe
+        columns: Columns to profile (defaults to all numeric columns)
+        iqr_k: IQR multiplier for the Tukey fences
+
+    Returns:
+        DataFrame indexed by column with q1, median, q3, iqr, lower_fence,
+        upper_fence and mad
+    """
+    if columns is None:
+        columns = analyzer.get_numeric_columns(df)
+
+    rows = {}
+    for col in columns:
+        values = drift.numeric_values(df[col])
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            continue
+        q1, median, q3 = np.percentile(values, [25, 50, 75])
+        mad = np.median(np.abs(values - median))
+        rows[col] = {"q1": q1, "median": median, "q3": q3, "mad": mad}
+
+    return _with_fences(pd.DataFrame.from_dict(rows, orient="index"), iqr_k)
+
+
+def stats_from_profile(profile: dict, iqr_k: float = IQR_MULTIPLIER) -> pd.DataFrame:
+    """
+    Approximate the same statistics from a streaming drift profile.
+
+    Quartiles are interpolated from the profile's quantile histogram, and the
+    MAD is the weighted median of |bin center - median|, so no second pass
+    over the data is needed to get the robust scale.
+    """
+    rows = {}
+    for col, stats in profile["numeric"].items():
+        counts = stats["counts"]
+        if counts.sum() == 0:
+            continue
+        q1, median, q3 = drift.approximate_quantiles(profile, col, (0.25, 0.5, 0.75)).to_numpy()
+
+        bounds = np.clip(np.r_[stats["min"], stats["edges"], stats["max"]], stats["min"], stats["max"])
+        centers = (bounds[:-1] + bounds[1:]) / 2
+        deviation = np.abs(centers - median)
+        order = np.argsort(deviation)
+        cdf = np.cumsum(counts[order]) / counts.sum()
+        mad = deviation[order][np.searchsorted(cdf, 0.5)]
+        rows[col] = {"q1": q1, "median": median, "q3": q3, "mad": mad}
+
+    return _with_fences(pd.DataFrame.from_dict(rows, orient="index"), iqr_k)
+
+
+def _with_fences(stats: pd.DataFrame, iqr_k: float) -> pd.DataFrame:
+    """Add IQR and Tukey fence columns to a statistics table."""
+    if stats.empty:
+        return pd.DataFrame(columns=["q1", "median", "q3", "mad", "iqr", "lower_fence", "upper_fence"])
+    stats["iqr"] = stats["q3"] - stats["q1"]
+    stats["lower_fence"] = stats["q1"] - iqr_k * stats["iqr"]
+    stats["upper_fence"] = stats["q3"] + iqr_k * stats["iqr"]
+    return stats
+
+
+# ===== FLAG FUNCTIONS =====
+
+def build_checks(stats: pd.DataFrame, rules: list = None, columns: list = None) -> list:
+    """
+    List every check with its bit position.
+
+    Each statistical column gets an IQR check and a robust z-score check;
+    each applicable rule gets one check.
+
+    Returns:
+        List of dicts with bit, name, column, kind, lower and upper
+    """
+    if rules is None:
+        rules = DEFAULT_RULES
+
+    checks = []
+    for col, row in stats.iterrows():
+        checks.append({"name": f"{col} IQR outlier", "column": col, "kind": "iqr",
+                       "lower": row["lower_fence"], "upper": row["upper_fence"]})
+        checks.append({"name": f"{col} robust z-score", "column": col, "kind": "robust_z",
+                       "lower": row["median"], "upper": row["mad"] * MAD_TO_SIGMA})
+
+    for name, col, lower, upper in rules:
+        if columns is None or col in columns:
+            checks.append({"name": name, "column": col, "kind": "rule", "lower": lower, "upper": upper})
+
+    for bit, check in enumerate(checks):
+        check["bit"] = bit
+    return checks
+
+
+def _check_violations(values: np.ndarray, check: dict, z_threshold: float) -> np.ndarray:
+    """Boolean violations of one check on one column's values (NaN never violates)."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        if check["kind"] == "robust_z":
+            median, scale = check["lower"], check["upper"]
+            if not scale:
+                return np.zeros(values.shape, dtype=bool)
+            return np.abs(values - median) / scale > z_threshold
+
+        violations = np.zeros(values.shape, dtype=bool)
+        if check["lower"] is not None:
+            violations |= values < check["lower"]
+        if check["upper"] is not None:
+            violations |= values > check["upper"]
+        return violations
+
+
+def flag_rows(df: pd.DataFrame, checks: list, z_threshold: float = ROBUST_Z_THRESHOLD) -> np.ndarray:
+    """
+    Evaluate all checks into per-row bitmasks.
+
+    Each column is converted to a float array once and every check on it is
+    OR-ed into a uint64 word, so no per-check copies of the frame are made.
+
+    Args:
+        df: Input dataframe (or chunk)
+        checks: Output of build_checks()
+        z_threshold: Robust z-score threshold
+
+    Returns:
+        uint64 array of shape (rows, words); bit k of the flags is check k
+    """
+    n_words = max(1, -(-len(checks) // BITS_PER_WORD))
+    flags = np.zeros((len(df), n_words), dtype=np.uint64)
+
+    by_column = {}
+    for check in checks:
+        by_column.setdefault(check["column"], []).append(check)
+
+    for col, col_checks in by_column.items():
+        if col not in df.columns:
+            continue
+        values = drift.numeric_values(df[col])  # text markers in later chunks count as missing
+        for check in col_checks:
+            word, bit = divmod(check["bit"], BITS_PER_WORD)
+            violations = _check_violations(values, check, z_threshold)
+            flags[:, word] |= violations.astype(np.uint64) << np.uint64(bit)
+    return flags
+
+
+def count_flags(flags: np.ndarray, checks: list) -> np.ndarray:
+    """Number of rows violating each check."""
+    counts = np.zeros(len(checks), dtype=np.int64)
+    for check in checks:
+        word, bit = divmod(check["bit"], BITS_PER_WORD)
+        counts[check["bit"]] = np.count_nonzero(flags[:, word] & np.uint64(1 << bit))
+    return counts
+
+
+def summarize_flags(counts: np.ndarray, checks: list, n_rows: int) -> pd.DataFrame:
+    """Tabulate flagged rows per check."""
+    summary = pd.DataFrame({
+        "Check": [c["name"] for c in checks],
+        "Column": [c["column"] for c in checks],
+        "Type": [c["kind"] for c in checks],
+        "Flagged Rows": counts,
+        "Flagged %": counts / max(n_rows, 1) * 100,
+    })
+    return summary.sort_values("Flagged Rows", ascending=False).reset_index(drop=True)
+
+
+def decode_flags(flags: np.ndarray, checks: list) -> list:
+    """Names of the violated checks for each row of a (small) flags array."""
+    names = []
+    for row in flags:
+        names.append([
+            check["name"] for check in checks
+            if int(row[check["bit"] // BITS_PER_WORD]) >> (check["bit"] % BITS_PER_WORD) & 1
+        ])
+    return names
+
+
+# ===== DETECTION FUNCTIONS =====
+
+def detect_outliers(df: pd.DataFrame, target_col: str = None, rules: list = None,
+                    iqr_k: float = IQR_MULTIPLIER, z_threshold: float = ROBUST_Z_THRESHOLD) -> dict:
+    """
+    Run statistical and rule checks on an in-memory dataset.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column (excluded from statistical checks)
+        rules: Business rules as (name, column, lower, upper) tuples
+        iqr_k: IQR multiplier for the Tukey fences
+        z_threshold: Robust z-score threshold
+
+    Returns:
+        Dictionary with stats, checks, per-row flags, the summary table and
+        the number of rows with at least one flag
+    """
+    stats = compute_outlier_stats(df, get_outlier_columns(df, target_col), iqr_k)
+    checks = build_checks(stats, rules, df.columns)
+    flags = flag_rows(df, checks, z_threshold)
+    n_flagged = int(np.count_nonzero(flags.any(axis=1)))
+
+    return {
+        "stats": stats,
+        "checks": checks,
+        "flags": flags,
+        "summary": summarize_flags(count_flags(flags, checks), checks, len(df)),
+        "n_rows": len(df),
+        "n_flagged": n_flagged,
+    }
+
+
+def detect_outliers_streaming(source, target_col: str = None, rules: list = None,
+                              iqr_k: float = IQR_MULTIPLIER, z_threshold: float = ROBUST_Z_THRESHOLD,
+                              chunksize: int = drift.DEFAULT_CHUNKSIZE, keep_flags: bool = False) -> dict:
+    """
+    Run the same checks over an extract too large for memory.
+
+    The first streaming pass builds a quantile-histogram profile (reusing the
+    drift profiler) from which fences and robust scales are derived; the
+    second pass flags each chunk and accumulates per-check counts.
+
+    Args:
+        source: CSV/Parquet path or iterable of DataFrame chunks (re-iterable)
+        target_col: Target column (excluded from statistical checks)
+        rules: Business rules as (name, column, lower, upper) tuples
+        iqr_k: IQR multiplier for the Tukey fences
+        z_threshold: Robust z-score threshold
+        chunksize: Rows per chunk when reading from a path
+        keep_flags: Also return the concatenated per-row flags
+
+    Returns:
+        Dictionary with stats, checks, summary and (optionally) flags
+    """
+    profile = drift.build_reference_profile(source, target_col, chunksize=chunksize)
+    stats = stats_from_profile(profile, iqr_k)
+    columns = list(profile["numeric"]) + list(profile["categorical"])
+    checks = build_checks(stats, rules, columns)
+
+    counts = np.zeros(len(checks), dtype=np.int64)
+    n_rows = n_flagged = 0
+    kept = []
+    for chunk in drift.iter_chunks(source, chunksize):
+        flags = flag_rows(chunk, checks, z_threshold)
+        counts += count_flags(flags, checks)
+        n_rows += len(chunk)
+        n_flagged += int(np.count_nonzero(flags.any(axis=1)))
+        if keep_flags:
+            kept.append(flags)
+
+    result = {
+        "stats": stats,
+        "checks": checks,
+        "summary": summarize_flags(counts, checks, n_rows),
+        "n_rows": n_rows,
+        "n_flagged": n_flagged,
+    }
+    if keep_flags:
+        result["flags"] = np.concatenate(kept) if kept else np.zeros((0, 1), dtype=np.uint64)
+    return result
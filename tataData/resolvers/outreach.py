@@ -0,0 +1,240 @@
+"""
+Outreach resolver - Handles collections prioritisation by expected loss, channel assignment and agent scheduling
+"""
+import hashlib
+import heapq
+import json
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+
+DEFAULT_LOSS_GIVEN_DEFAULT = 1.0
+DEFAULT_AGENT_MINUTES = 420  # 7 productive hours per agent per day
+NO_CONTACT = "No Contact"
+
+# Channels in priority order: the highest expected losses go to tier 1.
+# capacity = accounts per day (None = unlimited), handling_minutes > 0 = needs an agent.
+DEFAULT_CHANNELS = [
+    {"channel": "Agent Call", "tier": 1, "capacity": 2_000, "handling_minutes": 12, "cost": 4.50,
+     "min_expected_loss": 500.0},
+    {"channel": "SMS", "tier": 2, "capacity": 50_000, "handling_minutes": 0, "cost": 0.05,
+     "min_expected_loss": 50.0},
+    {"channel": "Email", "tier": 3, "capacity": None, "handling_minutes": 0, "cost": 0.01,
+     "min_expected_loss": 0.0},
+]
+
+
+# ===== RANKING FUNCTIONS =====
+
+def compute_expected_loss(probabilities, balances, loss_given_default: float = DEFAULT_LOSS_GIVEN_DEFAULT) -> np.ndarray:
+    """
+    Expected loss per account: probability of delinquency x balance x loss given default.
+
+    Missing probabilities (unscored accounts) and balances count as zero.
+    """
+    probabilities = np.nan_to_num(np.asarray(probabilities, dtype=np.float64), nan=0.0)
+    balances = np.nan_to_num(np.asarray(balances, dtype=np.float64), nan=0.0)
+    return probabilities * balances * loss_given_default
+
+
+def rank_accounts(expected_loss: np.ndarray, limit: int = None) -> np.ndarray:
+    """
+    Row positions ordered by descending expected loss.
+
+    Ties are broken by row position so the order is fully reproducible. When
+    only the top `limit` accounts can be contacted, argpartition selects them
+    first and only that slice is sorted. NaN losses rank last; left as NaN
+    they would make the cut-off NaN and empty the selection.
+    """
+    n = expected_loss.size
+    key = -np.nan_to_num(np.asarray(expected_loss, dtype=np.float64), nan=-np.inf)
+    if limit is not None and limit <= 0:
+        return np.empty(0, dtype=np.intp)
+    if limit is not None and limit < n:
+        candidates = np.argpartition(key, limit - 1)[:limit]
+        # Accounts tied with the cut-off value may sit on either side; keep the lowest positions
+        cutoff = key[candidates].max()
+        candidates = np.union1d(candidates[key[candidates] < cutoff], np.flatnonzero(key == cutoff))
+    else:
+        candidates = np.arange(n)
+    order = candidates[np.lexsort((candidates, key[candidates]))]
+    return order[:limit] if limit is not None else order
+
+
+def assign_channels(expected_loss: np.ndarray, channels: list = None) -> tuple:
+    """
+    Fill channels in tier order with the highest expected losses.
+
+    Args:
+        expected_loss: Expected loss per account
+        channels: Channel definitions (defaults to DEFAULT_CHANNELS)
+
+    Returns:
+        Tuple of (ranked row positions, channel index per ranked row; -1 = no contact)
+    """
+    if channels is None:
+        channels = DEFAULT_CHANNELS
+    capacities = [c["capacity"] for c in channels]
+    total = None if any(c is None for c in capacities) else int(sum(capacities))
+
+    order = rank_accounts(expected_loss, total)
+    ranked_loss = expected_loss[order]
+    assigned = np.full(order.size, -1, dtype=np.int16)
+
+    start = 0
+    for i, channel in enumerate(channels):
+        # Ranked losses are descending, so eligibility is a prefix of the remaining accounts
+        eligible_end = start + int(np.count_nonzero(ranked_loss[start:] >= channel["min_expected_loss"]))
+        stop = eligible_end if channel["capacity"] is None else min(eligible_end, start + channel["capacity"])
+        assigned[start:stop] = i
+        start = stop
+
+    contacted = assigned >= 0
+    return order[contacted], assigned[contacted]
+
+
+# ===== SCHEDULING FUNCTIONS =====
+
+def schedule_agents(n_accounts: int, handling_minutes: float, agents=None) -> tuple:
+    """
+    Spread priority-ordered accounts over agents with a least-loaded min-heap.
+
+    Each account goes to the agent with the fewest booked minutes (ties to the
+    lowest agent number); agents leave the heap once their day is full.
+
+    Args:
+        n_accounts: Number of accounts, already in priority order
+        handling_minutes: Minutes per account
+        agents: Number of agents, or mapping of agent name to available minutes
+
+    Returns:
+        Tuple of (agent name per account or None if unscheduled, start minute per account)
+    """
+    if agents is None:
+        agents = {}
+    elif isinstance(agents, int):
+        agents = {f"Agent {i + 1:03d}": DEFAULT_AGENT_MINUTES for i in range(agents)}
+
+    names = list(agents)
+    heap = [(0.0, i) for i in range(len(names))]
+    heapq.heapify(heap)
+
+    assigned = np.full(n_accounts, None, dtype=object)
+    start_minute = np.full(n_accounts, np.nan)
+    for account in range(n_accounts):
+        while heap and heap[0][0] + handling_minutes > agents[names[heap[0][1]]]:
+            heapq.heappop(heap)
+        if not heap:
+            break
+        booked, agent = heapq.heappop(heap)
+        assigned[account] = names[agent]
+        start_minute[account] = booked
+        heapq.heappush(heap, (booked + handling_minutes, agent))
+    return assigned, start_minute
+
+
+# ===== AUDIT FUNCTIONS =====
+
+def _digest(*parts) -> str:
+    """Hash arrays and JSON-serialisable values into one hex digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(str(part.dtype).encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(json.dumps(part, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+# ===== QUEUE FUNCTIONS =====
+
+def build_daily_queue(probabilities, balances, ids=None, channels: list = None, agents=None,
+                      loss_given_default: float = DEFAULT_LOSS_GIVEN_DEFAULT, run_date=None) -> dict:
+    """
+    Build the day's collections queue from batch-scored probabilities.
+
+    Accounts are ranked by expected loss, channels are filled in tier order
+    under their capacities, and agent channels are booked onto agents. The
+    result is deterministic for the same inputs, and the audit record holds
+    hashes of the inputs, configuration and output.
+
+    Args:
+        probabilities: Delinquency probability per account
+        balances: Loan balance per account
+        ids: Customer IDs (defaults to row positions)
+        channels: Channel definitions (defaults to DEFAULT_CHANNELS)
+        agents: Number of agents or mapping of agent name to minutes (agent channels
+                are left unscheduled when omitted)
+        loss_given_default: Share of the balance lost on default
+        run_date: Queue date (defaults to today)
+
+    Returns:
+        Dictionary with the queue, channel summary and audit record
+    """
+    if channels is None:
+        channels = DEFAULT_CHANNELS
+    probabilities = np.asarray(probabilities, dtype=np.float64)
+    balances = np.asarray(balances, dtype=np.float64)
+    if probabilities.shape != balances.shape:
+        raise ValueError("probabilities and balances must have one value per account.")
+    run_date = str(run_date or date.today())
+
+    expected_loss = compute_expected_loss(probabilities, balances, loss_given_default)
+    order, channel_idx = assign_channels(expected_loss, channels)
+
+    ids = np.arange(probabilities.size) if ids is None else np.asarray(ids)
+    names = np.array([c["channel"] for c in channels], dtype=object)
+    queue = pd.DataFrame({
+        "Priority": np.arange(1, order.size + 1),
+        "Customer_ID": ids[order],
+        "Delinquency_Probability": probabilities[order],
+        "Loan_Balance": balances[order],
+        "Expected_Loss": expected_loss[order],
+        "Channel": names[channel_idx],
+        "Tier": np.array([c["tier"] for c in channels])[channel_idx],
+        "Agent": None,
+        "Start_Minute": np.nan,
+    })
+
+    for i, channel in enumerate(channels):
+        if channel["handling_minutes"] and agents:
+            rows = np.flatnonzero(channel_idx == i)
+            agent, start = schedule_agents(rows.size, channel["handling_minutes"], agents)
+            queue.loc[rows, "Agent"] = agent
+            queue.loc[rows, "Start_Minute"] = start
+
+    summary = get_channel_summary(queue, channels, probabilities.size)
+    config = {"channels": channels, "agents": agents, "loss_given_default": loss_given_default,
+              "run_date": run_date}
+    audit = {
+        "run_date": run_date,
+        "n_accounts": int(probabilities.size),
+        "input_hash": _digest(probabilities, balances, ids.astype(str)),
+        "config_hash": _digest(config),
+        "output_hash": _digest(order, channel_idx, queue["Agent"].astype(str).to_numpy().astype(str)),
+    }
+    return {"queue": queue, "summary": summary, "audit": audit}
+
+
+def get_channel_summary(queue: pd.DataFrame, channels: list, n_accounts: int) -> pd.DataFrame:
+    """Accounts, capacity use, expected loss covered and cost per channel."""
+    rows = []
+    for channel in channels:
+        selected = queue[queue["Channel"] == channel["channel"]]
+        rows.append({
+            "Channel": channel["channel"],
+            "Tier": channel["tier"],
+            "Accounts": len(selected),
+            "Capacity": channel["capacity"],
+            "Expected Loss Covered": selected["Expected_Loss"].sum(),
+            "Contact Cost": len(selected) * channel["cost"],
+            "Unscheduled": int(selected["Agent"].isna().sum()) if channel["handling_minutes"] else 0,
+        })
+    rows.append({
+        "Channel": NO_CONTACT, "Tier": None, "Accounts": n_accounts - len(queue), "Capacity": None,
+        "Expected Loss Covered": 0.0, "Contact Cost": 0.0, "Unscheduled": 0,
+    })
+    return pd.DataFrame(rows).set_index("Channel")
@@ -0,0 +1,206 @@
+"""
+Partitions resolver - Handles hive-style partitioned dataset directories with pruning and parallel scans
+"""
+import copy
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+from pathlib import Path
+
+import pandas as pd
+
+from resolvers import analyzer, incremental
+
+
+DATA_EXTENSIONS = {".csv": "csv", ".parquet": "parquet", ".pq": "parquet"}
+LAYOUT_SAMPLE_ROWS = 100_000  # rows drawn across all partitions to fix the aggregate layout
+
+
+# ===== DISCOVERY FUNCTIONS =====
+
+def parse_partition_path(relative: Path) -> dict:
+    """Partition keys from the key=value directory names of a relative file path."""
+    keys = {}
+    for part in relative.parent.parts:
+        if "=" in part:
+            key, value = part.split("=", 1)
+            keys[key] = value
+    return keys
+
+
+def discover_partitions(root) -> pd.DataFrame:
+    """
+    List the data files of a hive-style partitioned directory.
+
+    Only directory and file names are read, so discovery costs no data I/O.
+
+    Args:
+        root: Dataset directory, e.g. extracts/month=2024-01/Location=Chicago/part-0.csv
+
+    Returns:
+        DataFrame with one row per file: path, format, size and one column per partition key
+    """
+    root = Path(root)
+    if not root.is_dir():
+        raise ValueError(f"'{root}' is not a directory.")
+
+    rows = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith((".", "_")))
+        for name in sorted(filenames):
+            fmt = DATA_EXTENSIONS.get(Path(name).suffix.lower())
+            if fmt is None or name.startswith((".", "_")):
+                continue
+            path = Path(dirpath) / name
+            stat = path.stat()
+            rows.append({
+                "path": str(path),
+                "format": fmt,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                **parse_partition_path(path.relative_to(root)),
+            })
+
+    if not rows:
+        raise ValueError(f"No CSV or Parquet files found under '{root}'.")
+    return pd.DataFrame(rows)
+
+
+def get_partition_keys(partitions: pd.DataFrame) -> list:
+    """Partition key columns of a discovery table."""
+    return [c for c in partitions.columns if c not in ("path", "format", "size", "mtime_ns")]
+
+
+def get_partition_values(partitions: pd.DataFrame) -> dict:
+    """Sorted distinct values of every partition key (for filter widgets)."""
+    return {key: sorted(partitions[key].dropna().unique()) for key in get_partition_keys(partitions)}
+
+
+def prune_partitions(partitions: pd.DataFrame, filters: dict = None) -> pd.DataFrame:
+    """
+    Keep only the files whose partition values pass the filters.
+
+    Args:
+        partitions: Output of discover_partitions()
+        filters: Mapping of partition key to allowed values (empty/None = all)
+
+    Returns:
+        Subset of the discovery table
+    """
+    mask = pd.Series(True, index=partitions.index)
+    for key, values in (filters or {}).items():
+        if values:
+            if key not in partitions.columns:
+                raise ValueError(f"Unknown partition key '{key}'.")
+            mask &= partitions[key].isin([str(v) for v in values])
+    return partitions[mask]
+
+
+def fingerprint_partitions(partitions: pd.DataFrame) -> str:
+    """Fingerprint of a file selection from paths, sizes and modification times (no data read)."""
+    payload = partitions[["path", "size", "mtime_ns"]].sort_values("path").to_csv(index=False)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# ===== SCAN FUNCTIONS =====
+
+def read_partition(path: str, fmt: str, keys: dict, columns: list = None) -> pd.DataFrame:
+    """
+    Read one partition file and add its partition key columns.
+
+    Keys already stored inside the file are left untouched.
+    """
+    if fmt == "parquet":
+        file_columns = None if columns is None else [c for c in columns if c not in keys]
+        df = pd.read_parquet(path, columns=file_columns)
+    else:
+        df = pd.read_csv(path, usecols=None if columns is None else lambda c: c in columns)
+
+    for key, value in keys.items():
+        if key not in df.columns:
+            df[key] = value
+    return df
+
+
+def _read_row(row: dict, keys: list, columns: list) -> pd.DataFrame:
+    """Read the partition described by one discovery row (executed in a worker thread)."""
+    return read_partition(row["path"], row["format"], {k: row[k] for k in keys if pd.notna(row[k])}, columns)
+
+
+def scan_partitions(partitions: pd.DataFrame, target_col: str = None, columns: list = None,
+                    max_workers: int = None) -> tuple:
+    """
+    Read the selected partitions concurrently and merge their aggregates.
+
+    Worker threads read the partitions first, so the parsers overlap on I/O.
+    The aggregate layout (columns, shift and histogram edges) is then fixed
+    from a sample taken across every partition. Columns that only appear in
+    later partitions (e.g. a field added in a newer month) are part of it,
+    and missing cells count as missing. Each partition is aggregated into
+    its own state and the states are combined with incremental.merge_states().
+
+    Args:
+        partitions: Pruned discovery table
+        target_col: Target column (auto-detected from the combined columns if None)
+        columns: Columns to read (defaults to all)
+        max_workers: Worker threads (defaults to the executor's default)
+
+    Returns:
+        Tuple of (combined DataFrame, merged aggregate state)
+    """
+    if partitions.empty:
+        raise ValueError("No partitions match the selected filters.")
+
+    keys = get_partition_keys(partitions)
+    rows = partitions.to_dict("records")
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        frames = list(executor.map(lambda row: _read_row(row, keys, columns), rows))
+
+        # Union of all partition schemas, first-seen column order
+        per_frame = max(1, LAYOUT_SAMPLE_ROWS // len(frames))
+        sample = pd.concat([df.head(per_frame) for df in frames], ignore_index=True)
+        if target_col is None:
+            target_col = analyzer.get_target_column(sample)
+        layout = incremental.init_state(sample, target_col)
+
+        states = list(executor.map(lambda df: incremental.add_rows(copy.deepcopy(layout), df), frames))
+
+    return pd.concat(frames, ignore_index=True), reduce(incremental.merge_states, states)
+
+
+def load_partitioned_dataset(root, filters: dict = None, target_col: str = None, columns: list = None,
+                             max_workers: int = None, cache_dir=None) -> tuple:
+    """
+    Open a partitioned directory as one dataset for the EDA view.
+
+    Filters prune files before anything is read. The merged aggregates are
+    published to the result store, so EDA summaries come from the
+    per-partition states instead of being recomputed on the combined frame.
+
+    Args:
+        root: Dataset directory
+        filters: Mapping of partition key to allowed values
+        target_col: Target column (auto-detected if None)
+        columns: Columns to read (defaults to all)
+        max_workers: Worker threads for the scan
+        cache_dir: Result store directory
+
+    Returns:
+        Tuple of (DataFrame, fingerprint, summary dict)
+    """
+    partitions = discover_partitions(root)
+    selected = prune_partitions(partitions, filters)
+    df, state = scan_partitions(selected, target_col, columns, max_workers)
+
+    fingerprint = fingerprint_partitions(selected)
+    incremental.publish_results(state, fingerprint, cache_dir)
+
+    summary = {
+        "files_total": len(partitions),
+        "files_read": len(selected),
+        "bytes_read": int(selected["size"].sum()),
+        "total_records": state["n_rows"],
+    }
+    return df, fingerprint, summary
@@ -0,0 +1,169 @@
+"""
+Resampling resolver - Handles class-imbalance resampling (under/oversampling, SMOTE) on NumPy arrays
+"""
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+
+
+SMOTE_CHUNK_ROWS = 1_000_000
+
+
+# ===== HELPER FUNCTIONS =====
+
+def _validate(X, y) -> tuple:
+    """Return X as a 2-D float array (float32 kept as is) and y as a 1-D array."""
+    X = np.asarray(X)
+    if X.dtype not in (np.float32, np.float64):
+        X = X.astype(np.float32)
+    y = np.asarray(y).ravel()
+    if X.ndim != 2 or X.shape[0] != y.shape[0]:
+        raise ValueError(f"X must be 2-D with one row per label (got X {X.shape}, y {y.shape}).")
+    return X, y
+
+
+def get_class_balance(y) -> dict:
+    """
+    Identify minority and majority classes of a binary target.
+
+    Returns:
+        Dictionary with class labels, counts and minority percentage
+    """
+    labels, counts = np.unique(np.asarray(y).ravel(), return_counts=True)
+    if labels.size != 2:
+        raise ValueError(f"Resampling expects a binary target (found {labels.size} classes).")
+    minority, majority = (0, 1) if counts[0] <= counts[1] else (1, 0)
+    return {
+        "minority_label": labels[minority],
+        "majority_label": labels[majority],
+        "minority_count": int(counts[minority]),
+        "majority_count": int(counts[majority]),
+        "minority_pct": counts[minority] / counts.sum() * 100,
+    }
+
+
+# ===== RESAMPLING FUNCTIONS =====
+
+def random_undersample(X, y, ratio: float = 1.0, random_state: int = 42) -> tuple:
+    """
+    Drop majority rows at random until minority / majority equals ratio.
+
+    Args:
+        X: Feature matrix
+        y: Binary labels
+        ratio: Desired minority-to-majority ratio after resampling
+        random_state: Seed for reproducibility
+
+    Returns:
+        Tuple of (X_resampled, y_resampled) with rows in their original order
+    """
+    X, y = _validate(X, y)
+    balance = get_class_balance(y)
+    rng = np.random.default_rng(random_state)
+
+    majority_idx = np.flatnonzero(y == balance["majority_label"])
+    n_keep = min(majority_idx.size, int(round(balance["minority_count"] / ratio)))
+    kept = rng.choice(majority_idx, size=n_keep, replace=False)
+
+    keep = np.flatnonzero(y == balance["minority_label"])
+    keep = np.sort(np.concatenate([keep, kept]))
+    return X[keep], y[keep]
+
+
+def random_oversample(X, y, ratio: float = 1.0, random_state: int = 42) -> tuple:
+    """
+    Duplicate minority rows at random until minority / majority equals ratio.
+
+    Args:
+        X: Feature matrix
+        y: Binary labels
+        ratio: Desired minority-to-majority ratio after resampling
+        random_state: Seed for reproducibility
+
+    Returns:
+        Tuple of (X_resampled, y_resampled); duplicates are appended after the originals
+    """
+    X, y = _validate(X, y)
+    balance = get_class_balance(y)
+    rng = np.random.default_rng(random_state)
+
+    minority_idx = np.flatnonzero(y == balance["minority_label"])
+    n_new = max(0, int(round(balance["majority_count"] * ratio)) - minority_idx.size)
+    extra = minority_idx[rng.integers(0, minority_idx.size, size=n_new)]
+
+    return np.concatenate([X, X[extra]]), np.concatenate([y, y[extra]])
+
+
+def smote(X, y, ratio: float = 1.0, k_neighbors: int = 5, random_state: int = 42,
+          n_jobs: int = -1) -> tuple:
+    """
+    Synthesise minority rows by interpolating towards minority nearest neighbours.
+
+    Neighbours are found with a KD-tree built on the minority class only, and
+    all synthetic rows are generated with array operations in fixed-size
+    chunks. The dtype of X (e.g. float32) is preserved. Features should be on
+    comparable scales (standardise first) for the neighbour search to be meaningful.
+
+    Args:
+        X: Feature matrix
+        y: Binary labels
+        ratio: Desired minority-to-majority ratio after resampling
+        k_neighbors: Neighbours considered per minority row
+        random_state: Seed for reproducibility
+        n_jobs: Parallel jobs for the neighbour query (-1 = all cores)
+
+    Returns:
+        Tuple of (X_resampled, y_resampled); synthetic rows are appended after the originals
+    """
+    X, y = _validate(X, y)
+    balance = get_class_balance(y)
+    rng = np.random.default_rng(random_state)
+
+    X_min = np.ascontiguousarray(X[y == balance["minority_label"]])
+    n_min = X_min.shape[0]
+    n_new = max(0, int(round(balance["majority_count"] * ratio)) - n_min)
+    if n_new == 0:
+        return X, y
+    if n_min < 2:
+        raise ValueError("SMOTE needs at least two minority rows.")
+
+    k = min(k_neighbors, n_min - 1)
+    tree = NearestNeighbors(n_neighbors=k + 1, algorithm="kd_tree", n_jobs=n_jobs).fit(X_min)
+    neighbors = tree.kneighbors(X_min, return_distance=False)[:, 1:]  # drop each row itself
+
+    base = rng.integers(0, n_min, size=n_new)
+    partner = neighbors[base, rng.integers(0, k, size=n_new)]
+    gap = rng.random(n_new, dtype=np.float64).astype(X.dtype)[:, None]
+
+    synthetic = np.empty((n_new, X.shape[1]), dtype=X.dtype)
+    for start in range(0, n_new, SMOTE_CHUNK_ROWS):
+        stop = min(start + SMOTE_CHUNK_ROWS, n_new)
+        origin = X_min[base[start:stop]]
+        synthetic[start:stop] = origin + gap[start:stop] * (X_min[partner[start:stop]] - origin)
+
+    y_new = np.full(n_new, balance["minority_label"], dtype=y.dtype)
+    return np.concatenate([X, synthetic]), np.concatenate([y, y_new])
+
+
+RESAMPLERS = {
+    "undersample": random_undersample,
+    "oversample": random_oversample,
+    "smote": smote,
+}
+
+
+def resample(X, y, method: str = "smote", **kwargs) -> tuple:
+    """
+    Resample a training set with the named method.
+
+    Args:
+        X: Feature matrix
+        y: Binary labels
+        method: "undersample", "oversample" or "smote"
+        **kwargs: Passed to the resampler (ratio, random_state, ...)
+
+    Returns:
+        Tuple of (X_resampled, y_resampled)
+    """
+    if method not in RESAMPLERS:
+        raise ValueError(f"Unknown resampling method '{method}'. Choose from {list(RESAMPLERS)}.")
+    return RESAMPLERS[method](X, y, **kwargs)
@@ -0,0 +1,343 @@
+"""
+Result store resolver - Persists analysis results on disk keyed by dataset fingerprint
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sqlite3
+import time
+import types
+from pathlib import Path
+
+import pandas as pd
+
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("TATADATA_CACHE_DIR", Path.home() / ".cache" / "tataData"))
+DEFAULT_MAX_BYTES = int(os.environ.get("TATADATA_CACHE_MAX_BYTES", 512 * 1024 * 1024))
+DEFAULT_MAX_AGE = 30 * 24 * 3600  # seconds
+STORE_FILENAME = "results.sqlite"
+PROJECT_ROOT = Path(__file__).resolve().parent.parent  # code under here is versioned by source
+_CONSTANT_TYPES = (bool, int, float, complex, str, bytes, tuple, frozenset, type(None))
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    name TEXT NOT NULL,
+    version TEXT NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    size INTEGER NOT NULL,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_results_accessed ON results (accessed);
+CREATE INDEX IF NOT EXISTS idx_results_name ON results (fingerprint, name);
+"""
+
+
+# ===== FINGERPRINT FUNCTIONS =====
+
+def fingerprint_bytes(data: bytes) -> str:
+    """Content hash of raw file bytes (e.g. an uploaded file), cheap to compute before parsing."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def fingerprint_file(path, block_size: int = 1 << 20) -> str:
+    """Content hash of a file on disk, read in blocks."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as fh:
+        for block in iter(lambda: fh.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def fingerprint_dataframe(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame including column names and dtypes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(list(zip(df.columns, df.dtypes.astype(str)))).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _is_project_object(obj) -> bool:
+    """Whether a function or module is defined in this project (not a library)."""
+    try:
+        path = Path(inspect.getfile(obj)).resolve()
+    except (OSError, TypeError):
+        return False
+    return PROJECT_ROOT in path.parents
+
+
+def _referenced_names(code: types.CodeType) -> set:
+    """Global and attribute names used by a code object and its nested functions."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _referenced_names(const)
+    return names
+
+
+def _dependencies(func) -> tuple:
+    """
+    Project functions and module constants a function uses, followed transitively.
+
+    Names are resolved in the function's globals. A referenced project module
+    (e.g. `analyzer` in `analyzer.get_numeric_columns`) contributes its
+    functions and constants whose names the code also uses.
+
+    Returns:
+        Tuple of (list of functions including func, dict of constant name -> repr)
+    """
+    functions, constants, seen = [], {}, set()
+    pending = [func]
+    while pending:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        functions.append(current)
+
+        code = getattr(current, "__code__", None)
+        if code is None:
+            continue
+        names = _referenced_names(code)
+        scopes = [(current.__module__, current.__globals__)]
+        for name in names:
+            value = current.__globals__.get(name)
+            if isinstance(value, types.ModuleType) and _is_project_object(value):
+                scopes.append((value.__name__, vars(value)))
+
+        for module_name, namespace in scopes:
+            for name in names:
+                value = namespace.get(name)
+                if isinstance(value, types.FunctionType) and _is_project_object(value):
+                    pending.append(value)
+                elif isinstance(value, _CONSTANT_TYPES) and name.isupper():
+                    constants[f"{module_name}.{name}"] = repr(value)
+    return functions, constants
+
+
+@functools.lru_cache(maxsize=None)
+def function_version(func) -> str:
+    """
+    Version string derived from a function's source code and what it depends on.
+
+    The source of every project function it calls (directly or through helper
+    functions, in any module) and the module-level UPPER_CASE constants those
+    functions read are hashed together. Editing any of them changes the
+    version, so results computed by older code are never served as fresh.
+    """
+    functions, constants = _dependencies(func)
+    digest = hashlib.blake2b(digest_size=8)
+    for dependency in sorted(functions, key=lambda f: f"{f.__module__}.{f.__qualname__}"):
+        try:
+            source = inspect.getsource(dependency)
+        except (OSError, TypeError):
+            source = getattr(dependency, "__qualname__", repr(dependency))
+        digest.update(source.encode())
+        # Defaults such as `iqr_k=IQR_MULTIPLIER` are bound at definition time, not read by name
+        digest.update(repr((getattr(dependency, "__defaults__", None),
+                            getattr(dependency, "__kwdefaults__", None))).encode())
+    digest.update(repr(sorted(constants.items())).encode())
+    return digest.hexdigest()
+
+
+# ===== STORE FUNCTIONS =====
+
+def _connect(cache_dir=None) -> sqlite3.Connection:
+    """Open (and initialise if needed) the SQLite result store."""
+    cache_dir = Path(cache_dir) if cache_dir is not None else DEFAULT_CACHE_DIR
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_dir / STORE_FILENAME, timeout=30)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _make_key(fingerprint: str, name: str, version: str, params: dict) -> str:
+    """Build the primary key for a result from its identity and parameters."""
+    params_repr = repr(sorted((params or {}).items()))
+    params_hash = hashlib.blake2b(params_repr.encode(), digest_size=8).hexdigest()
+    return f"{fingerprint}:{name}:{version}:{params_hash}"
+
+
+def get_result(fingerprint: str, name: str, version: str, params: dict = None,
+               cache_dir=None, max_age: float = DEFAULT_MAX_AGE, default=None):
+    """
+    Fetch a stored result.
+
+    Args:
+        fingerprint: Dataset content hash
+        name: Result name (e.g. "missing_data")
+        version: Version of the function that produced the result
+        params: Extra parameters the result depends on (e.g. target column)
+        cache_dir: Store directory (defaults to DEFAULT_CACHE_DIR)
+        max_age: Entries older than this many seconds are treated as stale
+        default: Returned when the entry is missing, stale or unreadable
+
+    Returns:
+        The stored object (which may itself be None), or default
+    """
+    key = _make_key(fingerprint, name, version, params)
+    conn = _connect(cache_dir)
+    try:
+        row = conn.execute("SELECT created, payload FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return default
+
+        created, payload = row
+        now = time.time()
+        if max_age is not None and now - created > max_age:
+            with conn:
+                conn.execute("DELETE FROM results WHERE key = ?", (key,))
+            return default
+
+        with conn:
+            conn.execute("UPDATE results SET accessed = ? WHERE key = ?", (now, key))
+    finally:
+        conn.close()
+
+    try:
+        return pickle.loads(payload)
+    except Exception:  # noqa: BLE001 - corrupt or incompatible payloads are just misses
+        return default
+
+
+def put_result(fingerprint: str, name: str, version: str, value, params: dict = None,
+               cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+    """
+    Store a result, replacing older versions of the same result for this dataset.
+
+    Args:
+        fingerprint: Dataset content hash
+        name: Result name
+        version: Version of the function that produced the result
+        value: Picklable result object
+        params: Extra parameters the result depends on
+        cache_dir: Store directory
+        max_bytes: Size cap enforced by least-recently-used eviction after the write
+    """
+    key = _make_key(fingerprint, name, version, params)
+    payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    now = time.time()
+
+    conn = _connect(cache_dir)
+    try:
+        with conn:
+            conn.execute(
+                "DELETE FROM results WHERE fingerprint = ? AND name = ? AND version != ?",
+                (fingerprint, name, version),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, fingerprint, name, version, now, now, len(payload), payload),
+            )
+        _evict(conn, max_bytes)
+    finally:
+        conn.close()
+
+
+def _evict(conn: sqlite3.Connection, max_bytes: int) -> int:
+    """Delete least-recently-used entries until the store fits in max_bytes."""
+    total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+    if total <= max_bytes:
+        return 0
+
+    to_delete = []
+    for key, size in conn.execute("SELECT key, size FROM results ORDER BY accessed ASC"):
+        if total <= max_bytes:
+            break
+        to_delete.append((key,))
+        total -= size
+
+    with conn:
+        conn.executemany("DELETE FROM results WHERE key = ?", to_delete)
+    return len(to_delete)
+
+
+def evict(cache_dir=None, max_bytes: int = DEFAULT_MAX_BYTES, max_age: float = DEFAULT_MAX_AGE) -> int:
+    """
+    Remove stale entries and enforce the size cap.
+
+    Returns:
+        Number of entries removed
+    """
+    conn = _connect(cache_dir)
+    try:
+        removed = 0
+        if max_age is not None:
+            with conn:
+                removed += conn.execute(
+                    "DELETE FROM results WHERE created < ?", (time.time() - max_age,)
+                ).rowcount
+        removed += _evict(conn, max_bytes)
+        return removed
+    finally:
+        conn.close()
+
+
+def get_store_summary(cache_dir=None) -> dict:
+    """Get entry count, total size and number of datasets held in the store."""
+    conn = _connect(cache_dir)
+    try:
+        entries, size, datasets = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0), COUNT(DISTINCT fingerprint) FROM results"
+        ).fetchone()
+    finally:
+        conn.close()
+    return {"entries": entries, "size_bytes": size, "datasets": datasets}
+
+
+def cached_result(fingerprint: str, name: str, version: str, compute, params: dict = None,
+                  cache_dir=None):
+    """
+    Return a stored result, computing and storing it on a miss.
+
+    Args:
+        fingerprint: Dataset content hash (None disables the store)
+        name: Result name
+        version: Result version
+        compute: Zero-argument callable producing the result
+        params: Extra parameters the result depends on
+        cache_dir: Store directory
+
+    Returns:
+        The result object
+    """
+    if fingerprint is None:
+        return compute()
+
+    value = get_result(fingerprint, name, version, params, cache_dir, default=_MISSING)
+    if value is _MISSING:
+        value = compute()
+        put_result(fingerprint, name, version, value, params, cache_dir)
+    return value
+
+
+def cached_analysis(fingerprint: str, func, data, cache_dir=None, **params):
+    """
+    Run an analyzer function through the store.
+
+    The result name and version come from the function itself, so editing an
+    analyzer function invalidates its stored results automatically.
+
+    Args:
+        fingerprint: Dataset content hash (None disables the store)
+        func: Analyzer function taking the DataFrame as first argument
+        data: DataFrame, or a zero-argument loader that is only called on a miss
+        cache_dir: Store directory
+        **params: Keyword arguments forwarded to func (part of the key)
+
+    Returns:
+        The result object
+    """
+    def compute():
+        df = data() if callable(data) else data
+        return func(df, **params)
+
+    return cached_result(
+        fingerprint, func.__qualname__, function_version(func), compute, params, cache_dir
+    )
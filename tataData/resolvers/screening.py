@@ -0,0 +1,201 @@
+"""
+Screening resolver - Handles nonlinear association screening (mutual information, Cramér's V, correlation ratio)
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from resolvers import analyzer, drift, mlpipeline
+
+
+DEFAULT_BINS = 10
+MAX_LEVELS = 200  # columns with more distinct values (e.g. IDs) are skipped
+
+
+# ===== ENCODING FUNCTIONS =====
+
+def encode_column(series: pd.Series, n_bins: int = DEFAULT_BINS) -> tuple:
+    """
+    Integer-encode a column for contingency tables.
+
+    Numeric columns with more than n_bins distinct values are cut at their
+    quantiles; everything else is factorised. Missing values get their own
+    trailing level.
+
+    Returns:
+        Tuple of (int64 codes, number of levels, "numeric" or "categorical")
+    """
+    if pd.api.types.is_numeric_dtype(series) and series.nunique() > n_bins:
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+        edges = drift.quantile_edges(values, n_bins)
+        codes = np.searchsorted(edges, values, side="right")
+        n_levels = edges.size + 1
+        missing = np.isnan(values)
+        kind = "numeric"
+    else:
+        codes, uniques = pd.factorize(series, sort=True)
+        n_levels = len(uniques)
+        missing = codes < 0
+        kind = "numeric" if pd.api.types.is_numeric_dtype(series) else "categorical"
+
+    if missing.any():
+        codes = np.where(missing, n_levels, codes)
+        n_levels += 1
+    return codes.astype(np.int64, copy=False), n_levels, kind
+
+
+def contingency_table(a: np.ndarray, n_a: int, b: np.ndarray, n_b: int) -> np.ndarray:
+    """Cross-tabulate two integer codings with a single bincount."""
+    return np.bincount(a * n_b + b, minlength=n_a * n_b).reshape(n_a, n_b)
+
+
+# ===== STATISTICS FUNCTIONS =====
+
+def entropy(counts: np.ndarray) -> float:
+    """Shannon entropy in bits of a count vector."""
+    p = counts[counts > 0] / counts.sum()
+    return float(-(p * np.log2(p)).sum())
+
+
+def mutual_information(table: np.ndarray) -> float:
+    """Mutual information in bits between the row and column variables of a contingency table."""
+    n = table.sum()
+    if n == 0:
+        return 0.0
+    joint = table / n
+    expected = np.outer(joint.sum(axis=1), joint.sum(axis=0))
+    nonzero = joint > 0
+    return float((joint[nonzero] * np.log2(joint[nonzero] / expected[nonzero])).sum())
+
+
+def cramers_v(table: np.ndarray) -> float:
+    """Cramér's V of a contingency table (empty rows and columns are dropped)."""
+    table = table[table.sum(axis=1) > 0][:, table.sum(axis=0) > 0]
+    k = min(table.shape) - 1
+    n = table.sum()
+    if k < 1 or n == 0:
+        return 0.0
+    expected = np.outer(table.sum(axis=1), table.sum(axis=0)) / n
+    chi2 = ((table - expected) ** 2 / expected).sum()
+    return float(np.sqrt(chi2 / (n * k)))
+
+
+def correlation_ratio(codes: np.ndarray, n_levels: int, values: np.ndarray) -> float:
+    """
+    Correlation ratio (eta) of a numeric variable across the levels of a categorical one.
+
+    eta^2 is the share of the numeric variance explained by the category
+    means; rows with a missing numeric value are ignored.
+    """
+    present = ~np.isnan(values)
+    codes, values = codes[present], values[present]
+    if values.size == 0:
+        return 0.0
+    counts = np.bincount(codes, minlength=n_levels)
+    sums = np.bincount(codes, weights=values, minlength=n_levels)
+    occupied = counts > 0
+    means = sums[occupied] / counts[occupied]
+    grand_mean = values.mean()
+    between = (counts[occupied] * (means - grand_mean) ** 2).sum()
+    total = ((values - grand_mean) ** 2).sum()
+    return float(np.sqrt(between / total)) if total > 0 else 0.0
+
+
+# ===== SCREENING FUNCTIONS =====
+
+def get_screening_columns(df: pd.DataFrame, target_col: str) -> list:
+    """Feature columns to screen (target and ID columns excluded)."""
+    return [c for c in df.columns if c != target_col and c not in mlpipeline.ID_COLUMNS]
+
+
+def _screen_column(df: pd.DataFrame, col: str, target_codes: np.ndarray, n_target: int,
+                   target_entropy: float, n_bins: int) -> dict:
+    """Association of one column with the target (executed in a worker thread)."""
+    series = df[col]
+    if series.nunique() > MAX_LEVELS and not pd.api.types.is_numeric_dtype(series):
+        return None
+
+    codes, n_levels, kind = encode_column(series, n_bins)
+    table = contingency_table(codes, n_levels, target_codes, n_target)
+    mi = mutual_information(table)
+
+    eta = np.nan
+    if kind == "numeric":
+        eta = correlation_ratio(target_codes, n_target, series.to_numpy(dtype=np.float64, na_value=np.nan))
+
+    return {
+        "Feature": col,
+        "Type": kind,
+        "Levels": n_levels,
+        "Mutual Information (bits)": mi,
+        "Normalized MI": mi / target_entropy if target_entropy > 0 else 0.0,
+        "Cramér's V": cramers_v(table),
+        "Correlation Ratio": eta,
+    }
+
+
+def screen_features(df: pd.DataFrame, target_col: str, n_bins: int = DEFAULT_BINS,
+                    max_workers: int = None) -> pd.DataFrame:
+    """
+    Rank every feature by its (possibly nonlinear) association with the target.
+
+    Each column is encoded and cross-tabulated against the target with one
+    bincount; the columns are processed concurrently by a thread pool over
+    the shared frame. Categorical and payment history columns are included,
+    unlike the Pearson correlations.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        n_bins: Quantile bins for continuous numeric columns
+        max_workers: Worker threads (defaults to the executor's default)
+
+    Returns:
+        DataFrame indexed by feature with mutual information, normalised MI,
+        Cramér's V and (numeric features) the correlation ratio across target classes
+    """
+    target_codes, n_target, _ = encode_column(df[target_col], n_bins=max(n_bins, MAX_LEVELS))
+    target_entropy = entropy(np.bincount(target_codes, minlength=n_target))
+    columns = get_screening_columns(df, target_col)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        rows = executor.map(
+            lambda col: _screen_column(df, col, target_codes, n_target, target_entropy, n_bins), columns
+        )
+        rows = [r for r in rows if r is not None]
+
+    if not rows:
+        return pd.DataFrame(columns=["Type", "Levels", "Mutual Information (bits)", "Normalized MI",
+                                     "Cramér's V", "Correlation Ratio"])
+    result = pd.DataFrame(rows).set_index("Feature")
+    return result.sort_values("Mutual Information (bits)", ascending=False)
+
+
+def get_correlation_ratio_matrix(df: pd.DataFrame, target_col: str = None,
+                                 max_workers: int = None) -> pd.DataFrame:
+    """
+    Correlation ratio of every numeric column across every categorical column.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column (excluded)
+        max_workers: Worker threads (defaults to the executor's default)
+
+    Returns:
+        DataFrame with categorical columns as rows and numeric columns as columns
+    """
+    exclude = set(mlpipeline.ID_COLUMNS) | {target_col}
+    numeric_cols = [c for c in analyzer.get_numeric_columns(df) if c not in exclude]
+    categorical_cols = [c for c in df.columns
+                        if c not in exclude and c not in numeric_cols and df[c].nunique() <= MAX_LEVELS]
+    numeric_values = {c: df[c].to_numpy(dtype=np.float64, na_value=np.nan) for c in numeric_cols}
+
+    def row(col):
+        codes, n_levels, _ = encode_column(df[col])
+        return [correlation_ratio(codes, n_levels, numeric_values[n]) for n in numeric_cols]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        values = list(executor.map(row, categorical_cols))
+
+    return pd.DataFrame(values, index=pd.Index(categorical_cols), columns=numeric_cols)
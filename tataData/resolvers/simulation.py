@@ -0,0 +1,255 @@
+"""
+Simulation resolver - Handles Monte Carlo what-if analysis of decision thresholds and collections strategies
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.special import ndtri
+
+from resolvers import outreach
+
+
+DEFAULT_SCENARIOS = 1_000
+DEFAULT_THRESHOLDS = np.round(np.arange(0.05, 1.0, 0.05), 2)  # includes the chosen model's 0.5 cutoff
+DEFAULT_ASSET_CORRELATION = 0.05  # one-factor systematic correlation between defaults
+CHUNK_ELEMENTS = 2 ** 22  # scenario x customer cells per block (~16 MB of float32)
+NO_ACTION = "No Action"
+
+# Share of would-be defaults an intervention cures; costs come from the outreach channels.
+DEFAULT_CURE_RATES = {"Agent Call": 0.35, "SMS": 0.10, "Email": 0.04}
+DEFAULT_STRATEGIES = [
+    {"strategy": ch["channel"], "cost": ch["cost"], "cure_rate": DEFAULT_CURE_RATES[ch["channel"]]}
+    for ch in outreach.DEFAULT_CHANNELS
+]
+
+
+# ===== INPUT FUNCTIONS =====
+
+def _validate_inputs(probabilities, balances, thresholds) -> tuple:
+    """Coerce inputs to arrays, imputing missing balances with the median."""
+    probabilities = np.asarray(probabilities, dtype=np.float64).ravel()
+    balances = np.asarray(balances, dtype=np.float64).ravel()
+    thresholds = np.sort(np.asarray(thresholds, dtype=np.float64).ravel())
+
+    if probabilities.shape != balances.shape:
+        raise ValueError("probabilities and balances must have the same length.")
+    if probabilities.size == 0:
+        raise ValueError("No accounts to simulate.")
+    if np.isnan(probabilities).any() or (probabilities < 0).any() or (probabilities > 1).any():
+        raise ValueError("probabilities must lie in [0, 1].")
+    if thresholds.size == 0:
+        raise ValueError("At least one threshold is required.")
+
+    missing = np.isnan(balances)
+    if missing.any():
+        balances = np.where(missing, np.nanmedian(balances) if (~missing).any() else 0.0, balances)
+    return probabilities, balances, thresholds
+
+
+def draw_systematic_factors(n_scenarios: int, random_state: int = 42) -> np.ndarray:
+    """Standard normal economy-wide factor per scenario, shared by every customer chunk."""
+    return np.random.default_rng(np.random.SeedSequence(random_state).spawn(1)[0]).standard_normal(n_scenarios)
+
+
+def get_default_barrier(probabilities: np.ndarray, factors: np.ndarray,
+                        correlation: float = DEFAULT_ASSET_CORRELATION) -> np.ndarray:
+    """
+    Latent default barriers under the one-factor Gaussian (Vasicek) model.
+
+    A customer defaults in a scenario when a standard normal draw falls
+    below the barrier. Averaged over the factor the default rate equals the
+    scored probability, but defaults move together, so the loss
+    distribution has a realistic tail.
+
+    Returns:
+        float32 array of shape (scenarios, customers)
+    """
+    scale = 1 / np.sqrt(1 - correlation)
+    with np.errstate(divide="ignore"):
+        latent = (ndtri(probabilities) * scale).astype(np.float32)
+    shift = (np.sqrt(correlation) * scale * factors).astype(np.float32)
+    return latent[None, :] - shift[:, None]
+
+
+# ===== SIMULATION FUNCTIONS =====
+
+def _simulate_chunk(probabilities: np.ndarray, exposure: np.ndarray, thresholds: np.ndarray,
+                    factors: np.ndarray, correlation: float, seed_seq) -> tuple:
+    """
+    Simulate one block of customers across every scenario (executed in a worker process).
+
+    Defaults are drawn as a scenarios x customers matrix. Customers arrive
+    sorted by descending probability, so each threshold band is a contiguous
+    run of columns. One reduceat pass gives the per-band losses, and a
+    reverse cumulative sum over bands gives the loss of contacted accounts
+    for every threshold.
+
+    Returns:
+        Tuple of (gross loss per scenario, contacted-account loss per scenario x threshold)
+    """
+    rng = np.random.default_rng(seed_seq)
+    n_scenarios = factors.size
+
+    barrier = get_default_barrier(probabilities, factors, correlation)
+    defaulted = rng.standard_normal(barrier.shape, dtype=np.float32) < barrier
+    loss = defaulted * exposure.astype(np.float32)
+
+    band = np.searchsorted(thresholds, probabilities, side="right")  # thresholds that contact the account
+    starts = np.flatnonzero(np.r_[True, band[1:] != band[:-1]])
+    band_loss = np.zeros((n_scenarios, thresholds.size + 1))
+    band_loss[:, band[starts]] = np.add.reduceat(loss, starts, axis=1, dtype=np.float64)
+    gross = band_loss.sum(axis=1)
+    contacted_loss = np.cumsum(band_loss[:, ::-1], axis=1)[:, ::-1][:, 1:]
+    return gross, contacted_loss
+
+
+def simulate_strategies(probabilities, balances, thresholds=DEFAULT_THRESHOLDS, strategies: list = None,
+                        n_scenarios: int = DEFAULT_SCENARIOS,
+                        loss_given_default: float = outreach.DEFAULT_LOSS_GIVEN_DEFAULT,
+                        correlation: float = DEFAULT_ASSET_CORRELATION, n_jobs: int = None,
+                        random_state: int = 42) -> dict:
+    """
+    Monte Carlo what-if analysis of decision thresholds and collections strategies.
+
+    Every account with score >= threshold is contacted through the strategy's
+    channel, paying its cost and curing that share of would-be defaults.
+    Cures are applied in expectation given the simulated defaults, which
+    removes one random draw per strategy and its sampling noise.
+
+    Customers are sorted by probability and split into blocks of at most
+    CHUNK_ELEMENTS scenario x customer cells. The blocks run in parallel
+    worker processes, each with its own spawned seed, so results depend only
+    on random_state and not on n_jobs. Per-scenario totals are summed
+    across blocks.
+
+    Args:
+        probabilities: Scored default probabilities
+        balances: Loan_Balance per account (missing values imputed with the median)
+        thresholds: Decision thresholds to evaluate
+        strategies: List of {"strategy", "cost", "cure_rate"} dicts (defaults to DEFAULT_STRATEGIES)
+        n_scenarios: Number of Monte Carlo scenarios
+        loss_given_default: Share of the balance lost on default
+        correlation: Systematic default correlation (0 = independent defaults)
+        n_jobs: Number of worker processes (defaults to CPU count; 1 runs in-process)
+        random_state: Seed for reproducibility
+
+    Returns:
+        Dictionary with per-scenario gross losses, recoveries, contact counts and inputs
+    """
+    probabilities, balances, thresholds = _validate_inputs(probabilities, balances, thresholds)
+    if not 0 <= correlation < 1:
+        raise ValueError("correlation must lie in [0, 1).")
+    strategies = strategies or DEFAULT_STRATEGIES
+    cure_rates = np.array([s["cure_rate"] for s in strategies], dtype=np.float64)
+
+    order = np.argsort(-probabilities, kind="stable")
+    probabilities = probabilities[order]
+    exposure = balances[order] * loss_given_default
+
+    n = probabilities.size
+    chunk_rows = max(1, CHUNK_ELEMENTS // n_scenarios)
+    bounds = [(start, min(start + chunk_rows, n)) for start in range(0, n, chunk_rows)]
+    seeds = np.random.SeedSequence(random_state).spawn(len(bounds) + 1)[1:]
+    factors = draw_systematic_factors(n_scenarios, random_state)
+
+    if n_jobs is None:
+        n_jobs = os.cpu_count() or 1
+    n_jobs = max(1, min(n_jobs, len(bounds)))
+
+    args = [(probabilities[a:b], exposure[a:b], thresholds, factors, correlation, seed)
+            for (a, b), seed in zip(bounds, seeds)]
+    if n_jobs == 1:
+        parts = [_simulate_chunk(*arg) for arg in args]
+    else:
+        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+            parts = list(executor.map(_simulate_chunk, *zip(*args)))
+
+    gross = np.sum([g for g, _ in parts], axis=0)
+    recovered = cure_rates[:, None, None] * np.sum([c for _, c in parts], axis=0)[None, :, :]
+    contacted = (probabilities[:, None] >= thresholds[None, :]).sum(axis=0)
+
+    return {
+        "thresholds": thresholds,
+        "strategies": strategies,
+        "gross_loss": gross,
+        "recovered": recovered,
+        "contacted": contacted,
+        "n_accounts": n,
+        "n_scenarios": n_scenarios,
+        "total_balance": float(balances.sum()),
+    }
+
+
+# ===== REPORTING FUNCTIONS =====
+
+def summarize_simulation(result: dict, quantile: float = 0.95) -> pd.DataFrame:
+    """
+    Expected loss, recovery and contact cost per strategy and threshold.
+
+    Net Cost = loss remaining after cures + contact cost; Savings compare it
+    with taking no action. The tail column is the given quantile of the
+    scenario Net Cost distribution.
+
+    Returns:
+        DataFrame with a No Action baseline row followed by one row per strategy and threshold
+    """
+    gross = result["gross_loss"]
+    tail = f"Net Cost P{quantile * 100:g}"
+    rows = [{
+        "Strategy": NO_ACTION, "Threshold": np.nan, "Contacted": 0, "Contacted %": 0.0,
+        "Expected Loss": gross.mean(), "Expected Recovery": 0.0, "Contact Cost": 0.0,
+        "Net Cost": gross.mean(), tail: np.quantile(gross, quantile), "Savings": 0.0,
+    }]
+
+    for s, strategy in enumerate(result["strategies"]):
+        for t, threshold in enumerate(result["thresholds"]):
+            contacted = int(result["contacted"][t])
+            cost = contacted * strategy["cost"]
+            recovered = result["recovered"][s, :, t]
+            net = gross - recovered + cost
+            rows.append({
+                "Strategy": strategy["strategy"], "Threshold": threshold, "Contacted": contacted,
+                "Contacted %": contacted / result["n_accounts"] * 100,
+                "Expected Loss": (gross - recovered).mean(), "Expected Recovery": recovered.mean(),
+                "Contact Cost": cost, "Net Cost": net.mean(), tail: np.quantile(net, quantile),
+                "Savings": gross.mean() - net.mean(),
+            })
+    return pd.DataFrame(rows)
+
+
+def get_best_strategies(summary: pd.DataFrame) -> pd.DataFrame:
+    """Lowest expected Net Cost threshold for each strategy, best first."""
+    actions = summary[summary["Strategy"] != NO_ACTION]
+    best = actions.loc[actions.groupby("Strategy", sort=False)["Net Cost"].idxmin()]
+    return best.sort_values("Net Cost").reset_index(drop=True)
+
+
+def compare_with_default_cutoff(summary: pd.DataFrame, cutoff: float = 0.5) -> pd.DataFrame:
+    """Best threshold per strategy alongside the model's default cutoff, with the saving from switching."""
+    best = get_best_strategies(summary)
+    at_cutoff = summary[np.isclose(summary["Threshold"], cutoff)].set_index("Strategy")["Net Cost"]
+    best["Net Cost at Cutoff"] = best["Strategy"].map(at_cutoff)
+    best["Saving vs Cutoff"] = best["Net Cost at Cutoff"] - best["Net Cost"]
+    return best[["Strategy", "Threshold", "Net Cost", "Net Cost at Cutoff", "Saving vs Cutoff"]]
+
+
+def run_what_if(df: pd.DataFrame, probabilities, balance_col: str = "Loan_Balance", **kwargs) -> dict:
+    """
+    Simulate strategies for a scored dataset.
+
+    Args:
+        df: Dataset with the balance column
+        probabilities: Scored probabilities aligned with df rows
+        balance_col: Balance column name
+        **kwargs: Passed to simulate_strategies()
+
+    Returns:
+        Dictionary with the simulation result, summary table and best strategies
+    """
+    if balance_col not in df.columns:
+        raise ValueError(f"Balance column '{balance_col}' not found.")
+    result = simulate_strategies(probabilities, df[balance_col].to_numpy(), **kwargs)
+    summary = summarize_simulation(result)
+    return {"result": result, "summary": summary, "best": compare_with_default_cutoff(summary)}
@@ -0,0 +1,399 @@
+"""
+SQL source resolver - Handles pooled SQLite connections and pushdown of EDA aggregates to the database
+"""
+import atexit
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from resolvers import analyzer, incremental, result_store
+
+
+DEFAULT_POOL_SIZE = 4
+POOL_TIMEOUT = 30  # seconds to wait for a free connection
+DEFAULT_SAMPLE_SIZE = 20_000
+COMPARE_COLS = ["Missed_Payments", "Credit_Score", "Income"]  # analyzer.get_target_comparison() defaults
+NUMERIC_AFFINITIES = ("INT", "REAL", "FLOA", "DOUB", "NUMERIC", "DEC")
+MAX_SELECT_TERMS = 1_000  # result columns per query, well below SQLite's default limit of 2000
+
+_POOLS = {}
+_POOLS_LOCK = threading.Lock()
+
+
+# ===== CONNECTION FUNCTIONS =====
+
+def _open_connection(database: str):
+    """Open a read-only connection that may be handed between threads."""
+    return sqlite3.connect(f"file:{database}?mode=ro", uri=True, check_same_thread=False,
+                           timeout=POOL_TIMEOUT)
+
+
+def get_pool(database, size: int = DEFAULT_POOL_SIZE) -> dict:
+    """
+    Get the connection pool for a database, creating it on first use.
+
+    Connections are opened lazily up to `size` and reused afterwards, so
+    repeated pushdown queries and reruns do not pay for reconnecting.
+    """
+    database = str(Path(database).resolve())
+    if not Path(database).exists():
+        raise ValueError(f"Database '{database}' does not exist.")
+    with _POOLS_LOCK:
+        if database not in _POOLS:
+            _POOLS[database] = {
+                "database": database,
+                "size": size,
+                "idle": queue.LifoQueue(),
+                "opened": 0,
+                "lock": threading.Lock(),
+            }
+        return _POOLS[database]
+
+
+@contextmanager
+def connection(pool: dict):
+    """Borrow a connection from the pool and return it afterwards."""
+    try:
+        conn = pool["idle"].get_nowait()
+    except queue.Empty:
+        conn = None
+        with pool["lock"]:
+            if pool["opened"] < pool["size"]:
+                pool["opened"] += 1
+                conn = _open_connection(pool["database"])
+        if conn is None:
+            conn = pool["idle"].get(timeout=POOL_TIMEOUT)
+    try:
+        yield conn
+    finally:
+        pool["idle"].put(conn)
+
+
+def close_pool(database) -> None:
+    """Close every idle connection of a database's pool and forget the pool."""
+    with _POOLS_LOCK:
+        pool = _POOLS.pop(str(Path(database).resolve()), None)
+    while pool is not None and not pool["idle"].empty():
+        pool["idle"].get_nowait().close()
+
+
+def close_all_pools() -> None:
+    """Close every pool (registered to run at interpreter exit)."""
+    for database in list(_POOLS):
+        close_pool(database)
+
+
+atexit.register(close_all_pools)
+
+
+def run_query(pool: dict, sql: str, params: tuple = ()) -> pd.DataFrame:
+    """Run a query on a pooled connection and return the (small) result."""
+    with connection(pool) as conn:
+        return pd.read_sql_query(sql, conn, params=params)
+
+
+def run_aggregates(pool: dict, table: str, terms: list) -> np.ndarray:
+    """
+    Evaluate aggregate expressions over a whole table as one row of floats.
+
+    Terms are split across several queries of at most MAX_SELECT_TERMS
+    result columns, so wide tables stay within SQLite's column limit.
+    NULL results (e.g. SUM over an empty table) come back as 0.
+    """
+    values = []
+    for start in range(0, len(terms), MAX_SELECT_TERMS):
+        batch = ", ".join(terms[start:start + MAX_SELECT_TERMS])
+        row = run_query(pool, f"SELECT {batch} FROM {quote_identifier(table)}").iloc[0]
+        values.append(row.to_numpy(dtype=np.float64))
+    return np.nan_to_num(np.concatenate(values)) if values else np.empty(0)
+
+
+# ===== SCHEMA FUNCTIONS =====
+
+def quote_identifier(name: str) -> str:
+    """Quote a table or column name for SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def list_tables(pool: dict) -> list:
+    """Tables and views available in the database."""
+    names = run_query(pool, "SELECT name FROM sqlite_master WHERE type IN ('table', 'view') "
+                            "AND name NOT LIKE 'sqlite_%' ORDER BY name")
+    return names["name"].tolist()
+
+
+def get_table_schema(pool: dict, table: str) -> pd.DataFrame:
+    """
+    Column names with a numeric flag for a table.
+
+    Declared types follow SQLite affinity rules; untyped columns count as
+    numeric when no stored value is text or blob.
+    """
+    if table not in list_tables(pool):
+        raise ValueError(f"Table '{table}' not found in the database.")
+    info = run_query(pool, f"PRAGMA table_info({quote_identifier(table)})")
+    declared = info["type"].fillna("").str.upper()
+    numeric = declared.apply(lambda t: any(a in t for a in NUMERIC_AFFINITIES))
+
+    untyped = info.loc[declared == "", "name"].tolist()
+    if untyped:
+        text_counts = run_aggregates(
+            pool, table, [f"SUM(typeof({quote_identifier(c)}) IN ('text', 'blob'))" for c in untyped]
+        )
+        for c, count in zip(untyped, text_counts):
+            numeric[info["name"] == c] = not count
+
+    return pd.DataFrame({"column": info["name"], "numeric": numeric.astype(bool)})
+
+
+def fingerprint_table(pool: dict, table: str) -> str:
+    """
+    Fingerprint of a table's current contents.
+
+    Combines the database file's size and modification time with the row
+    count and largest rowid, so any write to the database yields a new key.
+    """
+    stat = os.stat(pool["database"])
+    stats = run_query(pool, f"SELECT COUNT(*) AS n, MAX(rowid) AS max_rowid FROM {quote_identifier(table)}")
+    payload = f"{pool['database']}|{table}|{stat.st_size}|{stat.st_mtime_ns}|{stats.iloc[0].tolist()}"
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+# ===== PUSHDOWN FUNCTIONS =====
+
+def sql_missing_data(pool: dict, table: str, columns: list) -> pd.DataFrame:
+    """Missing counts of every column in one scan, in the format of analyzer.analyze_missing_data()."""
+    row = run_aggregates(pool, table, ["COUNT(*)"] + [f"SUM({quote_identifier(c)} IS NULL)" for c in columns])
+    n_rows, counts = int(row[0]), row[1:].astype(np.int64)
+
+    missing = pd.Series(counts, index=columns).rename("Missing Count").to_frame()
+    missing["Missing %"] = (missing["Missing Count"] / max(n_rows, 1)) * 100
+    missing = missing[missing["Missing Count"] > 0].sort_values("Missing %", ascending=False)
+    return missing
+
+
+def sql_value_counts(pool: dict, table: str, col: str) -> pd.Series:
+    """Value counts of one column including NULLs (as NaN), computed by the database."""
+    column = quote_identifier(col)
+    counts = run_query(pool, f"SELECT {column} AS value, COUNT(*) AS count "
+                             f"FROM {quote_identifier(table)} GROUP BY {column}")
+    series = pd.Series(counts["count"].to_numpy(), index=pd.Index(counts["value"], name=col), name="count")
+    return series.sort_values(ascending=False)
+
+
+def sql_target_distribution(pool: dict, table: str, target_col: str) -> tuple:
+    """Target distribution in the format of analyzer.get_target_distribution()."""
+    counts = sql_value_counts(pool, table, target_col)
+    target_counts = pd.concat([counts[counts.index.notna()].sort_index(), counts[counts.index.isna()]])
+    target_counts.index.name = target_col
+
+    target_pct = (target_counts / target_counts.sum() * 100).round(2)
+    target_df = pd.DataFrame({
+        "Value": target_counts.index,
+        "Count": target_counts.values,
+        "Percentage": target_pct.values
+    })
+    return target_df, target_counts
+
+
+def sql_group_means(pool: dict, table: str, target_col: str, columns: list) -> pd.DataFrame:
+    """Per-class means in the format of analyzer.get_target_comparison()."""
+    if not columns:
+        return pd.DataFrame()
+    target = quote_identifier(target_col)
+    means = ", ".join(f"AVG({quote_identifier(c)}) AS {quote_identifier(c)}" for c in columns)
+    # The class key gets its own alias so a target that is also a compared column stays unambiguous
+    result = run_query(pool, f"SELECT {target} AS target_class, {means} FROM {quote_identifier(table)} "
+                             f"WHERE {target} IS NOT NULL GROUP BY {target} ORDER BY {target}")
+    return result.set_index("target_class").rename_axis(target_col)
+
+
+def sql_comoments(pool: dict, table: str, numeric_cols: list) -> dict:
+    """
+    Pairwise-complete co-moments of numeric columns.
+
+    For every pair the database returns the count, sums, sums of squares and
+    cross product over rows where both values are present. The 6 terms per
+    pair are split by run_aggregates() into queries of at most
+    MAX_SELECT_TERMS columns, i.e. one scan per ~166 pairs. The result has
+    the layout of an incremental aggregate state, so correlations reuse
+    incremental.state_correlation_matrix().
+    """
+    p = len(numeric_cols)
+    cols = [quote_identifier(c) for c in numeric_cols]
+    terms = []
+    for i in range(p):
+        for j in range(i, p):
+            both = f"{cols[i]} IS NOT NULL AND {cols[j]} IS NOT NULL"
+            terms += [
+                f"SUM({both})",
+                f"TOTAL(CASE WHEN {both} THEN {cols[i]} END)",
+                f"TOTAL(CASE WHEN {both} THEN {cols[j]} END)",
+                f"TOTAL(CASE WHEN {both} THEN {cols[i]} * {cols[i]} END)",
+                f"TOTAL(CASE WHEN {both} THEN {cols[j]} * {cols[j]} END)",
+                f"TOTAL(CASE WHEN {both} THEN {cols[i]} * {cols[j]} END)",
+            ]
+
+    state = {
+        "numeric_cols": list(numeric_cols),
+        "pair_n": np.zeros((p, p)),
+        "pair_sum": np.zeros((p, p)),
+        "pair_sumsq": np.zeros((p, p)),
+        "cross": np.zeros((p, p)),
+    }
+    if not p:
+        return state
+
+    values = run_aggregates(pool, table, terms).reshape(-1, 6)
+    k = 0
+    for i in range(p):
+        for j in range(i, p):
+            n, sum_i, sum_j, sumsq_i, sumsq_j, cross = values[k]
+            state["pair_n"][i, j] = state["pair_n"][j, i] = n
+            state["pair_sum"][i, j], state["pair_sum"][j, i] = sum_i, sum_j
+            state["pair_sumsq"][i, j], state["pair_sumsq"][j, i] = sumsq_i, sumsq_j
+            state["cross"][i, j] = state["cross"][j, i] = cross
+            k += 1
+    return state
+
+
+def sample_rows(pool: dict, table: str, n: int = DEFAULT_SAMPLE_SIZE, seed: int = 42) -> pd.DataFrame:
+    """
+    Deterministic pseudo-random sample of rows for plots.
+
+    Rows are ordered by a multiplicative hash of their rowid, so the same
+    seed returns the same sample without pulling the table to the client.
+    """
+    return run_query(
+        pool,
+        f"SELECT * FROM {quote_identifier(table)} "
+        f"ORDER BY ((rowid * 2654435761 + ?) % 4294967296) LIMIT ?",
+        (int(seed), int(n)),
+    )
+
+
+# ===== SOURCE FUNCTIONS =====
+
+def _target_results(target_col: str, numeric_cols: list, correlation_matrix: pd.DataFrame,
+                    distribution: tuple, means: pd.DataFrame) -> list:
+    """Target-dependent (function, params, value) store entries for one target column."""
+    if target_col in numeric_cols:
+        with_target = correlation_matrix[target_col].drop(target_col).sort_values(ascending=False)
+    else:
+        with_target = pd.Series(dtype=float)
+    target_params = {"target_col": target_col}
+    return [
+        (analyzer.get_target_distribution, target_params, distribution),
+        (analyzer.get_target_comparison, target_params, means),
+        (analyzer.get_correlation_with_target, target_params, with_target),
+    ]
+
+
+def _publish(fingerprint: str, entries: list, cache_dir=None) -> None:
+    """Write (function, params, value) entries to the result store under the analyzer versions."""
+    for func, params, value in entries:
+        result_store.put_result(
+            fingerprint, func.__qualname__, result_store.function_version(func),
+            value, params, cache_dir,
+        )
+
+
+def push_down_target(pool: dict, table: str, target_col: str, fingerprint: str, cache_dir=None) -> None:
+    """
+    Push the target-dependent aggregates for another target column down to the database.
+
+    load_sql_source() covers the auto-detected target; the EDA view calls
+    this when the user selects a different one, so the target distribution,
+    class means and correlations stay full-table. Targets already published
+    for this fingerprint are skipped.
+    """
+    func = analyzer.get_target_distribution
+    stored = result_store.get_result(fingerprint, func.__qualname__, result_store.function_version(func),
+                                     {"target_col": target_col}, cache_dir)
+    if stored is not None:
+        return
+
+    schema = get_table_schema(pool, table)
+    columns = schema["column"].tolist()
+    numeric_cols = schema.loc[schema["numeric"], "column"].tolist()
+    correlation_matrix = result_store.cached_result(
+        fingerprint, analyzer.get_correlation_matrix.__qualname__,
+        result_store.function_version(analyzer.get_correlation_matrix),
+        lambda: incremental.state_correlation_matrix(sql_comoments(pool, table, numeric_cols)),
+        {}, cache_dir,
+    )
+    compare_cols = [c for c in COMPARE_COLS if c in columns]
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        distribution = executor.submit(sql_target_distribution, pool, table, target_col)
+        means = executor.submit(sql_group_means, pool, table, target_col, compare_cols)
+    _publish(fingerprint, _target_results(target_col, numeric_cols, correlation_matrix,
+                                          distribution.result(), means.result()), cache_dir)
+
+
+def load_sql_source(database, table: str, target_col: str = None, sample_size: int = DEFAULT_SAMPLE_SIZE,
+                    cache_dir=None) -> tuple:
+    """
+    Open a SQL table for the EDA view without exporting it.
+
+    Full-table aggregates are pushed down to the database concurrently over
+    the connection pool and published to the result store under the
+    analyzer function versions, so the EDA sections read them instead of
+    recomputing from the sample. Only the sample rows are pulled back.
+
+    Args:
+        database: SQLite database path
+        table: Table or view name
+        target_col: Target column (auto-detected from the columns if None)
+        sample_size: Rows to pull back for plots and row-level views
+        cache_dir: Result store directory
+
+    Returns:
+        Tuple of (sample DataFrame, fingerprint, summary dict)
+    """
+    pool = get_pool(database)
+    schema = get_table_schema(pool, table)
+    columns = schema["column"].tolist()
+    numeric_cols = schema.loc[schema["numeric"], "column"].tolist()
+    if target_col is None:
+        target_col = analyzer.get_target_column(pd.DataFrame(columns=columns))
+
+    fingerprint = fingerprint_table(pool, table)
+    compare_cols = [c for c in COMPARE_COLS if c in columns]
+
+    with ThreadPoolExecutor(max_workers=pool["size"]) as executor:
+        missing = executor.submit(sql_missing_data, pool, table, columns)
+        distribution = executor.submit(sql_target_distribution, pool, table, target_col)
+        means = executor.submit(sql_group_means, pool, table, target_col, compare_cols)
+        comoments = executor.submit(sql_comoments, pool, table, numeric_cols)
+        sample = executor.submit(sample_rows, pool, table, sample_size)
+
+    correlation_matrix = incremental.state_correlation_matrix(comoments.result())
+
+    n_rows = int(distribution.result()[1].sum())
+    disk_kb = os.path.getsize(pool["database"]) / 1024
+    overview = {
+        "total_records": n_rows,
+        "total_columns": len(columns),
+        "memory_usage_kb": disk_kb,
+        "memory_usage_str": f"{disk_kb:.1f} KB",
+        "size_label": "Database Size",  # the file on disk, not the in-memory sample
+    }
+
+    _publish(fingerprint, [
+        (analyzer.get_dataset_overview, {}, overview),
+        (analyzer.analyze_missing_data, {}, missing.result()),
+        (analyzer.get_correlation_matrix, {}, correlation_matrix),
+    ] + _target_results(target_col, numeric_cols, correlation_matrix,
+                        distribution.result(), means.result()), cache_dir)
+
+    summary = {"table": table, "total_rows": n_rows, "sample_rows": len(sample.result()),
+               "target_col": target_col}
+    return sample.result(), fingerprint, summary
@@ -0,0 +1,277 @@
+"""
+Tuning resolver - Handles parallel successive-halving hyperparameter search for the recommended models
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.model_selection import StratifiedKFold
+
+from resolvers import evaluation, feature_store, result_store
+
+
+DEFAULT_TUNING_DIR = result_store.DEFAULT_CACHE_DIR / "tuning"
+
+# Search spaces for the models in get_model_recommendations() that need tuning.
+# The resource grown across successive-halving rungs is n_estimators.
+SEARCH_SPACES = {
+    "Random Forest": {
+        "estimator": RandomForestClassifier,
+        "params": {
+            "max_depth": [4, 6, 8, 12, None],
+            "min_samples_leaf": [1, 5, 10, 25, 50],
+            "max_features": ["sqrt", "log2", 0.3, 0.5],
+            "class_weight": [None, "balanced", "balanced_subsample"],
+        },
+        "fixed": {"n_jobs": 1},
+    },
+    "Gradient Boosting": {
+        "estimator": GradientBoostingClassifier,
+        "params": {
+            "learning_rate": [0.01, 0.03, 0.05, 0.1, 0.2],
+            "max_depth": [2, 3, 4, 5],
+            "subsample": [0.6, 0.8, 1.0],
+            "min_samples_leaf": [1, 10, 25, 50],
+            "max_features": [None, "sqrt", 0.5],
+        },
+        "fixed": {},
+    },
+}
+
+
+# ===== FOLD CACHE FUNCTIONS =====
+
+def prepare_fold_cache(df: pd.DataFrame, target_col: str, n_splits: int = 5, random_state: int = 42,
+                       cache_dir=None, fingerprint: str = None, feature_dir=None) -> dict:
+    """
+    Split the dataset's stored feature set into cross-validation folds.
+
+    Features come from the feature store (built at most once per dataset
+    and pipeline version), so only the fold row indices are stored here.
+    Trials open the feature columns memory-mapped and gather their rows, so
+    every worker process shares the same pages instead of rebuilding or
+    copying the matrices. The stored preprocessor is fitted on all rows but
+    learns only target-free statistics (medians and category levels).
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        n_splits: Number of stratified folds
+        random_state: Seed for the fold split
+        cache_dir: Directory for fold files (defaults to DEFAULT_TUNING_DIR)
+        fingerprint: Dataset fingerprint (computed from df if omitted)
+        feature_dir: Feature store directory
+
+    Returns:
+        Manifest dictionary with the feature set path, fold index paths and a cache key
+    """
+    feature_set = feature_store.get_or_build_feature_set(df, target_col, fingerprint, feature_dir)
+    key = f"{feature_set['manifest']['key']}-{n_splits}-{random_state}"
+    key = hashlib.blake2b(key.encode(), digest_size=12).hexdigest()
+    fold_dir = Path(cache_dir or DEFAULT_TUNING_DIR) / key
+    manifest_path = fold_dir / "manifest.json"
+
+    if manifest_path.exists():
+        return json.loads(manifest_path.read_text())
+
+    fold_dir.mkdir(parents=True, exist_ok=True)
+    y_all = np.asarray(feature_set["target"])
+    splitter = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=random_state)
+
+    folds = []
+    for k, (train_idx, valid_idx) in enumerate(splitter.split(np.zeros(len(y_all)), y_all)):
+        paths = {}
+        for split, idx in (("train", train_idx), ("valid", valid_idx)):
+            paths[split] = str(fold_dir / f"fold{k}_{split}_rows.npy")
+            np.save(paths[split], idx.astype(np.int64))
+        folds.append(paths)
+
+    manifest = {"key": key, "target_col": target_col, "n_splits": n_splits,
+                "feature_set": feature_set["manifest"]["path"], "folds": folds}
+    manifest_path.write_text(json.dumps(manifest))
+    return manifest
+
+
+def _load_fold(feature_set: dict, paths: dict) -> tuple:
+    """Gather one fold's training and validation rows from the memory-mapped feature set."""
+    arrays = []
+    for split in ("train", "valid"):
+        rows = np.load(paths[split])
+        arrays += [feature_store.get_matrix(feature_set, rows=rows), np.asarray(feature_set["target"][rows])]
+    return tuple(arrays)
+
+
+# ===== TRIAL FUNCTIONS =====
+
+def sample_configurations(model_name: str, n_candidates: int, random_state: int = 42) -> list:
+    """
+    Draw distinct random configurations from a model's search space.
+
+    Sampling is deterministic for a given seed, so a resumed search sees the
+    same candidates as the interrupted one.
+    """
+    space = SEARCH_SPACES[model_name]["params"]
+    names = sorted(space)
+    grid_size = int(np.prod([len(space[n]) for n in names]))
+    n_candidates = min(n_candidates, grid_size)
+
+    rng = np.random.default_rng(random_state)
+    flat = rng.choice(grid_size, size=n_candidates, replace=False)
+    shape = [len(space[n]) for n in names]
+
+    configs = []
+    for index in np.array(np.unravel_index(flat, shape)).T:
+        configs.append({name: space[name][i] for name, i in zip(names, index)})
+    return configs
+
+
+def _trial_key(model_name: str, params: dict, resource: int, fold_key: str) -> str:
+    """Stable identifier of a trial, used to skip completed trials on resume."""
+    payload = json.dumps([model_name, params, resource, fold_key], sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=12).hexdigest()
+
+
+def _run_trial(model_name: str, params: dict, resource: int, feature_set_path: str, folds: list,
+               random_state: int) -> dict:
+    """Train and score one configuration on every fold (executed in a worker process)."""
+    spec = SEARCH_SPACES[model_name]
+    feature_set = feature_store.open_feature_set(feature_store.read_manifest(feature_set_path))
+    scores = []
+    for paths in folds:
+        X_train, y_train, X_valid, y_valid = _load_fold(feature_set, paths)
+        model = spec["estimator"](n_estimators=resource, random_state=random_state,
+                                  **spec["fixed"], **params)
+        model.fit(X_train, y_train)
+        scores.append(evaluation.roc_auc_score(y_valid, model.predict_proba(X_valid)[:, 1]))
+    return {"score": float(np.mean(scores)), "score_std": float(np.std(scores))}
+
+
+def load_trial_log(path) -> dict:
+    """Read a JSONL trial log into {trial_key: record}."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    records = {}
+    for line in path.read_text().splitlines():
+        if line.strip():
+            record = json.loads(line)
+            records[record["trial_key"]] = record
+    return records
+
+
+# ===== SEARCH FUNCTIONS =====
+
+def successive_halving(df: pd.DataFrame, target_col: str, model_name: str, n_candidates: int = 27,
+                       min_resource: int = 25, eta: int = 3, max_rungs: int = None, n_splits: int = 3,
+                       n_jobs: int = None, checkpoint_path=None, random_state: int = 42,
+                       cache_dir=None, fingerprint: str = None, feature_dir=None) -> dict:
+    """
+    Tune a model with successive halving over a local process pool.
+
+    All candidates start with min_resource trees; after each rung only the
+    best 1/eta survive and get eta times more trees. Completed trials are
+    appended to a JSONL checkpoint and skipped when the search is resumed.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        model_name: "Random Forest" or "Gradient Boosting"
+        n_candidates: Number of configurations in the first rung
+        min_resource: n_estimators in the first rung
+        eta: Halving rate
+        max_rungs: Maximum number of rungs (defaults to until one candidate is left)
+        n_splits: Cross-validation folds per trial
+        n_jobs: Worker processes (defaults to CPU count)
+        checkpoint_path: JSONL trial log (defaults to one per fold cache and model)
+        random_state: Seed for folds, candidates and models
+        cache_dir: Directory for fold files and checkpoints
+        fingerprint: Dataset fingerprint (computed from df if omitted)
+        feature_dir: Feature store directory
+
+    Returns:
+        Dictionary with the best parameters, best score and the trials table
+    """
+    if model_name not in SEARCH_SPACES:
+        raise ValueError(f"No search space for '{model_name}'. Choose from {list(SEARCH_SPACES)}.")
+
+    manifest = prepare_fold_cache(df, target_col, n_splits, random_state, cache_dir, fingerprint, feature_dir)
+    if checkpoint_path is None:
+        slug = model_name.lower().replace(" ", "_")
+        checkpoint_path = Path(cache_dir or DEFAULT_TUNING_DIR) / manifest["key"] / f"{slug}_trials.jsonl"
+    checkpoint_path = Path(checkpoint_path)
+    completed = load_trial_log(checkpoint_path)
+
+    candidates = sample_configurations(model_name, n_candidates, random_state)
+    if max_rungs is None:
+        max_rungs = max(1, int(np.ceil(np.log(len(candidates)) / np.log(eta))) + 1)
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    trials = []
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        for rung in range(max_rungs):
+            resource = min_resource * eta ** rung
+            keys = [_trial_key(model_name, c, resource, manifest["key"]) for c in candidates]
+
+            futures = {
+                key: executor.submit(_run_trial, model_name, params, resource,
+                                     manifest["feature_set"], manifest["folds"], random_state)
+                for key, params in zip(keys, candidates) if key not in completed
+            }
+            for key, params in zip(keys, candidates):
+                if key in futures:
+                    record = {"trial_key": key, "model": model_name, "params": params,
+                              "rung": rung, "n_estimators": resource, **futures[key].result()}
+                    with checkpoint_path.open("a") as fh:
+                        fh.write(json.dumps(record, default=str) + "\n")
+                    completed[key] = record
+                trials.append(completed[key])
+
+            if len(candidates) == 1:
+                break
+            scores = np.array([completed[k]["score"] for k in keys], dtype=np.float64)
+            n_keep = max(1, len(candidates) // eta)
+            # A failed fold gives a NaN score; rank it last rather than best
+            best = np.argsort(np.nan_to_num(scores, nan=-np.inf))[::-1][:n_keep]
+            candidates = [candidates[i] for i in best]
+
+    trials_df = pd.DataFrame(trials)
+    best_trial = trials_df.sort_values(["rung", "score"], ascending=False).iloc[0]
+    return {
+        "model": model_name,
+        "best_params": best_trial["params"],
+        "best_n_estimators": int(best_trial["n_estimators"]),
+        "best_score": float(best_trial["score"]),
+        "trials": trials_df,
+        "checkpoint": str(checkpoint_path),
+    }
+
+
+def tune_recommended_models(df: pd.DataFrame, target_col: str, models: list = None, **kwargs) -> pd.DataFrame:
+    """
+    Run successive halving for each recommended model and tabulate the winners.
+
+    Args:
+        df: Input dataframe
+        target_col: Target column name
+        models: Model names (defaults to every model with a search space)
+        **kwargs: Passed through to successive_halving()
+
+    Returns:
+        DataFrame with one row per model: best parameters, trees and CV ROC-AUC
+    """
+    rows = []
+    for model_name in models or list(SEARCH_SPACES):
+        result = successive_halving(df, target_col, model_name, **kwargs)
+        rows.append({
+            "Model": model_name,
+            "CV ROC-AUC": result["best_score"],
+            "n_estimators": result["best_n_estimators"],
+            "Parameters": result["best_params"],
+            "Trials": len(result["trials"]),
+        })
+    return pd.DataFrame(rows).set_index("Model").sort_values("CV ROC-AUC", ascending=False)
@@ -0,0 +1,152 @@
+"""
+Charts View - Browser-rendered Altair charts built from compact aggregates
+"""
+import json
+
+import altair as alt
+import pandas as pd
+
+
+POSITIVE_COLOR = "#2ecc71"
+NEGATIVE_COLOR = "#e74c3c"
+WARNING_COLOR = "#f39c12"
+PRIMARY_COLOR = "#3498db"
+ROW_HEIGHT = 22  # pixels per bar in horizontal bar charts
+
+
+def missing_data_chart(data: pd.DataFrame) -> alt.Chart:
+    """Horizontal bars of missing percentage per column."""
+    bars = alt.Chart(data).mark_bar().encode(
+        x=alt.X("Missing %:Q", title="Missing Percentage (%)"),
+        y=alt.Y("Column:N", sort="-x", title="Column"),
+        color=alt.Color("Missing %:Q", scale=alt.Scale(scheme="reds"), legend=None),
+        tooltip=["Column", "Missing Count", alt.Tooltip("Missing %:Q", format=".2f")],
+    )
+    labels = bars.mark_text(align="left", dx=3).encode(
+        text=alt.Text("Missing %:Q", format=".1f"), color=alt.value("black")
+    )
+    return (bars + labels).properties(title="Missing Data by Column", height=max(160, len(data) * ROW_HEIGHT))
+
+
+def target_distribution_chart(data: pd.DataFrame, target_col: str) -> alt.Chart:
+    """Donut chart of the target classes."""
+    colors = [POSITIVE_COLOR, NEGATIVE_COLOR] if len(data) == 2 else None
+    scale = alt.Scale(range=colors) if colors else alt.Scale(scheme="set2")
+    base = alt.Chart(data).encode(
+        theta=alt.Theta("Count:Q", stack=True),
+        color=alt.Color("Class:N", scale=scale, title=target_col),
+        tooltip=["Class", alt.Tooltip("Count:Q", format=","), alt.Tooltip("Percentage:Q", format=".1f")],
+    )
+    arcs = base.mark_arc(innerRadius=60, outerRadius=130)
+    labels = base.mark_text(radius=150, fontWeight="bold").encode(
+        text=alt.Text("Percentage:Q", format=".1f")
+    )
+    return (arcs + labels).properties(title=f"Distribution of {target_col}", height=320)
+
+
+def correlation_bar_chart(data: pd.DataFrame, target_col: str) -> alt.Chart:
+    """Diverging bars of feature correlations with the target."""
+    bars = alt.Chart(data).mark_bar().encode(
+        x=alt.X("Correlation:Q", title="Correlation Coefficient"),
+        y=alt.Y("Feature:N", sort=alt.EncodingSortField("Order"), title=None),
+        color=alt.condition(alt.datum.Correlation < 0, alt.value(NEGATIVE_COLOR), alt.value(POSITIVE_COLOR)),
+        tooltip=["Feature", alt.Tooltip("Correlation:Q", format=".4f")],
+    )
+    zero = alt.Chart(pd.DataFrame({"x": [0]})).mark_rule(strokeDash=[4, 4]).encode(x="x:Q")
+    return (bars + zero).properties(title=f"Correlation with {target_col}",
+                                    height=max(160, len(data) * ROW_HEIGHT))
+
+
+def heatmap_chart(data: pd.DataFrame, title: str, value: str = "Correlation", domain: list = (-1, 1)) -> alt.Chart:
+    """Annotated heatmap of a long-form (Row, Column, value) matrix, centred on zero."""
+    scale = alt.Scale(scheme="redblue", reverse=True, domainMid=0,
+                      **({"domain": list(domain)} if domain is not None else {}))
+    order = list(dict.fromkeys(data["Row"]))
+    base = alt.Chart(data).encode(
+        x=alt.X("Column:N", sort=order, title=None),
+        y=alt.Y("Row:N", sort=order, title=None),
+    )
+    cells = base.mark_rect().encode(
+        color=alt.Color(f"{value}:Q", scale=scale),
+        tooltip=["Row", "Column", alt.Tooltip(f"{value}:Q", format=".3f")],
+    )
+    text = base.mark_text(fontSize=10).encode(text=alt.Text(f"{value}:Q", format=".2f"))
+    size = max(300, len(order) * 45)
+    return (cells + text).properties(title=title, width=size, height=size)
+
+
+def box_violin_chart(box: pd.DataFrame, violin: pd.DataFrame, col: str, target_col: str) -> alt.Chart:
+    """Box plots over violin outlines per target class, from precomputed statistics and densities."""
+    labels = box["class"].tolist()
+    x_axis = alt.Axis(values=list(range(len(labels))), labelExpr=f"{json.dumps(labels)}[datum.value]",
+                      title=f"{target_col} (0=Non-delinquent, 1=Delinquent)")
+    x_scale = alt.Scale(domain=[-0.6, len(labels) - 0.4])
+
+    violins = alt.Chart(violin).mark_area(orient="horizontal", opacity=0.3).encode(
+        y=alt.Y("y:Q", title=col),
+        x=alt.X("left:Q", scale=x_scale, axis=x_axis),
+        x2="right:Q",
+        color=alt.Color("class:N", scale=alt.Scale(scheme="set2"), legend=None),
+        detail="class:N",
+    )
+
+    box = box.assign(box_left=box["position"] - 0.12, box_right=box["position"] + 0.12)
+    tooltip = ["class", alt.Tooltip("n:Q", format=","), alt.Tooltip("mean:Q", format=".2f"),
+               alt.Tooltip("q1:Q", format=".2f"), alt.Tooltip("median:Q", format=".2f"),
+               alt.Tooltip("q3:Q", format=".2f")]
+    base = alt.Chart(box)
+    whiskers = base.mark_rule().encode(x="position:Q", y="whisker_low:Q", y2="whisker_high:Q")
+    boxes = base.mark_bar(opacity=0.9, stroke="black").encode(
+        x="box_left:Q", x2="box_right:Q", y="q1:Q", y2="q3:Q",
+        color=alt.Color("class:N", scale=alt.Scale(scheme="set2"), legend=None), tooltip=tooltip,
+    )
+    medians = base.mark_rule(color="black", strokeWidth=2).encode(x="box_left:Q", x2="box_right:Q", y="median:Q")
+
+    return (violins + whiskers + boxes + medians).properties(
+        title=f"{col} Distribution by Delinquency Status", height=320
+    ).interactive(bind_x=False)
+
+
+def histogram_chart(hist: dict, col: str) -> alt.Chart:
+    """Histogram with a KDE curve and mean/median markers from precomputed bins."""
+    bars = alt.Chart(hist["bins"]).mark_bar(color=PRIMARY_COLOR, opacity=0.6).encode(
+        x=alt.X("bin_start:Q", bin="binned", title=col),
+        x2="bin_end:Q",
+        y=alt.Y("count:Q", title="Count"),
+        tooltip=[alt.Tooltip("bin_start:Q", format=".2f"), alt.Tooltip("bin_end:Q", format=".2f"), "count:Q"],
+    )
+    kde = alt.Chart(hist["kde"]).mark_line(color=PRIMARY_COLOR).encode(x="x:Q", y="count:Q")
+    markers = pd.DataFrame({
+        "Statistic": [f"Mean: {hist['mean']:.2f}", f"Median: {hist['median']:.2f}"],
+        "value": [hist["mean"], hist["median"]],
+    })
+    rules = alt.Chart(markers).mark_rule(strokeDash=[6, 4], strokeWidth=2).encode(
+        x="value:Q",
+        color=alt.Color("Statistic:N", scale=alt.Scale(range=["red", "green"]),
+                        legend=alt.Legend(orient="top", title=None)),
+        tooltip=["Statistic"],
+    )
+    return (bars + kde + rules).properties(title=f"{col} Distribution", height=240).interactive(bind_y=False)
+
+
+def density_comparison_chart(densities: pd.DataFrame, col: str) -> alt.Chart:
+    """Overlaid step densities of several datasets on shared bins (index = bin centers)."""
+    data = densities.rename_axis("x").reset_index().melt(id_vars="x", var_name="Dataset", value_name="Density")
+    color = alt.Color("Dataset:N", scale=alt.Scale(scheme="set2"), legend=alt.Legend(orient="top"))
+    base = alt.Chart(data).encode(x=alt.X("x:Q", title=col), y=alt.Y("Density:Q"), color=color)
+    areas = base.mark_area(interpolate="step", opacity=0.15)
+    lines = base.mark_line(interpolate="step", strokeWidth=2).encode(
+        tooltip=["Dataset", alt.Tooltip("x:Q", format=".2f"), alt.Tooltip("Density:Q", format=".4g")]
+    )
+    return (areas + lines).properties(title=f"{col} Distribution", height=240).interactive(bind_y=False)
+
+
+def flagged_checks_chart(flagged: pd.DataFrame) -> alt.Chart:
+    """Horizontal bars of flagged-row percentage per outlier or rule check."""
+    return alt.Chart(flagged).mark_bar().encode(
+        x=alt.X("Flagged %:Q", title="Flagged Rows (%)"),
+        y=alt.Y("Check:N", sort="-x", title=None),
+        color=alt.condition(alt.datum.Type == "rule", alt.value(NEGATIVE_COLOR), alt.value(WARNING_COLOR)),
+        tooltip=["Check", "Column", "Type", alt.Tooltip("Flagged Rows:Q", format=","),
+                 alt.Tooltip("Flagged %:Q", format=".2f")],
+    ).properties(title="Outlier & Rule Violations", height=max(120, len(flagged) * ROW_HEIGHT))
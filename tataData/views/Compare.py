@@ -0,0 +1,117 @@
+"""
+Compare View - Side-by-side comparison of multiple datasets
+"""
+import pandas as pd
+import streamlit as st
+
+from resolvers import analyzer, chart_data, comparison, result_store
+from views import Charts
+
+
+@st.cache_data(show_spinner="Computing dataset aggregates...", max_entries=8)
+def _compare(fingerprints: tuple, target_col: str, _datasets: dict) -> dict:
+    """Compute comparison aggregates (cached on the datasets' fingerprints)."""
+    return comparison.compare_datasets(_datasets, target_col)
+
+
+def render_overview_comparison_section(result: dict) -> None:
+    """Render headline metrics for every dataset."""
+    st.header("1️⃣ Dataset Overview")
+
+    overview = comparison.get_overview_comparison(result)
+    st.dataframe(overview.style.format({"Target Rate %": "{:.2f}%"}), use_container_width=True)
+
+    missing = pd.DataFrame({
+        name: agg["missing"]["Missing %"]
+        for name, agg in result["datasets"].items()
+    }).fillna(0)
+    if not missing.empty:
+        st.subheader("Missing % by Column")
+        st.dataframe(missing.style.format("{:.2f}%"), use_container_width=True)
+
+
+def render_distribution_comparison_section(result: dict) -> None:
+    """Render overlaid feature distributions from shared-bin histograms."""
+    st.header("2️⃣ Overlaid Feature Distributions")
+
+    target_col = result["target_col"]
+    num_cols = [c for c in result["edges"] if c != target_col]
+    if not num_cols:
+        st.info("No numeric columns found.")
+        return
+
+    key_features = ["Age", "Income", "Credit_Score", "Credit_Utilization",
+                   "Debt_to_Income_Ratio", "Missed_Payments"]
+    default = [f for f in key_features if f in num_cols][:4] or num_cols[:4]
+    selected = st.multiselect("Select numeric columns to compare", num_cols, default=default,
+                              key="compare_distribution_cols")
+
+    if selected:
+        grid = st.columns(2)
+        for idx, col in enumerate(selected):
+            densities = comparison.get_histogram_densities(result, col)
+            with grid[idx % 2]:
+                st.altair_chart(Charts.density_comparison_chart(densities, col), use_container_width=True)
+
+
+def render_correlation_comparison_section(result: dict) -> None:
+    """Render correlation-with-target deltas and correlation matrix differences."""
+    st.header("3️⃣ Correlation Deltas")
+
+    names = list(result["datasets"])
+    baseline = st.selectbox("Baseline dataset", names, key="compare_baseline")
+
+    deltas = comparison.get_correlation_deltas(result, baseline)
+    if deltas.empty:
+        st.info(f"Target column '{result['target_col']}' is not numeric. Skipping correlation comparison.")
+        return
+
+    st.subheader(f"Feature Correlations with {result['target_col']}")
+    st.dataframe(
+        deltas.style.format("{:.4f}").background_gradient(cmap="RdYlGn", axis=None, vmin=-1, vmax=1),
+        use_container_width=True
+    )
+
+    others = [n for n in names if n != baseline]
+    if not others:
+        return
+
+    with st.expander("🔥 View Correlation Matrix Difference"):
+        other = st.selectbox("Compare dataset", others, key="compare_other")
+        matrix_delta = comparison.get_correlation_matrix_delta(result, other, baseline)
+        chart = Charts.heatmap_chart(chart_data.get_matrix_long(matrix_delta, "Delta"),
+                                     f"Correlation Matrix: {other} minus {baseline}", "Delta", domain=None)
+        st.altair_chart(chart)
+
+
+def render_comparison_app(datasets: dict, fingerprints: dict = None) -> None:
+    """
+    Render the complete dataset comparison application.
+
+    Args:
+        datasets: Mapping of dataset name to DataFrame
+        fingerprints: Optional mapping of dataset name to content hash
+    """
+    st.title("🔀 Delinquency Prediction – Dataset Comparison")
+    st.markdown("""
+    Compare portfolios side by side (e.g. this month vs. last month, region A vs. region B).
+    Statistics are computed per dataset in parallel and compared from their aggregates.
+    """)
+
+    first = next(iter(datasets.values()))
+    columns = first.columns.tolist()
+    default_target = analyzer.get_target_column(first)
+    target_col = st.selectbox(
+        "Select target (delinquency) column",
+        options=columns,
+        index=columns.index(default_target) if default_target in columns else 0,
+        key="compare_target",
+    )
+
+    if fingerprints is None:
+        fingerprints = {name: result_store.fingerprint_dataframe(df) for name, df in datasets.items()}
+    result = _compare(tuple(fingerprints[name] for name in datasets), target_col, datasets)
+
+    render_overview_comparison_section(result)
+    render_distribution_comparison_section(result)
+    render_correlation_comparison_section(result)
@@ -3,26 +3,151 @@ EDA View - Exploratory Data Analysis interface
 """
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 import streamlit as st
 
-from resolvers import analyzer
+from resolvers import analyzer, browser, chart_data, cube, lookup, outliers, result_store, screening
+from views import Charts
 
 
-def render_data_overview_section(df: pd.DataFrame) -> None:
-    """Render the dataset overview section."""
+def _analysis(fingerprint: str, func, data, **params):
+    """Run an analyzer function through the persistent result store (data: DataFrame or loader)."""
+    return result_store.cached_analysis(fingerprint, func, data, **params)
+
+
+def _loader(data):
+    """
+    Zero-argument loader for a DataFrame or a loader, loading at most once per run.
+
+    Stored results need no data at all, so on a warm start the file is never parsed.
+    """
+    if not callable(data):
+        return lambda: data
+
+    loaded = []
+
+    def load() -> pd.DataFrame:
+        if not loaded:
+            loaded.append(data())
+        return loaded[0]
+
+    return load
+
+
+def _frame(data) -> pd.DataFrame:
+    """The DataFrame behind data, loading it if data is a loader."""
+    return data() if callable(data) else data
+
+
+def _schema(fingerprint: str, data) -> pd.DataFrame:
+    """Zero-row frame with the dataset's columns and dtypes, from the store when possible."""
+    return _analysis(fingerprint, analyzer.get_schema, data)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _browser_table(fingerprint: str, _df: pd.DataFrame):
+    """Arrow copy of the dataset for the data browser (one per dataset fingerprint)."""
+    return browser.to_arrow_table(_df)
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _customer_index(fingerprint: str, _df: pd.DataFrame) -> dict:
+    """Customer_ID hash index built once per dataset fingerprint."""
+    return lookup.build_customer_index(_df)
+
+
+@st.cache_resource(show_spinner="Checking for outliers...", max_entries=4)
+def _outlier_results(fingerprint: str, target_col: str, _data) -> dict:
+    """Outlier flags and summary, kept in memory per dataset fingerprint and target."""
+    return _analysis(fingerprint, outliers.detect_outliers, _data, target_col=target_col)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _browser_sort_index(fingerprint: str, col: str, ascending: bool, _table):
+    """Precomputed sort index for one column and direction."""
+    return browser.build_sort_index(_table, col, ascending)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _browser_filter_options(fingerprint: str, col: str, _table) -> dict:
+    """Filter widget options for one column."""
+    return browser.get_column_filter_options(_table, col)
+
+
+def _is_sample(data, total_rows: int = None) -> bool:
+    """Whether data holds only a sample of a larger source (e.g. a SQL table)."""
+    return total_rows is not None and total_rows > len(_frame(data))
+
+
+def _sample_caption(data, total_rows: int = None) -> None:
+    """Note under a section header that its row-level results come from a sample."""
+    if _is_sample(data, total_rows):
+        st.caption(f"🔬 Computed on a sample of {len(_frame(data)):,} of {total_rows:,} rows.")
+
+
+def render_data_browser(df: pd.DataFrame, fingerprint: str = None) -> None:
+    """Render a paginated raw data browser with server-side sorting and filtering."""
+    if fingerprint is None:
+        fingerprint = result_store.fingerprint_dataframe(df)
+    table = _browser_table(fingerprint, df)
+    columns = df.columns.tolist()
+
+    col1, col2, col3 = st.columns([2, 1, 1])
+    with col1:
+        sort_col = st.selectbox("Sort by", ["(none)"] + columns, key="browser_sort_col")
+    with col2:
+        ascending = st.radio("Order", ["Ascending", "Descending"], horizontal=True,
+                             key="browser_sort_order") == "Ascending"
+    with col3:
+        page_size = st.selectbox("Rows per page", [20, 50, 100, 500], index=1, key="browser_page_size")
+
+    filter_cols = st.multiselect("Filter columns", columns, key="browser_filter_cols")
+    filters = {}
+    for col in filter_cols:
+        options = _browser_filter_options(fingerprint, col, table)
+        if options["kind"] == "range" and options["min"] is not None:
+            low, high = float(options["min"]), float(options["max"])
+            if low < high:
+                selected = st.slider(col, low, high, (low, high), key=f"browser_filter_{col}")
+                filters[col] = ("range", *selected)
+        elif options["kind"] == "values":
+            selected = st.multiselect(col, options["values"], key=f"browser_filter_{col}")
+            if selected:
+                filters[col] = ("values", selected)
+        else:
+            text = st.text_input(f"{col} contains", key=f"browser_filter_{col}")
+            if text:
+                filters[col] = ("text", text)
+
+    sort_index = None if sort_col == "(none)" else _browser_sort_index(fingerprint, sort_col, ascending, table)
+    mask = browser.build_filter_mask(table, filters)
+    order = None if sort_index is None and mask is None else browser.build_row_order(table.num_rows, sort_index, mask)
+
+    total = table.num_rows if order is None else order.size
+    n_pages = max(1, -(-total // page_size))
+    page = st.number_input(f"Page (of {n_pages:,})", min_value=1, max_value=n_pages, value=1,
+                           step=1, key="browser_page")
+
+    result = browser.get_page(table, order, page, page_size)
+    st.caption(f"Showing rows {result['first_row']:,}–{result['last_row']:,} of {result['total_rows']:,}")
+    st.dataframe(result["data"], use_container_width=True)
+
+
+def render_data_overview_section(data, fingerprint: str = None, total_rows: int = None) -> None:
+    """Render the dataset overview section (data: DataFrame or loader)."""
     st.header("1️⃣ Dataset Overview")
     
     # Get overview metrics
-    overview = analyzer.get_dataset_overview(df)
+    overview = _analysis(fingerprint, analyzer.get_dataset_overview, data)
+    schema = _schema(fingerprint, data)
     
     # Display sample data
     st.write("### Verify Target Encoding")
     st.write("Sample of Delinquent vs Non-delinquent customers:")
     
-    target_col = analyzer.get_target_column(df)
-    delinquent_sample, non_delinquent_sample = analyzer.get_sample_by_target(df, target_col)
+    target_col = analyzer.get_target_column(schema)
+    delinquent_sample, non_delinquent_sample = _analysis(
+        fingerprint, analyzer.get_sample_by_target, data, target_col=target_col
+    )
     
     st.write("**Delinquent Customers (should have MORE missed payments, LOWER scores):**")
     st.dataframe(delinquent_sample)
@@ -32,7 +157,7 @@ def render_data_overview_section(df: pd.DataFrame) -> None:
     
     # Check means
     st.write("### Mean Comparison")
-    comparison = analyzer.get_target_comparison(df, target_col)
+    comparison = _analysis(fingerprint, analyzer.get_target_comparison, data, target_col=target_col)
     st.dataframe(comparison)
     
     # Metrics
@@ -42,25 +167,29 @@ def render_data_overview_section(df: pd.DataFrame) -> None:
     with col2:
         st.metric("Total Columns", overview["total_columns"])
     with col3:
-        st.metric("Memory Usage", overview["memory_usage_str"])
+        st.metric(overview.get("size_label", "Memory Usage"), overview["memory_usage_str"])
     
-    # Raw data preview (optional)
+    # Raw data browser (optional)
     if st.checkbox("Show raw data preview", value=False):
-        with st.expander("📋 View Raw Data"):
-            st.dataframe(df.head(20), use_container_width=True)
+        with st.expander("📋 View Raw Data", expanded=True):
+            _sample_caption(data, total_rows)
+            render_data_browser(_frame(data), fingerprint)
     
     # Column types summary
     with st.expander("📑 Column Types Summary"):
-        col_types = analyzer.get_column_types_summary(df)
+        col_types = _analysis(fingerprint, analyzer.get_column_types_summary, data)
         st.dataframe(col_types, use_container_width=True)
-        st.dataframe(df.dtypes.rename("Data Type").to_frame(), use_container_width=True)
+        st.dataframe(schema.dtypes.rename("Data Type").to_frame(), use_container_width=True)
 
 
-def render_missing_data_section(df: pd.DataFrame) -> None:
-    """Render the missing data analysis section."""
+def render_missing_data_section(data, fingerprint: str = None, total_rows: int = None) -> None:
+    """Render the missing data analysis section (total_rows = full row count when data is a sample)."""
     st.header("2️⃣ Missing Data Analysis")
     
-    missing = analyzer.analyze_missing_data(df)
+    missing = _analysis(fingerprint, analyzer.analyze_missing_data, data)
+    if total_rows is None:
+        total_rows = _analysis(fingerprint, analyzer.get_dataset_overview, data)["total_records"]
+    n_columns = len(_schema(fingerprint, data).columns)
     
     if len(missing) > 0:
         col1, col2 = st.columns([1, 1])
@@ -72,19 +201,13 @@ def render_missing_data_section(df: pd.DataFrame) -> None:
             st.info(f"""
             **Key Findings:**
             - {len(missing)} columns have missing values
-            - Total missing cells: {missing['Missing Count'].sum()} ({(missing['Missing Count'].sum() / (len(df) * len(df.columns)) * 100):.2f}% of dataset)
+            - Total missing cells: {missing['Missing Count'].sum()} ({(missing['Missing Count'].sum() / (total_rows * n_columns) * 100):.2f}% of dataset)
             """)
         
         with col2:
             st.subheader("Missing Data Visualization")
-            fig_missing, ax_missing = plt.subplots(figsize=(8, max(4, len(missing) * 0.4)))
-            sns.barplot(data=missing.reset_index(), y="index", x="Missing %", ax=ax_missing, palette="Reds_r")
-            ax_missing.set_xlabel("Missing Percentage (%)")
-            ax_missing.set_ylabel("Column")
-            ax_missing.set_title("Missing Data by Column")
-            for i, v in enumerate(missing["Missing %"].values):
-                ax_missing.text(v + 0.2, i, f"{v:.1f}%", va="center")
-            st.pyplot(fig_missing)
+            chart = Charts.missing_data_chart(chart_data.get_missing_chart_data(missing))
+            st.altair_chart(chart, use_container_width=True)
         
         # Imputation recommendations
         with st.expander("💡 Recommended Imputation Strategies"):
@@ -101,13 +224,17 @@ def render_missing_data_section(df: pd.DataFrame) -> None:
         st.success("✅ No missing values detected in the dataset!")
 
 
-def render_target_analysis_section(df: pd.DataFrame, target_col: str = None) -> str:
+def render_target_analysis_section(data, target_col: str = None,
+                                   fingerprint: str = None, push_down_target=None) -> str:
     """
     Render the target variable analysis section.
     
     Args:
-        df: Input dataframe
+        data: Input dataframe, or a loader called only when results are not stored
         target_col: Target column (if None, will be auto-detected)
+        fingerprint: Dataset content hash used to look up stored results
+        push_down_target: Optional callable taking the selected target; publishes
+            full-table target results to the store before they are read
         
     Returns:
         The selected target column
@@ -115,22 +242,27 @@ def render_target_analysis_section(df: pd.DataFrame, target_col: str = None) ->
     st.header("3️⃣ Target Variable Analysis")
     
     # Auto-detect target if not provided
+    columns = _schema(fingerprint, data).columns.tolist()
     if target_col is None:
-        target_col = analyzer.get_target_column(df)
+        target_col = analyzer.get_target_column(_schema(fingerprint, data))
     
     # Allow user to select target
     target_col = st.selectbox(
         "Select target (delinquency) column",
-        options=df.columns.tolist(),
-        index=(df.columns.tolist().index(target_col) if target_col in df.columns else 0),
+        options=columns,
+        index=(columns.index(target_col) if target_col in columns else 0),
         help="Choose the column that represents whether a customer is delinquent.",
     )
+    if push_down_target is not None:
+        push_down_target(target_col)
     
     col1, col2 = st.columns([1, 1])
     
     with col1:
         st.subheader("Target Distribution")
-        target_df, target_counts = analyzer.get_target_distribution(df, target_col)
+        target_df, target_counts = _analysis(
+            fingerprint, analyzer.get_target_distribution, data, target_col=target_col
+        )
         target_pct = (target_counts / target_counts.sum() * 100)
         
         st.dataframe(target_df.style.format({"Percentage": "{:.2f}%"}), use_container_width=True)
@@ -152,39 +284,18 @@ def render_target_analysis_section(df: pd.DataFrame, target_col: str = None) ->
     
     with col2:
         st.subheader("Target Distribution Chart")
-        fig_target, ax_target = plt.subplots(figsize=(7, 5))
-        
-        explode = [0.05 if i == target_counts.values.argmin() else 0 for i in range(len(target_counts))]
-        colors = ['#2ecc71', '#e74c3c'] if len(target_counts) == 2 else sns.color_palette("Set2", len(target_counts))
-        
-        wedges, texts, autotexts = ax_target.pie(
-            target_counts.values,
-            labels=[f'{label}\n({count:,})' for label, count in zip(target_counts.index.astype(str), target_counts.values)],
-            autopct='%1.1f%%',
-            startangle=140,
-            colors=colors,
-            explode=explode,
-            shadow=True,
-            textprops={'fontsize': 10, 'weight': 'bold'}
-        )
-        
-        for autotext in autotexts:
-            autotext.set_color('white')
-            autotext.set_fontsize(11)
-            autotext.set_weight('bold')
-        
-        ax_target.axis('equal')
-        ax_target.set_title(f"Distribution of {target_col}", fontsize=12, fontweight='bold', pad=20)
-        st.pyplot(fig_target)
+        chart = Charts.target_distribution_chart(chart_data.get_target_chart_data(target_counts), target_col)
+        st.altair_chart(chart, use_container_width=True)
     
     return target_col
 
 
-def render_correlation_analysis_section(df: pd.DataFrame, target_col: str) -> None:
+def render_correlation_analysis_section(data, target_col: str,
+                                        fingerprint: str = None, total_rows: int = None) -> None:
     """Render the correlation analysis section."""
     st.header("4️⃣ Correlation Analysis")
     
-    num_cols = analyzer.get_numeric_columns(df)
+    num_cols = analyzer.get_numeric_columns(_schema(fingerprint, data))
     
     if target_col not in num_cols:
         st.info(f"Target column '{target_col}' is not numeric. Skipping correlation analysis.")
@@ -192,7 +303,7 @@ def render_correlation_analysis_section(df: pd.DataFrame, target_col: str) -> No
     
     st.subheader(f"Feature Correlations with {target_col}")
     
-    corr = analyzer.get_correlation_with_target(df, target_col)
+    corr = _analysis(fingerprint, analyzer.get_correlation_with_target, data, target_col=target_col)
     
     col1, col2 = st.columns([1, 1])
     
@@ -212,31 +323,62 @@ def render_correlation_analysis_section(df: pd.DataFrame, target_col: str) -> No
         """)
     
     with col2:
-        fig_corr, ax_corr = plt.subplots(figsize=(6, max(4, len(corr) * 0.35)))
-        colors = ['#e74c3c' if x < 0 else '#2ecc71' for x in corr.values]
-        sns.barplot(x=corr.values, y=corr.index, ax=ax_corr, palette=colors)
-        ax_corr.set_xlabel("Correlation Coefficient")
-        ax_corr.set_title(f"Correlation with {target_col}")
-        ax_corr.axvline(x=0, color='black', linestyle='--', linewidth=0.8)
-        st.pyplot(fig_corr)
+        chart = Charts.correlation_bar_chart(chart_data.get_correlation_bar_data(corr), target_col)
+        st.altair_chart(chart, use_container_width=True)
     
     # Full correlation heatmap
     with st.expander("🔥 View Full Correlation Heatmap"):
-        fig_heatmap, ax_heatmap = plt.subplots(figsize=(12, 10))
-        corr_matrix = df[num_cols].corr()
-        sns.heatmap(corr_matrix, annot=True, fmt=".2f", cmap="coolwarm",
-                   center=0, ax=ax_heatmap, square=True, linewidths=0.5)
-        ax_heatmap.set_title("Full Correlation Matrix")
-        st.pyplot(fig_heatmap)
+        corr_matrix = _analysis(fingerprint, analyzer.get_correlation_matrix, data)
+        st.altair_chart(Charts.heatmap_chart(chart_data.get_matrix_long(corr_matrix), "Full Correlation Matrix"))
+
+    render_association_screening(data, target_col, fingerprint, total_rows)
+
+
+def render_association_screening(data, target_col: str, fingerprint: str = None,
+                                 total_rows: int = None) -> None:
+    """Render the nonlinear association screening subsection."""
+    st.subheader(f"Nonlinear Association Screening with {target_col}")
+    _sample_caption(data, total_rows)
+    st.caption(
+        "Mutual information and Cramér's V capture nonlinear relationships and include "
+        "categorical and payment history columns. Continuous columns are cut into "
+        f"{screening.DEFAULT_BINS} quantile bins."
+    )
+
+    ranking = _analysis(fingerprint, screening.screen_features, data, target_col=target_col)
+    if ranking.empty:
+        st.info("No columns available for association screening.")
+        return
+
+    st.dataframe(
+        ranking.style.format({
+            "Mutual Information (bits)": "{:.4f}",
+            "Normalized MI": "{:.4f}",
+            "Cramér's V": "{:.4f}",
+            "Correlation Ratio": "{:.4f}",
+        }, na_rep="-").background_gradient(cmap="Greens", subset=["Mutual Information (bits)"]),
+        use_container_width=True
+    )
+
+    with st.expander("📐 Correlation Ratio: Numeric Features by Categorical Columns"):
+        eta = _analysis(fingerprint, screening.get_correlation_ratio_matrix, data, target_col=target_col)
+        if eta.empty:
+            st.info("The dataset needs both numeric and categorical columns for this view.")
+        else:
+            st.dataframe(eta.style.format("{:.3f}").background_gradient(cmap="Blues", vmin=0, vmax=1),
+                         use_container_width=True)
 
 
-def render_distribution_by_target_section(df: pd.DataFrame, target_col: str) -> None:
+def render_distribution_by_target_section(data, target_col: str,
+                                          fingerprint: str = None, total_rows: int = None) -> None:
     """Render feature distributions by target section."""
     st.header("5️⃣ Feature Distributions by Target")
+    _sample_caption(data, total_rows)
     
-    num_cols = analyzer.get_numeric_columns(df)
+    num_cols = analyzer.get_numeric_columns(_schema(fingerprint, data))
+    _, target_counts = _analysis(fingerprint, analyzer.get_target_distribution, data, target_col=target_col)
     
-    if len(num_cols) == 0 or df[target_col].nunique() > 10:
+    if len(num_cols) == 0 or len(target_counts) > 10:
         st.info("Not enough numeric columns or too many target classes for this analysis.")
         return
     
@@ -251,46 +393,33 @@ def render_distribution_by_target_section(df: pd.DataFrame, target_col: str) ->
     )
     
     if selected_box:
-        n_features = len(selected_box)
-        n_cols_plot = 2
-        n_rows = (n_features + 1) // 2
-        
-        fig_box, axes = plt.subplots(n_rows, n_cols_plot, figsize=(14, 5 * n_rows))
-        axes = axes.flatten() if n_rows > 1 else [axes] if n_cols_plot == 1 else axes
-        
+        grid = st.columns(2)
         for idx, col in enumerate(selected_box):
-            ax = axes[idx]
-            df_plot = df[[target_col, col]].dropna()
-            
-            sns.boxplot(x=df_plot[target_col].astype(str), y=df_plot[col],
-                       ax=ax, palette="Set2", width=0.5)
-            sns.violinplot(x=df_plot[target_col].astype(str), y=df_plot[col],
-                          ax=ax, palette="Set2", alpha=0.3, inner=None)
-            
-            ax.set_xlabel(f"{target_col} (0=Non-delinquent, 1=Delinquent)")
-            ax.set_ylabel(col)
-            ax.set_title(f"{col} Distribution by Delinquency Status", fontweight="bold")
-            ax.grid(axis='y', alpha=0.3)
-        
-        for idx in range(n_features, len(axes)):
-            axes[idx].axis('off')
-        
-        plt.tight_layout()
-        st.pyplot(fig_box)
+            box = _analysis(fingerprint, chart_data.get_box_data, data, col=col, target_col=target_col)
+            if box["box"].empty:
+                continue
+            with grid[idx % 2]:
+                chart = Charts.box_violin_chart(box["box"], box["violin"], col, target_col)
+                st.altair_chart(chart, use_container_width=True)
         
         # Statistical summary
         with st.expander("📊 Statistical Summary by Target"):
+            _sample_caption(data, total_rows)
+            class_summary = _analysis(fingerprint, analyzer.get_class_summary, data, target_col=target_col)
             for col in selected_box:
+                if col not in class_summary:
+                    continue
                 st.markdown(f"**{col}:**")
-                summary = df.groupby(target_col)[col].describe().T
-                st.dataframe(summary.style.format("{:.2f}"), use_container_width=True)
+                st.dataframe(class_summary[col].style.format("{:.2f}"), use_container_width=True)
 
 
-def render_overall_distributions_section(df: pd.DataFrame) -> None:
+def render_overall_distributions_section(data, fingerprint: str = None,
+                                         total_rows: int = None) -> None:
     """Render overall feature distributions section."""
     st.header("6️⃣ Overall Feature Distributions")
+    _sample_caption(data, total_rows)
     
-    num_cols = analyzer.get_numeric_columns(df)
+    num_cols = analyzer.get_numeric_columns(_schema(fingerprint, data))
     
     if not num_cols:
         st.info("No numeric columns found.")
@@ -304,39 +433,185 @@ def render_overall_distributions_section(df: pd.DataFrame) -> None:
     )
     
     if selected_num:
-        n_features = len(selected_num)
-        n_cols_plot = 3
-        n_rows_plot = (n_features + n_cols_plot - 1) // n_cols_plot
-        
-        fig, axes = plt.subplots(n_rows_plot, n_cols_plot,
-                                figsize=(15, 4 * n_rows_plot))
-        axes = axes.flatten() if n_rows_plot > 1 else [axes] if n_cols_plot == 1 else axes
-        
+        grid = st.columns(3)
         for idx, col in enumerate(selected_num):
-            ax = axes[idx]
-            data = df[col].dropna()
-            
-            sns.histplot(data, kde=True, ax=ax, color="#3498db", alpha=0.6)
-            
-            mean_val = data.mean()
-            median_val = data.median()
-            ax.axvline(mean_val, color='red', linestyle='--', linewidth=2, label=f'Mean: {mean_val:.2f}')
-            ax.axvline(median_val, color='green', linestyle='--', linewidth=2, label=f'Median: {median_val:.2f}')
-            
-            ax.set_title(f"{col} Distribution", fontweight="bold")
-            ax.legend()
-            ax.grid(axis='y', alpha=0.3)
+            hist = _analysis(fingerprint, chart_data.get_histogram_data, data, col=col)
+            with grid[idx % 3]:
+                st.altair_chart(Charts.histogram_chart(hist, col), use_container_width=True)
         
-        for idx in range(n_features, len(axes)):
-            axes[idx].axis('off')
-        
-        plt.tight_layout()
-        st.pyplot(fig)
+        with st.expander("📊 Summary Statistics"):
+            summary = _analysis(fingerprint, analyzer.get_distribution_summary, data)
+            st.dataframe(summary.loc[selected_num].style.format("{:.2f}"), use_container_width=True)
+
+
+def render_cube_section(data, target_col: str, fingerprint: str = None,
+                        total_rows: int = None) -> None:
+    """Render the slice-and-dice delinquency rate explorer backed by the aggregate cube."""
+    st.header("7️⃣ Delinquency Rate Explorer")
+    _sample_caption(data, total_rows)
+    
+    if not pd.api.types.is_numeric_dtype(_schema(fingerprint, data)[target_col]):
+        st.info(f"Target column '{target_col}' is not numeric. Skipping the rate explorer.")
+        return
+    
+    try:
+        agg_cube = _analysis(fingerprint, cube.build_cube, data, target_col=target_col)
+    except ValueError as exc:
+        st.info(str(exc))
+        return
+    
+    dimensions = agg_cube["dimensions"]
+    group_by = st.multiselect(
+        "Group by",
+        dimensions,
+        default=dimensions[:1],
+        help="Roll up the pre-aggregated cube along the selected dimensions",
+    )
+    
+    filters = {}
+    with st.expander("🔎 Filters"):
+        filter_cols = st.columns(len(dimensions))
+        for col, dim in zip(filter_cols, dimensions):
+            with col:
+                selected = st.multiselect(dim, agg_cube["labels"][dim], key=f"cube_filter_{dim}")
+                if selected:
+                    filters[dim] = selected
+    
+    result = cube.query_cube(agg_cube, group_by, filters)
+    if result.empty:
+        st.info("No customers match the selected filters.")
+        return
+    
+    formats = {c: "{:,.2f}" for c in result.columns}
+    formats.update({"Customers": "{:,.0f}", "Delinquent": "{:,.0f}", "Delinquency Rate %": "{:.2f}%"})
+    st.dataframe(
+        result.style.format(formats).background_gradient(cmap="Reds", subset=["Delinquency Rate %"]),
+        use_container_width=True
+    )
+
+
+def render_customer_lookup_section(data, fingerprint: str = None, total_rows: int = None) -> None:
+    """
+    Render point and bulk customer lookup by Customer_ID (unavailable when data is a sample).
+
+    The rows are only loaded and indexed once a lookup is requested.
+    """
+    st.header("8️⃣ Customer Lookup")
+    
+    if _is_sample(data, total_rows):
+        st.info(
+            f"Customer lookup needs every row, but only a sample of {len(_frame(data)):,} of "
+            f"{total_rows:,} rows is loaded. Load the full dataset to look up customers."
+        )
+        return
+    
+    if lookup.ID_COL not in _schema(fingerprint, data).columns:
+        st.info(f"No '{lookup.ID_COL}' column found. Customer lookup is unavailable.")
+        return
+    
+    def load_index() -> tuple:
+        df = _frame(data)
+        key = fingerprint if fingerprint is not None else result_store.fingerprint_dataframe(df)
+        return df, _customer_index(key, df)
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.subheader("Single Customer")
+        customer_id = st.text_input("Customer ID", placeholder="e.g. CUST0001", key="lookup_customer_id")
+        if customer_id:
+            df, customer_index = load_index()
+            customer = lookup.lookup_customer(df, customer_index, customer_id.strip())
+            if customer is None:
+                st.warning(f"Customer '{customer_id}' not found.")
+            else:
+                for name, value in customer["scores"].items():
+                    st.metric(name.replace("_", " "), value)
+                st.write("**Payment History:**")
+                st.dataframe(customer["payment_history"].rename("Status").to_frame().T, use_container_width=True)
+                st.write("**Features:**")
+                st.dataframe(customer["features"].astype(str).rename("Value").to_frame(), use_container_width=True)
+    
+    with col2:
+        st.subheader("Bulk Lookup")
+        id_file = st.file_uploader(
+            "Upload a list of Customer IDs",
+            type=["csv", "txt", "xlsx"],
+            help="CSV/Excel with a Customer_ID column, or a text file with one ID per line",
+            key="lookup_id_file",
+        )
+        if id_file is not None:
+            try:
+                ids = lookup.read_id_list(id_file)
+            except ValueError as exc:
+                st.error(str(exc))
+                return
+            df, customer_index = load_index()
+            found, missing = lookup.bulk_lookup(df, customer_index, ids)
+            st.write(f"Found **{len(found):,}** of {len(ids):,} customers.")
+            if missing:
+                st.warning(f"{len(missing):,} IDs not found: {', '.join(missing[:10])}{' ...' if len(missing) > 10 else ''}")
+            st.dataframe(found, use_container_width=True)
+            st.download_button(
+                "Download results",
+                found.to_csv(index=False).encode(),
+                file_name="customer_lookup.csv",
+                mime="text/csv",
+            )
+
+
+def render_outlier_section(data, target_col: str, fingerprint: str = None,
+                           total_rows: int = None) -> None:
+    """Render the outlier and anomaly detection section."""
+    st.header("9️⃣ Outliers & Anomalies")
+    _sample_caption(data, total_rows)
+    
+    if fingerprint is None:
+        fingerprint = result_store.fingerprint_dataframe(_frame(data))
+    result = _outlier_results(fingerprint, target_col, data)
+    summary = result["summary"]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Rows Checked", f"{result['n_rows']:,}")
+    with col2:
+        st.metric("Rows Flagged", f"{result['n_flagged']:,}")
+    with col3:
+        st.metric("Flagged %", f"{result['n_flagged'] / max(result['n_rows'], 1) * 100:.2f}%")
+    
+    flagged = summary[summary["Flagged Rows"] > 0]
+    if flagged.empty:
+        st.success("✅ No outliers or rule violations detected!")
+        return
+    
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.subheader("Flagged Rows by Check")
+        st.dataframe(flagged.style.format({"Flagged %": "{:.2f}%"}), use_container_width=True)
+        st.caption(
+            f"IQR fences use {outliers.IQR_MULTIPLIER} × IQR; robust z-scores use "
+            f"|x − median| / (1.4826 × MAD) > {outliers.ROBUST_Z_THRESHOLD}."
+        )
+    
+    with col2:
+        st.altair_chart(Charts.flagged_checks_chart(flagged), use_container_width=True)
+    
+    with st.expander("📐 Outlier Thresholds by Column"):
+        st.dataframe(result["stats"].style.format("{:.3f}"), use_container_width=True)
+    
+    # Showing rows needs the data itself, so it is opt-in like the raw data preview
+    if st.checkbox("Show flagged rows (first 100)", value=False, key="outlier_show_rows"):
+        rows = np.flatnonzero(result["flags"].any(axis=1))[:100]
+        sample = _frame(data).iloc[rows].copy()
+        reasons = outliers.decode_flags(result["flags"][rows], result["checks"])
+        sample.insert(0, "Flags", [", ".join(names) for names in reasons])
+        st.dataframe(sample, use_container_width=True)
 
 
 def render_key_insights_section() -> None:
     """Render key insights and recommendations section."""
-    st.header("7️⃣ Key Insights & Recommendations")
+    st.header("🔟 Key Insights & Recommendations")
     
     col1, col2 = st.columns(2)
     
@@ -382,12 +657,21 @@ def render_key_insights_section() -> None:
     """)
 
 
-def render_eda_app(df: pd.DataFrame) -> None:
+def render_eda_app(data, fingerprint: str = None, total_rows: int = None, push_down_target=None) -> None:
     """
     Render the complete EDA application.
     
     Args:
-        df: Input dataframe to analyze
+        data: Input dataframe to analyze, or a zero-argument loader. A loader
+            is only called when some result is not in the store, so a warm
+            start with a known fingerprint never parses the file. Loader
+            ValueErrors are shown as errors.
+        fingerprint: Dataset content hash; when given, analysis results are
+            read from and written to the persistent result store
+        total_rows: Row count of the full source when data is only a sample
+            (e.g. a SQL table); row-level sections are then labelled as sampled
+        push_down_target: Optional callable that publishes full-table target
+            results for a user-selected target (e.g. SQL pushdown)
     """
     st.title("🏦 Delinquency Prediction – Exploratory Data Analysis")
     st.markdown("""
@@ -395,11 +679,21 @@ def render_eda_app(df: pd.DataFrame) -> None:
     The analysis focuses on data quality, target imbalance, and key risk indicators.
     """)
     
+    data = _loader(data)
+    try:
+        _schema(fingerprint, data)  # the first result a cold start computes, so load errors surface here
+    except ValueError as exc:
+        st.error(str(exc))
+        return
+    
     # Render all sections
-    render_data_overview_section(df)
-    render_missing_data_section(df)
-    target_col = render_target_analysis_section(df)
-    render_correlation_analysis_section(df, target_col)
-    render_distribution_by_target_section(df, target_col)
-    render_overall_distributions_section(df)
+    render_data_overview_section(data, fingerprint, total_rows)
+    render_missing_data_section(data, fingerprint, total_rows)
+    target_col = render_target_analysis_section(data, fingerprint=fingerprint, push_down_target=push_down_target)
+    render_correlation_analysis_section(data, target_col, fingerprint, total_rows)
+    render_distribution_by_target_section(data, target_col, fingerprint, total_rows)
+    render_overall_distributions_section(data, fingerprint, total_rows)
+    render_cube_section(data, target_col, fingerprint, total_rows)
+    render_customer_lookup_section(data, fingerprint, total_rows)
+    render_outlier_section(data, target_col, fingerprint, total_rows)
     render_key_insights_section()